@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Ant Design Widget
+
+组件、样式和国际化在第一次访问时才导入，`import adw` 不会加载 Qt:
+
+    import adw
+    button = adw.Button(text="确定", type="primary")
+
+性能统计见 adw.perf。
+"""
+
+from adw.common.lazy import lazy_exports
+
+__version__ = "0.1.0"
+
+__getattr__, __dir__ = lazy_exports(__name__, globals(), {
+    ".components": (
+        "Button",
+        "Divider",
+        "Row",
+        "Col",
+        "GridLayout",
+        "VirtualGrid",
+        "LayoutBuilder",
+        "build_layout"
+    ),
+    ".styles.theme": (
+        "ThemeManager",
+        "set_theme",
+        "get_theme",
+        "apply_theme_to_widget"
+    ),
+    ".styles.colors": ("ThemeType",),
+    ".i18n.manager": ("I18nManager", "tr", "set_locale", "get_locale"),
+    ".common.warmup": ("warmup", "WarmupTask"),
+}, submodules=("components", "styles", "i18n", "common", "perf"))
+
+__all__ = [
+    '__version__',
+    'Button',
+    'Divider',
+    'Row',
+    'Col',
+    'GridLayout',
+    'VirtualGrid',
+    'LayoutBuilder',
+    'build_layout',
+    'ThemeManager',
+    'ThemeType',
+    'set_theme',
+    'get_theme',
+    'apply_theme_to_widget',
+    'I18nManager',
+    'tr',
+    'set_locale',
+    'get_locale',
+    'warmup',
+    'WarmupTask'
+]
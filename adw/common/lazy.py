@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+延迟导出
+
+包的 __init__ 只声明导出的名称来自哪个模块，名称在第一次访问时才导入对应模块并缓存为包属性:
+
+    __getattr__, __dir__ = lazy_exports(__name__, globals(), {
+        ".colors": ("ColorPalette", "set_theme"),
+        ".theme": ("ThemeManager", "set_theme as set_global_theme"),
+    })
+
+"名称 as 别名" 以别名导出；声明的子包 (submodules) 在访问时导入。
+"""
+
+from __future__ import annotations
+
+import sys
+
+# typing 的导入开销比整个 import adw 还大，只在类型检查时导入
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Callable, Dict, Iterable, List, Tuple
+
+
+def lazy_exports(
+    package: str,
+    namespace: dict,
+    exports: Dict[str, Iterable[str]],
+    submodules: Iterable[str] = ()
+) -> Tuple[Callable[[str], object], Callable[[], List[str]]]:
+    """
+    生成包的 __getattr__ 和 __dir__
+
+    Args:
+        package: 包名 (__name__)
+        namespace: 包的 globals()，解析后的名称缓存在这里
+        exports: {模块 (可以是相对包的 ".模块"): 导出的名称}
+        submodules: 访问时导入的子包或子模块名称
+
+    Returns:
+        (__getattr__, __dir__)
+    """
+    # 导出名称 -> (模块, 模块中的名称)
+    targets: Dict[str, Tuple[str, str]] = {}
+    for module, names in exports.items():
+        for name in names:
+            source, _, alias = name.partition(" as ")
+            targets[alias or source] = (module, source)
+    submodules = tuple(submodules)
+
+    def load(module: str):
+        # 使用 __import__ 而不是 importlib.import_module，延迟导入才会出现在 -X importtime 的统计中
+        if module.startswith("."):
+            module = package + module
+        __import__(module)
+        return sys.modules[module]
+
+    def __getattr__(name: str):
+        target = targets.get(name)
+        if target is not None:
+            module, source = target
+            value = getattr(load(module), source)
+        elif name in submodules:
+            value = load(f".{name}")
+        else:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        namespace[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(namespace) | set(targets) | set(submodules))
+
+    return __getattr__, __dir__
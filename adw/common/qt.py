@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Qt 绑定
+
+第一次导入时确定使用 PySide6 还是 PyQt6 (可以通过环境变量 ADW_QT_API 指定)，各模块统一从这里导入
+Qt 的类和枚举:
+
+    from adw.common.qt import Qt, QWidget, Signal
+
+名称在第一次访问时从 QtCore、QtGui、QtWidgets、QtSvg 中解析并缓存为模块属性，之后的访问与普通
+模块属性相同；只用到 QtCore 的模块不会加载 QtWidgets。两个绑定中名称不同的对象 (Signal、Slot、
+Property) 统一为 PySide6 的名称。
+"""
+
+import importlib
+import os
+
+# 按优先级排列的绑定
+BINDINGS = ("PySide6", "PyQt6")
+
+# 按顺序查找名称的子模块
+SUBMODULES = ("QtCore", "QtGui", "QtWidgets", "QtSvg")
+
+# PyQt6 中名称不同的对象
+_PYQT_ALIASES = {
+    "Signal": "pyqtSignal",
+    "Slot": "pyqtSlot",
+    "Property": "pyqtProperty",
+}
+
+
+def _select_binding() -> str:
+    """确定使用的绑定"""
+    requested = os.environ.get("ADW_QT_API")
+    for name in (requested,) if requested else BINDINGS:
+        try:
+            importlib.import_module(name + ".QtCore")
+        except ImportError:
+            continue
+        return name
+    raise ImportError("Requires either PySide6 or PyQt6")
+
+
+# 使用的绑定名称
+API = _select_binding()
+
+
+def get_submodule(name: str):
+    """获取绑定的子模块，例如 get_submodule("QtWidgets")"""
+    module = globals().get(name)
+    if module is None:
+        module = globals()[name] = importlib.import_module(f"{API}.{name}")
+    return module
+
+
+def __getattr__(name: str):
+    """第一次访问时解析 Qt 名称并缓存"""
+    if name.startswith("__"):
+        # from ... import 会查询 __path__ 等属性，不能因此加载所有子模块
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    if name in SUBMODULES:
+        return get_submodule(name)
+    target = _PYQT_ALIASES.get(name, name) if API == "PyQt6" else name
+    for submodule in SUBMODULES:
+        module = get_submodule(submodule)
+        value = getattr(module, target, None)
+        if value is not None:
+            globals()[name] = value
+            return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,315 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+启动预热
+
+组件第一次出现时需要生成样式表、解析颜色、解析字体并初始化 Qt 的样式表样式，这些开销通常落在
+用户的第一次交互上。warmup() 在启动时提前完成这些工作:
+
+1. 工作线程: 生成各组件所有变体的样式表并保存为样式包 (见 adw.styles.cache，之后启动时直接读取)、
+   解析当前主题的颜色令牌 (只读取样式系统，不创建 QWidget)
+2. 主线程空闲时: 解析排版系统用到的字体、为每种组件创建并 polish 一个隐藏实例、请求图标，
+   每个事件循环周期只占用 budget_ms 毫秒
+
+    import adw
+    adw.warmup(theme=adw.ThemeType.DARK, components=["button"], icons=["search"])
+"""
+
+import importlib
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Tuple, Type
+from adw.styles.colors import ColorPalette, ThemeType
+from adw.styles.theme import ThemeManager
+from adw.styles.cache import StyleCache
+from adw.styles.typography import Typography, TypographyScale, FontFamily
+from adw.common.qt import (
+    QObject, QRunnable, QThreadPool, QTimer, QGuiApplication, Signal, QFont, QFontMetrics
+)
+
+
+# 可以预热的组件 {名称: (模块, 类名)}，组件类提供 get_style_variants() 和 build_style_sheet()
+_components: Dict[str, Tuple[str, str]] = {
+    "button": ("adw.components.widgets.button", "Button"),
+    "divider": ("adw.components.widgets.divider", "Divider"),
+}
+
+# 未完成的预热任务，保证调用方不保存返回值时任务也能完成
+_active_tasks = set()
+
+# 按钮各尺寸相对正文字号的偏移 (与 Button._update_size 一致)
+_BUTTON_FONT_OFFSETS = (-2, 0, 2)
+
+
+def register_component(name: str, component: Type):
+    """
+    注册可以预热的组件
+
+    Args:
+        name: 组件名称 (warmup 的 components 参数)
+        component: 组件类，提供 get_style_variants() 与 build_style_sheet(*variant) 类方法
+    """
+    _components[name] = (component.__module__, component.__name__)
+
+
+def get_component_names() -> List[str]:
+    """获取可以预热的组件名称"""
+    return list(_components)
+
+
+def _load_component(name: str) -> Type:
+    """导入组件类"""
+    module, class_name = _components[name]
+    return getattr(importlib.import_module(module), class_name)
+
+
+def _font_families(family: str) -> List[str]:
+    """把 CSS 字体列表拆分为字体名称"""
+    return [item.strip().strip("'\"") for item in family.split(",") if item.strip()]
+
+
+class _Dispatcher(QObject):
+    """把工作线程的完成通知转发到主线程"""
+
+    done = Signal()
+
+
+class _WorkerTask(QRunnable):
+    """在线程池中执行预热的纯 Python 部分"""
+
+    def __init__(self, task: "WarmupTask"):
+        super().__init__()
+        self._task = task
+
+    def run(self):
+        try:
+            self._task._run_worker()
+        finally:
+            self._task._worker_done.set()
+            self._task._dispatcher.done.emit()
+
+
+class WarmupTask(QObject):
+    """
+    预热任务
+
+    由 warmup() 创建并启动。工作线程部分完成后，主线程部分在之后的事件循环周期中按时间预算分批执行；
+    wait() 可以同步完成剩余的工作。
+    """
+
+    # 预热完成信号
+    finished = Signal()
+
+    def __init__(
+        self,
+        components: Iterable[str],
+        icons: Iterable[str] = (),
+        budget_ms: float = 8.0,
+        parent: Optional[QObject] = None
+    ):
+        """
+        初始化预热任务
+
+        Args:
+            components: 组件名称 (见 get_component_names())
+            icons: 需要预先光栅化的图标名称
+            budget_ms: 主线程每个事件循环周期内的时间预算 (毫秒)
+            parent: 父级对象
+        """
+        super().__init__(parent)
+
+        components = list(components)
+        unknown = [name for name in components if name not in _components]
+        if unknown:
+            raise ValueError(f"Unknown components: {', '.join(unknown)}")
+
+        # 存储属性
+        self._components = components
+        self._icons = list(icons)
+        self._budget = budget_ms / 1000
+        self._theme: Optional[ThemeType] = None
+        self._classes: List[Type] = []
+
+        self._dispatcher = _Dispatcher()
+        self._dispatcher.done.connect(self._on_worker_done)
+        self._worker_done = threading.Event()
+        self._steps = None
+        self._running = False
+        self._finished = False
+        self._stats = {
+            'style_sheets': 0,
+            'generated': 0,
+            'bundle': None,
+            'colors': 0,
+            'fonts': 0,
+            'widgets': 0,
+            'icons': 0,
+            'worker_ms': 0.0,
+            'gui_ms': 0.0,
+        }
+
+    def start(self):
+        """启动预热，立即返回"""
+        if self._running or self._finished:
+            return
+        self._running = True
+        self._theme = ColorPalette.get_theme()
+        # 组件模块在主线程中导入
+        self._classes = [_load_component(name) for name in self._components]
+        _active_tasks.add(self)
+        QThreadPool.globalInstance().start(_WorkerTask(self))
+
+    def wait(self):
+        """等待工作线程部分完成，并同步执行剩余的主线程部分"""
+        if not self._running:
+            return
+        self._worker_done.wait()
+        self._on_worker_done()
+        while self._step():
+            pass
+        self._finish()
+
+    def is_running(self) -> bool:
+        """是否正在预热"""
+        return self._running
+
+    def is_finished(self) -> bool:
+        """是否已经完成"""
+        return self._finished
+
+    def get_stats(self) -> dict:
+        """获取统计 (预热的样式表、其中新生成的样式表、保存的样式包、颜色、字体、组件、图标数量及两部分的耗时)"""
+        return dict(self._stats)
+
+    def _run_worker(self):
+        """工作线程: 生成样式表并解析颜色令牌"""
+        from adw.styles.icons.manager import parse_color
+
+        start = time.perf_counter()
+        # 第一次查询时读取上次保存的样式包，之后的样式表都命中缓存
+        misses = StyleCache.get_counters()['misses']
+        for component in self._classes:
+            for variant in component.get_style_variants():
+                # 预热期间切换了主题时放弃，避免缓存按旧主题计算的结果
+                if ColorPalette.get_theme() != self._theme:
+                    return
+                component.build_style_sheet(*variant)
+                self._stats['style_sheets'] += 1
+        ThemeManager.build_style_sheet()
+        self._stats['generated'] = StyleCache.get_counters()['misses'] - misses
+        # 有新生成的样式表时保存样式包，下次启动直接读取
+        self._stats['bundle'] = StyleCache.save()
+
+        tokens = [value for key, value in StyleCache.get_tokens().items() if key.endswith("_color")]
+        tokens += [color for colors in ColorPalette.get_all_colors().values() for color in colors]
+        for token in tokens:
+            parse_color(token)
+        self._stats['colors'] = len(tokens)
+        self._stats['worker_ms'] = (time.perf_counter() - start) * 1000
+
+    def _on_worker_done(self):
+        """工作线程完成，开始分批执行主线程部分"""
+        if self._steps is not None or not self._running:
+            return
+        self._steps = self._iter_gui_steps()
+        QTimer.singleShot(0, self._run_chunk)
+
+    def _iter_gui_steps(self):
+        """主线程部分，每一步完成一项工作"""
+        # 字体: 解析排版系统和按钮尺寸用到的字号，之后创建相同字体时命中 Qt 的字体缓存
+        sizes = set()
+        for scale in TypographyScale:
+            scale_settings = Typography.get_font_settings(scale)
+            sizes.add((scale_settings.size, scale_settings.weight))
+        body_size = Typography.get_body_font().size
+        sizes.update((body_size + offset, 400) for offset in _BUTTON_FONT_OFFSETS)
+        families = _font_families(FontFamily.DEFAULT)
+        for size, weight in sorted(sizes):
+            font = QFont()
+            font.setFamilies(families)
+            font.setPointSize(size)
+            font.setWeight(QFont.Weight(weight))
+            QFontMetrics(font).height()
+            self._stats['fonts'] += 1
+            yield
+
+        # 组件: 创建并 polish 一个隐藏实例，初始化 Qt 的样式表样式
+        for component in self._classes:
+            widget = component()
+            widget.ensurePolished()
+            widget.sizeHint()
+            widget.deleteLater()
+            self._stats['widgets'] += 1
+            yield
+
+        # 图标: 按按钮的尺寸和文字颜色请求，光栅化在 IconManager 的线程池中进行
+        if self._icons:
+            from adw.styles.icons.manager import IconManager
+            screen = QGuiApplication.primaryScreen()
+            ratio = screen.devicePixelRatio() if screen is not None else 1.0
+            color = ColorPalette.get_text_color()
+            for icon in self._icons:
+                for size in (12, 14, 16):
+                    IconManager.request_pixmap(icon, size, color, ratio)
+                self._stats['icons'] += 1
+                yield
+
+    def _step(self) -> bool:
+        """执行一步主线程工作，全部完成时返回 False"""
+        if self._steps is None:
+            return False
+        start = time.perf_counter()
+        try:
+            next(self._steps)
+            return True
+        except StopIteration:
+            self._steps = None
+            return False
+        finally:
+            self._stats['gui_ms'] += (time.perf_counter() - start) * 1000
+
+    def _run_chunk(self):
+        """在时间预算内执行一批主线程工作"""
+        if not self._running:
+            return
+        deadline = time.perf_counter() + self._budget
+        while self._step():
+            if time.perf_counter() >= deadline:
+                QTimer.singleShot(0, self._run_chunk)
+                return
+        self._finish()
+
+    def _finish(self):
+        """完成预热"""
+        if self._running:
+            self._running = False
+            self._finished = True
+            _active_tasks.discard(self)
+            self.finished.emit()
+
+
+def warmup(
+    theme: Optional[ThemeType] = None,
+    components: Optional[Iterable[str]] = None,
+    icons: Iterable[str] = (),
+    budget_ms: float = 8.0
+) -> WarmupTask:
+    """
+    在启动时预热样式、字体和颜色
+
+    需要在创建 QApplication 之后调用，立即返回；工作线程部分完成后，主线程部分在空闲时分批执行。
+
+    Args:
+        theme: 主题，指定时先切换到该主题，默认为当前主题
+        components: 预热的组件名称，默认为所有组件 (见 get_component_names())
+        icons: 需要预先光栅化的图标名称
+        budget_ms: 主线程每个事件循环周期内的时间预算 (毫秒)
+
+    Returns:
+        已启动的预热任务
+    """
+    if theme is not None:
+        ThemeManager.set_theme(theme)
+    task = WarmupTask(get_component_names() if components is None else components, icons, budget_ms)
+    task.start()
+    return task
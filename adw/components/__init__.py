@@ -0,0 +1,47 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Ant Design 组件
+
+组件在第一次访问时才导入，导入 adw.components 本身不会加载 Qt:
+
+    from adw.components import Button, Row, Col
+"""
+
+from adw.common.lazy import lazy_exports
+
+__getattr__, __dir__ = lazy_exports(__name__, globals(), {
+    ".widgets.button": ("Button",),
+    ".widgets.divider": ("Divider",),
+    ".layout.grid": ("Row", "Col"),
+    ".layout.grid_layout": ("GridLayout", "ResizePolicy", "flush_layouts"),
+    ".layout.virtual_grid": ("VirtualGrid",),
+    ".layout.builder": (
+        "LayoutBuilder",
+        "IncrementalBuilder",
+        "build_layout",
+        "register_widget_type"
+    ),
+    ".layout.freeze": ("freeze_widget", "unfreeze_widget", "is_frozen"),
+}, submodules=("layout", "widgets"))
+
+__all__ = [
+    # Widgets
+    'Button',
+    'Divider',
+
+    # Layout
+    'Row',
+    'Col',
+    'GridLayout',
+    'ResizePolicy',
+    'flush_layouts',
+    'VirtualGrid',
+    'LayoutBuilder',
+    'IncrementalBuilder',
+    'build_layout',
+    'register_widget_type',
+    'freeze_widget',
+    'unfreeze_widget',
+    'is_frozen'
+]
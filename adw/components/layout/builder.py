@@ -0,0 +1,425 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Ant Design 风格的声明式布局构建器
+
+根据嵌套的 dict、JSON 或 dataclass 描述一次性或分时构建 Row/Col 组件树
+"""
+
+import json
+import time
+from dataclasses import dataclass, field, fields, is_dataclass
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+from adw.components.layout.grid import Row, Col
+from adw.components.layout.grid_layout import flush_layouts
+from adw.components.widgets.button import Button
+from adw.components.widgets.divider import Divider
+from adw.common.qt import QWidget, QLabel, QLineEdit, QVBoxLayout, QObject, QTimer, Signal
+
+
+# 组件工厂: (父组件, **属性) -> 组件
+WidgetFactory = Callable[..., QWidget]
+
+# Row 和 Col 的描述字段
+_ROW_FIELDS = ('align', 'gutter', 'justify', 'wrap')
+_COL_FIELDS = (
+    'span', 'offset', 'pull', 'push', 'order', 'flex',
+    'xs', 'sm', 'md', 'lg', 'xl', 'xxl'
+)
+
+
+@dataclass
+class WidgetSpec:
+    """组件描述"""
+    component: str
+    props: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class ColSpec:
+    """列描述，container 为 True 时创建 Col 容器，否则使用轻量列"""
+    widget: Any = None
+    span: int = 0
+    offset: int = 0
+    pull: int = 0
+    push: int = 0
+    order: int = 0
+    flex: Optional[Union[str, int]] = None
+    xs: Optional[Union[int, Dict[str, Any]]] = None
+    sm: Optional[Union[int, Dict[str, Any]]] = None
+    md: Optional[Union[int, Dict[str, Any]]] = None
+    lg: Optional[Union[int, Dict[str, Any]]] = None
+    xl: Optional[Union[int, Dict[str, Any]]] = None
+    xxl: Optional[Union[int, Dict[str, Any]]] = None
+    container: bool = False
+
+
+@dataclass
+class RowSpec:
+    """行描述"""
+    cols: List[Any] = field(default_factory=list)
+    align: str = "top"
+    gutter: Union[int, Dict[str, int], List[int]] = 0
+    justify: str = "start"
+    wrap: bool = True
+
+
+class LayoutBuilder:
+    """
+    布局构建器
+
+    描述格式:
+        行: {"component": "row", "gutter": 16, "cols": [列, ...]}，包含 cols 时可省略 component
+        列: {"span": 6, "widget": 组件}，"container": true 时创建 Col 容器
+        组件: {"component": "button", "text": "OK"}、行描述、字符串 (标签文本) 或 QWidget 实例
+        列表: 多个行或组件自上而下排列
+    """
+
+    # 组件类型注册表
+    _factories: Dict[str, WidgetFactory] = {
+        'button': lambda parent, **props: Button(parent=parent, **props),
+        'divider': lambda parent, **props: Divider(parent=parent, **props),
+        'label': lambda parent, text="", **props: QLabel(text, parent),
+        'input': lambda parent, text="", placeholder="", **props: _create_input(parent, text, placeholder),
+    }
+
+    @classmethod
+    def register(cls, type_name: str, factory: WidgetFactory):
+        """
+        注册组件类型
+
+        Args:
+            type_name: 描述中使用的类型名称
+            factory: 组件工厂，参数为父组件和描述中的其余属性
+        """
+        cls._factories[type_name] = factory
+
+    @classmethod
+    def get_types(cls) -> List[str]:
+        """获取已注册的组件类型"""
+        return list(cls._factories)
+
+    @classmethod
+    def build(cls, spec: Any, parent: Optional[QWidget] = None) -> QWidget:
+        """
+        根据描述构建组件树
+
+        组件创建时即指定父组件，构建期间暂停父组件的重绘，每个 Row 的列批量加入，
+        所有组件创建完成后统一执行一次布局计算。
+
+        Args:
+            spec: dict、JSON 字符串、dataclass 或它们的列表
+            parent: 父级组件
+
+        Returns:
+            构建出的根组件
+        """
+        if isinstance(spec, str):
+            spec = json.loads(spec)
+
+        # 未显示的新组件树不会重绘，只需暂停已有父组件的重绘
+        updates_enabled = parent is not None and parent.updatesEnabled()
+        if updates_enabled:
+            parent.setUpdatesEnabled(False)
+        try:
+            root = _run_steps(cls._iter_node(spec, parent))
+            flush_layouts()
+            if root.layout() is not None:
+                root.layout().activate()
+        finally:
+            if updates_enabled:
+                parent.setUpdatesEnabled(True)
+        return root
+
+    @classmethod
+    def _normalize(cls, spec: Any) -> Any:
+        """将 dataclass 描述转换为 dict (只转换一层，嵌套描述在构建时再转换)"""
+        if is_dataclass(spec) and not isinstance(spec, type):
+            values = {item.name: getattr(spec, item.name) for item in fields(spec)}
+            if isinstance(spec, WidgetSpec):
+                return {'component': values['component'], **values['props']}
+            if isinstance(spec, RowSpec):
+                values['component'] = 'row'
+            return values
+        return spec
+
+    @classmethod
+    def _iter_node(cls, spec: Any, parent: Optional[QWidget]) -> Iterator[QWidget]:
+        """
+        逐个创建节点中的组件
+
+        每创建一个组件产出一次，便于分时构建；生成器的返回值为节点的根组件
+        """
+        spec = cls._normalize(spec)
+        if isinstance(spec, QWidget):
+            if parent is not None:
+                spec.setParent(parent)
+            return spec
+        if isinstance(spec, str):
+            label = QLabel(spec, parent)
+            yield label
+            return label
+        if isinstance(spec, (list, tuple)):
+            return (yield from cls._iter_stack(spec, parent))
+        if not isinstance(spec, dict):
+            raise ValueError(f"Unsupported layout spec: {spec!r}")
+
+        props = dict(spec)
+        type_name = props.pop('component', 'row' if 'cols' in props else None)
+        if type_name == 'row':
+            return (yield from cls._iter_row(props, parent))
+        factory = cls._factories.get(type_name)
+        if factory is None:
+            raise ValueError(f"Unknown component type: {type_name!r}")
+        widget = factory(parent, **props)
+        yield widget
+        return widget
+
+    @classmethod
+    def _iter_stack(cls, specs: List[Any], parent: Optional[QWidget]) -> Iterator[QWidget]:
+        """逐个创建自上而下排列的多个节点"""
+        container = _create_stack(parent)
+        yield container
+        for spec in specs:
+            container.layout().addWidget((yield from cls._iter_node(spec, container)))
+        return container
+
+    @classmethod
+    def _iter_row(cls, props: Dict[str, Any], parent: Optional[QWidget]) -> Iterator[QWidget]:
+        """逐个创建行及其所有列，列在全部创建后批量加入"""
+        row = Row(parent=parent, **{key: props[key] for key in _ROW_FIELDS if key in props})
+        yield row
+        cols = []
+        for col_spec in props.get('cols', []):
+            col_spec = cls._normalize(col_spec)
+            if not isinstance(col_spec, dict):
+                # 直接给出组件时按内容宽度排列
+                cols.append((yield from cls._iter_node(col_spec, row)))
+                continue
+            grid_props = {key: col_spec[key] for key in _COL_FIELDS if col_spec.get(key) is not None}
+            widget_spec = col_spec.get('widget')
+            if col_spec.get('container'):
+                col = Col(parent=row, **grid_props)
+                yield col
+                if widget_spec is not None:
+                    col.set_widget((yield from cls._iter_node(widget_spec, col)))
+                cols.append(col)
+            elif widget_spec is not None:
+                cols.append(((yield from cls._iter_node(widget_spec, row)), grid_props))
+            else:
+                widget = QWidget(row)
+                yield widget
+                cols.append((widget, grid_props))
+        row.add_cols(cols)
+        return row
+
+    @classmethod
+    def count(cls, spec: Any) -> int:
+        """统计描述中需要创建的组件数量 (与 build 相同，顶层的字符串按 JSON 解析)"""
+        if isinstance(spec, str):
+            spec = json.loads(spec)
+        return cls._count(spec)
+
+    @classmethod
+    def _count(cls, spec: Any) -> int:
+        """递归统计节点中的组件数量，嵌套的字符串是标签文本"""
+        spec = cls._normalize(spec)
+        if isinstance(spec, QWidget):
+            return 0
+        if isinstance(spec, (list, tuple)):
+            return 1 + sum(cls._count(child) for child in spec)
+        if isinstance(spec, dict) and ('cols' in spec or spec.get('component') == 'row'):
+            total = 1
+            for col_spec in spec.get('cols', []):
+                col_spec = cls._normalize(col_spec)
+                if not isinstance(col_spec, dict):
+                    total += cls._count(col_spec)
+                    continue
+                widget_spec = col_spec.get('widget')
+                total += 1 if col_spec.get('container') else 0
+                if widget_spec is not None:
+                    total += cls._count(widget_spec)
+                elif not col_spec.get('container'):
+                    total += 1
+            return total
+        return 1
+
+
+class IncrementalBuilder(QObject):
+    """
+    分时布局构建器
+
+    在每个事件循环周期内按时间预算创建一部分组件，然后让出事件循环。
+    首屏 (fold_height 以内) 的内容在 start() 中同步创建，其余内容分批追加，
+    页面在构建期间保持响应。
+    """
+
+    # 进度信号 (已创建组件数, 组件总数)
+    progress = Signal(int, int)
+    # 构建完成信号 (根组件)
+    finished = Signal(object)
+
+    def __init__(
+        self,
+        spec: Any,
+        parent_widget: Optional[QWidget] = None,
+        budget_ms: float = 8.0,
+        fold_height: Optional[int] = None,
+        parent: Optional[QObject] = None
+    ):
+        """
+        初始化分时布局构建器
+
+        Args:
+            spec: 与 LayoutBuilder 相同的描述，顶层为列表时各项自上而下排列
+            parent_widget: 根组件的父组件
+            budget_ms: 每个事件循环周期内的构建时间预算 (毫秒)
+            fold_height: 首屏高度，默认为父组件的高度
+            parent: 父级对象
+        """
+        super().__init__(parent)
+
+        if isinstance(spec, str):
+            spec = json.loads(spec)
+        specs = list(spec) if isinstance(spec, (list, tuple)) else [spec]
+
+        # 存储属性
+        self._specs = specs
+        self._parent_widget = parent_widget
+        self._budget = budget_ms / 1000
+        if fold_height is None:
+            fold_height = parent_widget.height() if parent_widget is not None else 0
+        self._fold_height = fold_height
+
+        self._root: Optional[QWidget] = None
+        self._steps: Optional[Iterator[QWidget]] = None
+        self._filled_height = 0
+        self._created = 0
+        self._total = 1 + sum(LayoutBuilder._count(child) for child in specs)
+        self._running = False
+
+    def start(self) -> QWidget:
+        """
+        开始构建，同步创建首屏内容后返回根组件
+
+        Returns:
+            根组件 (自上而下排列的容器)，其余内容在之后的事件循环周期中追加
+        """
+        self._root = _create_stack(self._parent_widget)
+        self._created = 1
+        self._steps = self._iter_children()
+        self._running = True
+
+        # 首屏内容不受时间预算限制
+        while self._running and self._filled_height < self._fold_height:
+            if not self._step():
+                break
+        self._end_chunk()
+        return self._root
+
+    def cancel(self):
+        """停止构建，已创建的组件保留"""
+        self._running = False
+
+    def is_running(self) -> bool:
+        """是否仍在构建"""
+        return self._running
+
+    def get_root(self) -> Optional[QWidget]:
+        """获取根组件"""
+        return self._root
+
+    def get_progress(self) -> Tuple[int, int]:
+        """获取 (已创建组件数, 组件总数)"""
+        return self._created, self._total
+
+    def _iter_children(self) -> Iterator[QWidget]:
+        """逐个创建顶层节点，每个节点完成后立即加入根组件"""
+        return self._iter_stack(self._specs, self._root)
+
+    def _iter_stack(self, specs: List[Any], container: QWidget) -> Iterator[QWidget]:
+        """
+        逐个创建自上而下排列的节点
+
+        嵌套列表的容器先加入所在的容器，其中的每个节点完成后立即加入并计入首屏高度，
+        首屏判断不必等待整个列表创建完成
+        """
+        layout = container.layout()
+        for spec in specs:
+            spec = LayoutBuilder._normalize(spec)
+            if isinstance(spec, (list, tuple)):
+                stack = _create_stack(container)
+                layout.addWidget(stack)
+                yield stack
+                yield from self._iter_stack(spec, stack)
+                continue
+            child = yield from LayoutBuilder._iter_node(spec, container)
+            layout.addWidget(child)
+            if self._filled_height < self._fold_height:
+                self._filled_height += child.sizeHint().height() + layout.spacing()
+
+    def _step(self) -> bool:
+        """创建一个组件，全部完成时返回 False"""
+        try:
+            next(self._steps)
+        except StopIteration:
+            self._running = False
+            return False
+        self._created += 1
+        return True
+
+    def _run_chunk(self):
+        """在时间预算内创建一批组件"""
+        if not self._running:
+            return
+        deadline = time.perf_counter() + self._budget
+        while self._step() and time.perf_counter() < deadline:
+            pass
+        self._end_chunk()
+
+    def _end_chunk(self):
+        """完成一批构建: 计算布局、报告进度并安排下一批"""
+        flush_layouts()
+        self.progress.emit(self._created, self._total)
+        if self._running:
+            QTimer.singleShot(0, self._run_chunk)
+        elif self._steps is not None:
+            self._steps = None
+            self._created = self._total
+            self.finished.emit(self._root)
+
+
+def _run_steps(steps: Iterator[QWidget]) -> QWidget:
+    """同步执行逐个创建组件的生成器，返回根组件"""
+    while True:
+        try:
+            next(steps)
+        except StopIteration as stop:
+            return stop.value
+
+
+def _create_stack(parent: Optional[QWidget]) -> QWidget:
+    """创建自上而下排列的容器"""
+    container = QWidget(parent)
+    layout = QVBoxLayout(container)
+    layout.setContentsMargins(0, 0, 0, 0)
+    return container
+
+
+def _create_input(parent: Optional[QWidget], text: str, placeholder: str) -> QLineEdit:
+    """创建输入框"""
+    line_edit = QLineEdit(text, parent)
+    if placeholder:
+        line_edit.setPlaceholderText(placeholder)
+    return line_edit
+
+
+# 便捷函数
+def build_layout(spec: Any, parent: Optional[QWidget] = None) -> QWidget:
+    """根据描述构建组件树"""
+    return LayoutBuilder.build(spec, parent)
+
+
+def register_widget_type(type_name: str, factory: WidgetFactory):
+    """注册组件类型"""
+    LayoutBuilder.register(type_name, factory)
@@ -0,0 +1,309 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+冻结静态子树
+
+把容器及其所有子组件渲染为一张缓存的位图，之后的重绘只绘制这张位图
+
+Qt 不会通知祖先子组件调用了 update() (例如固定尺寸的 QLabel 修改文本)。但是组件带有
+QGraphicsEffect 时，Qt 标记其需要重绘会同步调用效果的 boundingRectFor()。因此冻结时为子树中的
+每个子组件安装一个直接绘制的 _UpdateSentinel 效果，在绘制缓存之外被调用时丢弃所有祖先的缓存。
+"""
+
+import functools
+import weakref
+from typing import Dict, Optional
+from adw.common.qt import QGraphicsEffect, QWidget, Qt, QEvent, QPoint, QPixmap, QTransform
+
+
+# 子树中表示内容发生变化的事件
+_CONTENT_EVENTS = frozenset((
+    QEvent.Type.LayoutRequest,
+    QEvent.Type.ChildAdded,
+    QEvent.Type.ChildRemoved,
+    QEvent.Type.Show,
+    QEvent.Type.Hide,
+    QEvent.Type.Resize,
+    QEvent.Type.Move,
+    QEvent.Type.EnabledChange,
+    QEvent.Type.StyleChange,
+    QEvent.Type.FontChange,
+    QEvent.Type.PaletteChange,
+))
+
+# 当前处于冻结状态的效果，用于在布局失效时通知
+_frozen_effects: "weakref.WeakSet[FreezeEffect]" = weakref.WeakSet()
+
+# 正在渲染缓存的冻结效果数量，渲染期间子组件的 boundingRectFor 调用不代表内容变化
+_suspended = 0
+
+
+def _notify_update(widget: Optional[QWidget]):
+    """组件及其祖先中冻结的子树需要重新渲染 (widget 的子组件调用了 update)"""
+    if _suspended:
+        return
+    while widget is not None:
+        effect = widget.graphicsEffect()
+        if isinstance(effect, FreezeEffect):
+            effect._discard()
+        widget = widget.parentWidget()
+
+
+def _on_effect_destroyed(widget: QWidget, effect):
+    """冻结效果被删除 (解除冻结、被替换或随组件销毁) 后移除不再需要的监视效果"""
+    _frozen_effects.discard(effect)
+    try:
+        _remove_sentinels(widget, effect)
+    except RuntimeError:
+        # 组件已经销毁
+        pass
+
+
+def _remove_sentinels(widget: QWidget, released):
+    """移除子树中除 released 外不再被其他冻结效果使用的监视效果"""
+    for child in widget.findChildren(QWidget):
+        effect = child.graphicsEffect()
+        if isinstance(effect, _UpdateSentinel) and not _has_other_freeze(child, released):
+            effect.destroyed.disconnect(_on_sentinel_destroyed)
+            child.setGraphicsEffect(None)
+
+
+def _has_other_freeze(widget: QWidget, released) -> bool:
+    """组件的祖先中是否还有除 released 外的冻结效果"""
+    widget = widget.parentWidget()
+    while widget is not None:
+        effect = widget.graphicsEffect()
+        if isinstance(effect, FreezeEffect) and effect is not released and effect in _frozen_effects:
+            return True
+        widget = widget.parentWidget()
+    return False
+
+
+def _on_sentinel_destroyed():
+    """子组件的监视效果被替换或删除后，冻结效果在下一次绘制时重新检查子树"""
+    for effect in list(_frozen_effects):
+        try:
+            effect._discard()
+            effect._tracked = None
+        except RuntimeError:
+            continue
+
+
+class _UpdateSentinel(QGraphicsEffect):
+    """
+    子组件的监视效果
+
+    直接绘制子组件，不改变外观；Qt 标记子组件需要重绘时通知冻结的祖先。
+    (在设备坐标中绘制，避免嵌套在冻结效果中渲染时子组件位置偏移)
+    """
+
+    def draw(self, painter):
+        """直接绘制子组件"""
+        offset = QPoint()
+        pixmap = self.sourcePixmap(Qt.CoordinateSystem.DeviceCoordinates, offset)
+        painter.save()
+        painter.setWorldTransform(QTransform())
+        painter.drawPixmap(offset, pixmap)
+        painter.restore()
+
+    def boundingRectFor(self, rect):
+        """Qt 标记子组件需要重绘时同步调用"""
+        _notify_update(self.parent().parentWidget())
+        return rect
+
+
+class FreezeEffect(QGraphicsEffect):
+    """
+    冻结效果
+
+    第一次绘制时把组件及其子组件渲染为与 devicePixelRatio 匹配的位图，之后的绘制只绘制这张位图。
+    子树内容变化 (包括任何子组件调用 update()) 时丢弃位图并在下一次绘制时重新生成；
+    鼠标进入或键盘焦点进入子树时暂停冻结，离开后恢复。
+
+    子组件已经带有其他 QGraphicsEffect 时无法得知其是否需要重绘，此时每次绘制都重新渲染子树。
+    """
+
+    def __init__(self, widget: QWidget):
+        """
+        初始化冻结效果
+
+        Args:
+            widget: 被冻结的容器
+        """
+        super().__init__(widget)
+
+        self._widget = widget
+        self._pixmap: Optional[QPixmap] = None
+        self._offset = QPoint()
+        self._hovered = False
+        self._focused = False
+        # 子树中的组件是否都能监视 (None 表示需要重新检查)
+        self._tracked: Optional[bool] = None
+        self._counters = dict.fromkeys(('renders', 'blits', 'invalidations'), 0)
+
+        self._watch(widget)
+        _frozen_effects.add(self)
+        self.destroyed.connect(functools.partial(_on_effect_destroyed, widget, self))
+
+    def draw(self, painter):
+        """绘制缓存的位图，没有有效缓存时重新渲染子树"""
+        global _suspended
+        if self._tracked is None:
+            self._tracked = self._install_sentinels(self._widget)
+        ratio = painter.device().devicePixelRatio()
+        if self._pixmap is None or self._pixmap.devicePixelRatio() != ratio or not self._tracked:
+            offset = QPoint()
+            _suspended += 1
+            try:
+                pixmap = self.sourcePixmap(Qt.CoordinateSystem.LogicalCoordinates, offset)
+            finally:
+                _suspended -= 1
+            # 无法监视的子树不保留缓存
+            self._pixmap = pixmap if self._tracked else None
+            self._offset = offset
+            self._counters['renders'] += 1
+            painter.drawPixmap(offset, pixmap)
+        else:
+            self._counters['blits'] += 1
+            painter.drawPixmap(self._offset, self._pixmap)
+
+    def sourceChanged(self, flags):
+        """组件尺寸等发生变化时丢弃缓存"""
+        self.invalidate()
+
+    def invalidate(self):
+        """丢弃缓存的位图，下一次绘制时重新生成"""
+        self._discard()
+        self.update()
+
+    def _discard(self):
+        """丢弃缓存的位图 (重绘已经由 Qt 安排)"""
+        # 组件销毁期间 Python 端的属性可能已经被回收
+        if getattr(self, "_pixmap", None) is not None:
+            self._pixmap = None
+            self._counters['invalidations'] += 1
+
+    def release(self):
+        """停止监听子树"""
+        _frozen_effects.discard(self)
+        self._unwatch(self._widget)
+        self._pixmap = None
+
+    def _install_sentinels(self, widget: QWidget) -> bool:
+        """为子树中的子组件安装监视效果，返回是否所有子组件都能监视"""
+        tracked = True
+        children = widget.findChildren(QWidget)
+        if widget is not self._widget:
+            children.insert(0, widget)
+        for child in children:
+            effect = child.graphicsEffect()
+            if effect is None:
+                sentinel = _UpdateSentinel(child)
+                sentinel.destroyed.connect(_on_sentinel_destroyed)
+                child.setGraphicsEffect(sentinel)
+            elif not isinstance(effect, (_UpdateSentinel, FreezeEffect)):
+                tracked = False
+        return tracked
+
+    def boundingRectFor(self, rect):
+        """嵌套的冻结子树需要重绘时通知外层的冻结效果"""
+        _notify_update(self._widget.parentWidget())
+        return rect
+
+    def _watch(self, widget: QWidget):
+        """监听组件及其所有子组件的事件，并安装监视效果"""
+        widget.installEventFilter(self)
+        for child in widget.findChildren(QWidget):
+            child.installEventFilter(self)
+        tracked = self._install_sentinels(widget)
+        if widget is self._widget:
+            self._tracked = tracked
+        elif not tracked:
+            self._tracked = False
+
+    def _unwatch(self, widget: QWidget):
+        """停止监听组件及其所有子组件的事件，并移除监视效果"""
+        widget.removeEventFilter(self)
+        for child in widget.findChildren(QWidget):
+            child.removeEventFilter(self)
+        _remove_sentinels(widget, self)
+
+    def eventFilter(self, obj, event) -> bool:
+        """交互时暂停冻结，内容变化时丢弃缓存"""
+        # 组件销毁期间子组件的事件仍会经过过滤器，此时 Python 端的属性可能已经被回收
+        widget = getattr(self, "_widget", None)
+        if widget is None:
+            return False
+        event_type = event.type()
+        if obj is widget and event_type in (QEvent.Type.Enter, QEvent.Type.Leave):
+            self._hovered = event_type == QEvent.Type.Enter
+            self._update_enabled()
+        elif event_type in (QEvent.Type.FocusIn, QEvent.Type.FocusOut):
+            self._focused = event_type == QEvent.Type.FocusIn
+            self._update_enabled()
+        elif event_type in _CONTENT_EVENTS:
+            if event_type == QEvent.Type.ChildAdded and event.child().isWidgetType():
+                self._watch(event.child())
+            if obj is not widget or event_type not in (QEvent.Type.Move, QEvent.Type.Show):
+                self.invalidate()
+        return False
+
+    def _update_enabled(self):
+        """鼠标或键盘焦点在子树内时直接绘制子组件"""
+        enabled = not (self._hovered or self._focused)
+        if enabled != self.isEnabled():
+            self._pixmap = None
+            self.setEnabled(enabled)
+
+    def get_counters(self) -> Dict[str, int]:
+        """
+        获取统计计数
+
+        - renders: 重新渲染子树的次数
+        - blits: 直接绘制缓存位图的次数
+        - invalidations: 因内容变化丢弃缓存的次数
+        """
+        return dict(self._counters)
+
+
+def freeze_widget(widget: QWidget) -> FreezeEffect:
+    """
+    冻结组件及其子树
+
+    组件原有的 QGraphicsEffect 会被替换。
+
+    Args:
+        widget: 要冻结的容器
+
+    Returns:
+        冻结效果
+    """
+    effect = widget.graphicsEffect()
+    if isinstance(effect, FreezeEffect):
+        return effect
+    effect = FreezeEffect(widget)
+    widget.setGraphicsEffect(effect)
+    return effect
+
+
+def unfreeze_widget(widget: QWidget):
+    """解除组件的冻结"""
+    effect = widget.graphicsEffect()
+    if isinstance(effect, FreezeEffect):
+        effect.release()
+        widget.setGraphicsEffect(None)
+
+
+def is_frozen(widget: QWidget) -> bool:
+    """组件是否处于冻结状态"""
+    return isinstance(widget.graphicsEffect(), FreezeEffect)
+
+
+def notify_content_changed(widget: QWidget):
+    """通知包含该组件的冻结子树内容已变化 (没有冻结的子树时不做任何事)"""
+    if not _frozen_effects:
+        return
+    for effect in list(_frozen_effects):
+        frozen = effect._widget
+        if frozen is widget or frozen.isAncestorOf(widget):
+            effect.invalidate()
@@ -4,21 +4,18 @@
 Ant Design 风格的 Grid 栅格组件
 """
 
-from typing import Optional, Union, Dict, List, Any
+from typing import Optional, Union, Dict, List, Any, Tuple, Callable
 from adw.styles.spacing import Spacing
 from adw.styles.theme import ThemeManager
-from adw.styles.breakpoints import Breakpoint
-
-# 动态导入 PySide6 或 PyQt6
-try:
-    from PySide6.QtWidgets import QWidget, QHBoxLayout, QVBoxLayout, QSpacerItem, QSizePolicy
-    from PySide6.QtCore import Qt, QSize
-except ImportError:
-    try:
-        from PyQt6.QtWidgets import QWidget, QHBoxLayout, QVBoxLayout, QSpacerItem, QSizePolicy
-        from PyQt6.QtCore import Qt, QSize
-    except ImportError:
-        raise ImportError("Requires either PySide6 or PyQt6")
+from adw.styles.breakpoints import Breakpoint, BreakpointManager, BREAKPOINT_ORDER, BREAKPOINT_INDEX
+from adw.components.layout.grid_layout import GridLayout, GridItem, ResizePolicy
+from adw.components.layout.freeze import freeze_widget, unfreeze_widget, is_frozen
+from adw.components.layout.grid_model import (
+    FlexSpec, SpanEntry, parse_flex, _compile_responsive_table, _compile_gutter_table
+)
+from adw.common.qt import (
+    QWidget, QWidgetItem, QHBoxLayout, QVBoxLayout, QSpacerItem, QSizePolicy, Qt, QSize, QEvent, QTimer
+)
 
 
 class Row(QWidget):
@@ -52,10 +49,12 @@ class Row(QWidget):
         self._gutter = gutter
         self._justify = justify
         self._wrap = wrap
+        self._gutter_table = _compile_gutter_table(gutter)
+        self._breakpoint_index = 0
+        self._watched_window: Optional[QWidget] = None
         
         # 创建布局
-        self._layout = QHBoxLayout()
-        self._layout.setContentsMargins(0, 0, 0, 0)
+        self._layout = GridLayout()
         self.setLayout(self._layout)
         
         # 设置对象名称用于样式
@@ -66,33 +65,10 @@ class Row(QWidget):
         
     def _setup_ui(self):
         """设置UI样式"""
-        # 设置对齐方式
-        if self._justify == "start":
-            self._layout.setAlignment(Qt.AlignLeft)
-        elif self._justify == "end":
-            self._layout.setAlignment(Qt.AlignRight)
-        elif self._justify == "center":
-            self._layout.setAlignment(Qt.AlignCenter)
-        elif self._justify == "space-around":
-            self._layout.setSpacing(Spacing.get_md())
-        elif self._justify == "space-between":
-            self._layout.setSpacing(Spacing.get_lg())
-        elif self._justify == "space-evenly":
-            self._layout.setSpacing(Spacing.get_xl())
-            
-        # 设置垂直对齐
-        if self._align == "top":
-            self._layout.setAlignment(Qt.AlignTop)
-        elif self._align == "middle":
-            self._layout.setAlignment(Qt.AlignVCenter)
-        elif self._align == "bottom":
-            self._layout.setAlignment(Qt.AlignBottom)
-        elif self._align == "stretch":
-            self._layout.setAlignment(Qt.AlignStretch)
-            
-        # 设置换行
-        if not self._wrap:
-            self._layout.setSizeConstraint(QHBoxLayout.SetFixedSize)
+        # 设置水平排列、垂直对齐和换行
+        self._layout.set_justify(self._justify)
+        self._layout.set_align(self._align)
+        self._layout.set_wrap(self._wrap)
             
         # 设置间距
         self._update_gutter()
@@ -102,17 +78,57 @@ class Row(QWidget):
         
     def _update_gutter(self):
         """更新间距"""
-        if isinstance(self._gutter, int):
-            # 单一数值
-            self._layout.setSpacing(self._gutter)
-        elif isinstance(self._gutter, dict):
-            # 响应式对象
-            # 这里简化处理，实际应该根据屏幕尺寸动态调整
-            default_gutter = self._gutter.get('md', Spacing.get_md())
-            self._layout.setSpacing(default_gutter)
-        elif isinstance(self._gutter, list) and len(self._gutter) >= 2:
-            # 数组形式 [水平间距, 垂直间距]
-            self._layout.setSpacing(self._gutter[0])
+        # 按当前断点取预编译的 [水平间距, 垂直间距]
+        self._layout.set_gutter(*self._gutter_table[self._breakpoint_index])
+        
+    def _update_breakpoint(self, width: int) -> bool:
+        """根据窗口宽度更新断点，断点变化时一次性重新解析所有列"""
+        index = BREAKPOINT_INDEX[BreakpointManager.get_breakpoint_for_width(width)]
+        if index == self._breakpoint_index:
+            return False
+        self._breakpoint_index = index
+        for item in self._layout.grid_items():
+            if isinstance(item, GridItem):
+                item.set_breakpoint_index(index)
+            else:
+                item.widget()._set_breakpoint_index(index)
+        self._update_gutter()
+        return True
+        
+    def _watch_window(self):
+        """监听顶层窗口尺寸，断点以窗口宽度为准"""
+        window = self.window()
+        if window is self._watched_window:
+            return
+        if self._watched_window is not None:
+            self._watched_window.removeEventFilter(self)
+        self._watched_window = window
+        if window is not self:
+            window.installEventFilter(self)
+        self._update_breakpoint(window.width())
+        
+    def eventFilter(self, obj, event) -> bool:
+        """顶层窗口尺寸变化时更新断点"""
+        # 解释器退出时包装对象的属性可能已被清理
+        watched = getattr(self, "_watched_window", None)
+        if watched is not None and obj is watched and event.type() == QEvent.Type.Resize:
+            self._update_breakpoint(event.size().width())
+        return super().eventFilter(obj, event)
+        
+    def showEvent(self, event):
+        """显示时绑定顶层窗口"""
+        super().showEvent(event)
+        self._watch_window()
+        
+    def resizeEvent(self, event):
+        """Row 本身作为顶层窗口时更新断点"""
+        super().resizeEvent(event)
+        if self._watched_window is self:
+            self._update_breakpoint(event.size().width())
+            
+    def paintEvent(self, event):
+        """绘制 (定义在类中，adw.perf 开启后已创建的实例也能统计绘制)"""
+        super().paintEvent(event)
             
     def _apply_style(self):
         """应用样式"""
@@ -132,9 +148,118 @@ class Row(QWidget):
         """添加子组件"""
         self._layout.addWidget(widget)
         
-    def add_col(self, col: 'Col'):
-        """添加列组件"""
-        self._layout.addWidget(col)
+    def add_col(
+        self,
+        col: Union['Col', QWidget],
+        span: int = 0,
+        offset: int = 0,
+        pull: int = 0,
+        push: int = 0,
+        order: int = 0,
+        flex: Optional[Union[str, int]] = None,
+        xs: Optional[Union[int, Dict[str, Any]]] = None,
+        sm: Optional[Union[int, Dict[str, Any]]] = None,
+        md: Optional[Union[int, Dict[str, Any]]] = None,
+        lg: Optional[Union[int, Dict[str, Any]]] = None,
+        xl: Optional[Union[int, Dict[str, Any]]] = None,
+        xxl: Optional[Union[int, Dict[str, Any]]] = None
+    ) -> Optional[GridItem]:
+        """
+        添加列
+        
+        传入 Col 时按原有方式添加；传入普通组件时使用轻量列模式，栅格属性记录在布局项上，
+        组件直接放入 Row，不再额外创建 Col 容器、布局和样式表。
+        
+        Args:
+            col: Col 组件或任意子组件
+            span, offset, pull, push, order, flex, xs - xxl: 轻量列模式下的栅格属性，与 Col 相同
+            
+        Returns:
+            轻量列模式下返回对应的 GridItem，否则返回 None
+        """
+        if isinstance(col, Col):
+            self._layout.addWidget(col)
+            col._set_breakpoint_index(self._breakpoint_index)
+            return None
+        
+        item = GridItem(col, span, offset, pull, push, order, flex, {
+            Breakpoint.XS: xs,
+            Breakpoint.SM: sm,
+            Breakpoint.MD: md,
+            Breakpoint.LG: lg,
+            Breakpoint.XL: xl,
+            Breakpoint.XXL: xxl
+        })
+        self._layout.add_grid_item(item)
+        item.set_breakpoint_index(self._breakpoint_index)
+        return item
+        
+    def add_cols(self, cols: List[Union['Col', QWidget, Tuple[QWidget, Dict[str, Any]]]]) -> List[Optional[GridItem]]:
+        """
+        批量添加列，所有列加入后只触发一次重新布局
+        
+        Args:
+            cols: Col 组件、普通组件或 (组件, 栅格属性) 元组的列表，普通组件使用轻量列模式
+            
+        Returns:
+            与 cols 一一对应，轻量列为 GridItem，Col 为 None
+        """
+        items, results = [], []
+        for col in cols:
+            if isinstance(col, Col):
+                items.append(QWidgetItem(col))
+                results.append(None)
+                continue
+            widget, props = col if isinstance(col, tuple) else (col, {})
+            props = dict(props)
+            flex = props.pop('flex', None)
+            responsive = {bp: props.pop(bp.value, None) for bp in BREAKPOINT_ORDER}
+            item = GridItem(widget, flex=flex, responsive=responsive, **props)
+            items.append(item)
+            results.append(item)
+        self._layout.add_grid_items(items)
+        for item in items:
+            if isinstance(item, GridItem):
+                item.set_breakpoint_index(self._breakpoint_index)
+            else:
+                item.widget()._set_breakpoint_index(self._breakpoint_index)
+        return results
+        
+    def get_breakpoint(self) -> Breakpoint:
+        """获取当前断点"""
+        return BREAKPOINT_ORDER[self._breakpoint_index]
+        
+    def get_resize_policy(self) -> Optional[ResizePolicy]:
+        """获取生效的尺寸变化策略"""
+        return self._layout.get_resize_policy()
+        
+    def set_resize_policy(self, policy: Optional[ResizePolicy]):
+        """
+        设置尺寸变化策略
+        
+        嵌套在本 Row 中且未单独设置策略的 Row 使用同一策略。
+        
+        Args:
+            policy: 尺寸变化策略，None 表示使用祖先的策略或立即精确布局
+        """
+        self._layout.set_resize_policy(policy)
+        
+    def freeze(self):
+        """
+        冻结行及其子组件
+        
+        整个子树只渲染一次并缓存为位图，之后的重绘直接绘制位图；内容变化时自动重新生成，
+        鼠标悬停或键盘焦点在子树内时暂停冻结。适合只读的摘要、统计等静态区域。
+        """
+        freeze_widget(self)
+        
+    def unfreeze(self):
+        """解除冻结"""
+        unfreeze_widget(self)
+        
+    def is_frozen(self) -> bool:
+        """是否处于冻结状态"""
+        return is_frozen(self)
         
     # 属性的 getter 和 setter 方法
     def get_align(self) -> str:
@@ -144,7 +269,7 @@ class Row(QWidget):
     def set_align(self, align: str):
         """设置垂直对齐方式"""
         self._align = align
-        self._setup_ui()
+        self._layout.set_align(align)
         
     def get_gutter(self) -> Union[int, Dict[str, int], List[int]]:
         """获取栅格间隔"""
@@ -153,6 +278,7 @@ class Row(QWidget):
     def set_gutter(self, gutter: Union[int, Dict[str, int], List[int]]):
         """设置栅格间隔"""
         self._gutter = gutter
+        self._gutter_table = _compile_gutter_table(gutter)
         self._update_gutter()
         
     def get_justify(self) -> str:
@@ -162,7 +288,7 @@ class Row(QWidget):
     def set_justify(self, justify: str):
         """设置水平排列方式"""
         self._justify = justify
-        self._setup_ui()
+        self._layout.set_justify(justify)
         
     def get_wrap(self) -> bool:
         """获取是否自动换行"""
@@ -171,7 +297,7 @@ class Row(QWidget):
     def set_wrap(self, wrap: bool):
         """设置是否自动换行"""
         self._wrap = wrap
-        self._setup_ui()
+        self._layout.set_wrap(wrap)
 
 
 class Col(QWidget):
@@ -195,7 +321,9 @@ class Col(QWidget):
         xl: Optional[Union[int, Dict[str, Any]]] = None,
         xxl: Optional[Union[int, Dict[str, Any]]] = None,
         widget: Optional[QWidget] = None,
-        parent: Optional[QWidget] = None
+        parent: Optional[QWidget] = None,
+        widget_factory: Optional[Callable[[], QWidget]] = None,
+        release_after: Optional[int] = None
     ):
         """
         初始化列组件
@@ -206,7 +334,7 @@ class Col(QWidget):
             pull: 栅格向左移动格数
             push: 栅格向右移动格数
             order: 栅格顺序
-            flex: flex 布局属性
+            flex: flex 布局属性 (数字、'auto'、'none'、'200px'、'50%' 或 '1 1 200px')
             xs: <576px 响应式栅格
             sm: ≥576px 响应式栅格
             md: ≥768px 响应式栅格
@@ -215,6 +343,8 @@ class Col(QWidget):
             xxl: ≥1600px 响应式栅格
             widget: 包含的子组件
             parent: 父级组件
+            widget_factory: 子组件工厂，列第一次显示时才创建子组件 (与 widget 二选一)
+            release_after: 列隐藏超过该毫秒数后释放由工厂创建的子组件，None 表示不释放
         """
         super().__init__(parent)
         
@@ -225,6 +355,7 @@ class Col(QWidget):
         self._push = push
         self._order = order
         self._flex = flex
+        self._flex_spec = parse_flex(flex)
         self._responsive = {
             Breakpoint.XS: xs,
             Breakpoint.SM: sm,
@@ -234,6 +365,15 @@ class Col(QWidget):
             Breakpoint.XXL: xxl
         }
         self._widget = widget
+        self._widget_factory = widget_factory
+        self._release_after = release_after
+        self._release_timer: Optional[QTimer] = None
+        
+        # 预编译响应式表，当前断点即为表索引
+        self._breakpoint_index = 0
+        self._table = _compile_responsive_table(
+            span, offset, push, pull, order, self._responsive
+        )
         
         # 设置对象名称用于样式
         self.setObjectName("adw-col")
@@ -246,16 +386,16 @@ class Col(QWidget):
         # 初始化UI
         self._setup_ui()
         
+        # 当前断点下 span 为 0 时隐藏
+        if self._table[0][0] == 0:
+            self.hide()
+        
     def _setup_ui(self):
         """设置UI样式"""
         # 添加子组件
         if self._widget:
             self._layout.addWidget(self._widget)
             
-        # 设置顺序
-        if self._order > 0:
-            self._layout.setStretch(self._layout.indexOf(self._widget) if self._widget else 0, self._order)
-            
         # 应用样式
         self._apply_style()
         
@@ -264,12 +404,7 @@ class Col(QWidget):
         # 获取当前主题设置
         settings = ThemeManager.get_theme_settings()
         
-        # 计算宽度百分比 (基于24栅格)
-        width_percent = (self._span / 24 * 100) if self._span > 0 else 0
-        
-        # 计算偏移量
-        offset_percent = (self._offset / 24 * 100) if self._offset > 0 else 0
-        
+        # 宽度和偏移由 Row 的 GridLayout 计算，样式表只负责外观
         style = f"""
         QWidget#adw-col {{
             background-color: transparent;
@@ -277,29 +412,72 @@ class Col(QWidget):
             padding: 0;
         }}
         """
+        self.setStyleSheet(style)
         
-        # 设置宽度和偏移
-        if width_percent > 0:
-            style += f"QWidget#adw-col {{ width: {width_percent}%; }}"
+    def _compile_table(self):
+        """重新编译响应式表"""
+        self._table = _compile_responsive_table(
+            self._span, self._offset, self._push, self._pull, self._order, self._responsive
+        )
+        self._apply_breakpoint()
+        
+    def _set_breakpoint_index(self, index: int):
+        """切换当前断点 (由 Row 在断点变化时调用)"""
+        if index == self._breakpoint_index:
+            return
+        previous = self._table[self._breakpoint_index]
+        self._breakpoint_index = index
+        if self._table[index] != previous:
+            self._apply_breakpoint()
             
-        if offset_percent > 0:
-            style += f"QWidget#adw-col {{ margin-left: {offset_percent}%; }}"
-            
-        self.setStyleSheet(style)
+    def _apply_breakpoint(self):
+        """应用当前断点的表项"""
+        hidden = self._table[self._breakpoint_index][0] == 0
+        if hidden != self.isHidden() and (hidden or self.parentWidget() is not None):
+            self.setHidden(hidden)
+        if self._widget_factory is not None:
+            self._schedule_release(hidden)
+        # 通知 Row 的布局重新计算
+        self.updateGeometry()
+        
+    def showEvent(self, event):
+        """第一次显示时通过工厂创建子组件"""
+        super().showEvent(event)
+        if self._widget is None and self._widget_factory is not None:
+            self.set_widget(self._widget_factory())
+        
+    def paintEvent(self, event):
+        """绘制 (定义在类中，adw.perf 开启后已创建的实例也能统计绘制)"""
+        super().paintEvent(event)
+        
+    def _schedule_release(self, hidden: bool):
+        """隐藏时开始计时释放子组件，重新显示时取消"""
+        if not hidden or self._release_after is None or self._widget is None:
+            if self._release_timer is not None:
+                self._release_timer.stop()
+            return
+        if self._release_timer is None:
+            self._release_timer = QTimer(self)
+            self._release_timer.setSingleShot(True)
+            self._release_timer.timeout.connect(self._release_widget)
+        self._release_timer.start(self._release_after)
+        
+    def _release_widget(self):
+        """释放由工厂创建的子组件，再次显示时重新创建"""
+        if not self.isHidden() or self._widget is None:
+            return
+        widget = self._widget
+        self.set_widget(None)
+        widget.deleteLater()
+        
+    def get_responsive_entry(self) -> SpanEntry:
+        """获取当前断点的 (span, offset, push, pull, order)"""
+        return self._table[self._breakpoint_index]
         
     def _get_responsive_span(self) -> int:
         """获取响应式栅格跨度"""
-        # 这里简化处理，实际应该根据屏幕尺寸动态调整
-        # 优先级: xs < sm < md < lg < xl < xxl
-        for bp in [Breakpoint.XS, Breakpoint.SM, Breakpoint.MD, 
-                   Breakpoint.LG, Breakpoint.XL, Breakpoint.XXL]:
-            if self._responsive[bp] is not None:
-                value = self._responsive[bp]
-                if isinstance(value, int):
-                    return value
-                elif isinstance(value, dict) and 'span' in value:
-                    return value['span']
-        return self._span
+        span = self._table[self._breakpoint_index][0]
+        return self._span if span is None else span
         
     # 属性的 getter 和 setter 方法
     def get_span(self) -> int:
@@ -309,7 +487,7 @@ class Col(QWidget):
     def set_span(self, span: int):
         """设置栅格占位格数"""
         self._span = max(0, min(24, span))  # 限制在0-24之间
-        self._apply_style()
+        self._compile_table()
         
     def get_offset(self) -> int:
         """获取栅格左侧间隔格数"""
@@ -318,7 +496,7 @@ class Col(QWidget):
     def set_offset(self, offset: int):
         """设置栅格左侧间隔格数"""
         self._offset = max(0, min(24, offset))  # 限制在0-24之间
-        self._apply_style()
+        self._compile_table()
         
     def get_pull(self) -> int:
         """获取栅格向左移动格数"""
@@ -327,7 +505,7 @@ class Col(QWidget):
     def set_pull(self, pull: int):
         """设置栅格向左移动格数"""
         self._pull = pull
-        # 实现向左移动的逻辑
+        self._compile_table()
         
     def get_push(self) -> int:
         """获取栅格向右移动格数"""
@@ -336,7 +514,7 @@ class Col(QWidget):
     def set_push(self, push: int):
         """设置栅格向右移动格数"""
         self._push = push
-        # 实现向右移动的逻辑
+        self._compile_table()
         
     def get_order(self) -> int:
         """获取栅格顺序"""
@@ -345,7 +523,7 @@ class Col(QWidget):
     def set_order(self, order: int):
         """设置栅格顺序"""
         self._order = order
-        self._setup_ui()
+        self._compile_table()
         
     def get_flex(self) -> Optional[Union[str, int]]:
         """获取flex布局属性"""
@@ -354,10 +532,32 @@ class Col(QWidget):
     def set_flex(self, flex: Optional[Union[str, int]]):
         """设置flex布局属性"""
         self._flex = flex
-        # 实现flex布局逻辑
+        self._flex_spec = parse_flex(flex)
+        self.updateGeometry()
+        
+    def get_flex_spec(self) -> Optional[FlexSpec]:
+        """获取解析后的flex属性"""
+        return self._flex_spec
+        
+    def freeze(self):
+        """
+        冻结列及其子组件
+        
+        整个子树只渲染一次并缓存为位图，之后的重绘直接绘制位图；内容变化时自动重新生成，
+        鼠标悬停或键盘焦点在子树内时暂停冻结。适合只读的摘要、统计等静态区域。
+        """
+        freeze_widget(self)
+        
+    def unfreeze(self):
+        """解除冻结"""
+        unfreeze_widget(self)
+        
+    def is_frozen(self) -> bool:
+        """是否处于冻结状态"""
+        return is_frozen(self)
         
     def get_widget(self) -> Optional[QWidget]:
-        """获取包含的子组件"""
+        """获取包含的子组件 (使用工厂时，列显示之前为 None)"""
         return self._widget
         
     def set_widget(self, widget: Optional[QWidget]):
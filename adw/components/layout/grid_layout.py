@@ -0,0 +1,713 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Ant Design 24 栅格布局引擎
+
+Row 使用的 QLayout，栅格计算委托给不依赖 Qt 的 grid_model 模块
+"""
+
+import heapq
+from typing import Any, Dict, List, Optional, Tuple, Union
+from adw.styles.breakpoints import Breakpoint
+from adw.components.layout.grid_model import (
+    GRID_COLUMNS, SpanEntry, FlexSpec, parse_flex, solve_columns, align_in_line, _AUTO_ENTRY,
+    _compile_responsive_table
+)
+from adw.components.layout.freeze import notify_content_changed
+from adw.common.qt import QLayout, QLayoutItem, QWidget, QWidgetItem, Qt, QRect, QSize, QTimer
+
+
+# 每个布局按宽度缓存的求解结果数量上限
+_SOLUTION_CACHE_SIZE = 32
+
+
+class GridItem(QWidgetItem):
+    """
+    轻量列布局项
+
+    栅格属性记录在布局项上，子组件直接放入 Row，无需 Col 容器
+    """
+
+    def __init__(
+        self,
+        widget: QWidget,
+        span: int = 0,
+        offset: int = 0,
+        pull: int = 0,
+        push: int = 0,
+        order: int = 0,
+        flex: Optional[Union[str, int]] = None,
+        responsive: Optional[Dict[Breakpoint, Optional[Union[int, Dict[str, Any]]]]] = None
+    ):
+        """
+        初始化轻量列布局项
+
+        Args:
+            widget: 子组件
+            span, offset, pull, push, order, flex: 栅格属性，与 Col 相同
+            responsive: xs - xxl 响应式栅格
+        """
+        super().__init__(widget)
+        self._props = {
+            'span': span, 'offset': offset, 'pull': pull,
+            'push': push, 'order': order
+        }
+        self._responsive = dict(responsive or {})
+        self._flex_spec = parse_flex(flex)
+        self._breakpoint_index = 0
+        self._compile_table()
+
+    def _compile_table(self):
+        """重新编译响应式表"""
+        props = self._props
+        self._table = _compile_responsive_table(
+            props['span'], props['offset'], props['push'], props['pull'], props['order'],
+            self._responsive
+        )
+
+    def get_responsive_entry(self) -> SpanEntry:
+        """获取当前断点的 (span, offset, push, pull, order)"""
+        return self._table[self._breakpoint_index]
+
+    def get_flex_spec(self) -> Optional[FlexSpec]:
+        """获取解析后的flex属性"""
+        return self._flex_spec
+
+    def set_breakpoint_index(self, index: int):
+        """切换当前断点，span 为 0 时隐藏子组件，表项变化时通知所在布局重新计算"""
+        previous = self._table[self._breakpoint_index]
+        self._breakpoint_index = index
+        widget = self.widget()
+        hidden = self._table[index][0] == 0
+        if hidden != widget.isHidden():
+            widget.setHidden(hidden)
+        if self._table[index] != previous:
+            widget.updateGeometry()
+
+    def set_props(self, flex: Any = False, **props):
+        """
+        更新栅格属性
+
+        Args:
+            flex: flex 布局属性，不传时保持不变
+            props: span、offset、pull、push、order 或 xs - xxl
+        """
+        for key, value in props.items():
+            if key in self._props:
+                self._props[key] = value
+            else:
+                self._responsive[Breakpoint(key)] = value
+        if flex is not False:
+            self._flex_spec = parse_flex(flex)
+        self._compile_table()
+        self.set_breakpoint_index(self._breakpoint_index)
+        # 通知所在布局重新计算
+        self.widget().updateGeometry()
+
+
+class _DirtyLayoutQueue:
+    """
+    待重新计算的 GridLayout 队列
+
+    同一事件循环周期内的多次修改合并为一次计算。按组件树深度从深到浅处理，
+    子布局的尺寸贡献变化时父布局才会被加入队列。
+    """
+
+    def __init__(self):
+        self._heap: List[Tuple[int, int, 'GridLayout']] = []
+        self._pending = set()
+        self._scheduled = False
+
+    def mark(self, layout: 'GridLayout'):
+        """标记布局需要重新计算"""
+        key = id(layout)
+        if key in self._pending:
+            return
+        self._pending.add(key)
+        heapq.heappush(self._heap, (-layout._depth(), key, layout))
+        if not self._scheduled:
+            self._scheduled = True
+            QTimer.singleShot(0, self.flush)
+
+    def flush(self):
+        """处理所有待计算的布局"""
+        self._scheduled = False
+        while self._heap:
+            _depth, key, layout = heapq.heappop(self._heap)
+            self._pending.discard(key)
+            try:
+                layout._relayout()
+            except RuntimeError:
+                # 布局已随组件销毁
+                continue
+
+
+_dirty_layouts = _DirtyLayoutQueue()
+
+
+def flush_layouts():
+    """立即处理所有待重新计算的 GridLayout"""
+    _dirty_layouts.flush()
+
+
+# 所有尺寸变化策略的累计统计计数 (策略被回收后仍然保留，见 get_resize_counters)
+_resize_counters: Dict[str, int] = dict.fromkeys(
+    ('resize_events', 'coalesced_events', 'scaled_layouts', 'exact_layouts'), 0
+)
+
+
+class ResizePolicy:
+    """
+    栅格容器的尺寸变化策略
+
+    交互式调整窗口大小时，尺寸变化事件被合并为每帧最多一次处理: 调整过程中按上次精确布局的结果
+    做水平方向的等比缩放，停止调整 settle_ms 毫秒后再执行一次精确布局。
+    同一个策略可以由多个 Row 共享，嵌套的 Row 默认使用最近的祖先 Row 的策略。
+    """
+
+    def __init__(
+        self,
+        coalesce: bool = True,
+        scale_while_resizing: bool = True,
+        frame_ms: int = 16,
+        settle_ms: int = 150
+    ):
+        """
+        初始化尺寸变化策略
+
+        Args:
+            coalesce: 是否合并尺寸变化事件，为 False 时每次都立即精确布局
+            scale_while_resizing: 调整过程中是否做等比缩放，为 False 时只在停止调整后布局
+            frame_ms: 每帧的间隔 (毫秒)
+            settle_ms: 停止调整多久后执行精确布局 (毫秒)
+        """
+        self._coalesce = coalesce
+        self._scale_while_resizing = scale_while_resizing
+        self._frame_ms = frame_ms
+        self._settle_ms = settle_ms
+
+        # 等待下一帧处理的布局: id -> (布局, 目标矩形)
+        self._pending: Dict[int, Tuple['GridLayout', QRect]] = {}
+        # 上次精确布局后经过缩放的布局
+        self._scaled: Dict[int, 'GridLayout'] = {}
+        # 当前阶段: idle、frame (正在处理一帧) 或 settle (正在精确布局)
+        self._phase = "idle"
+
+        self._frame_timer = QTimer()
+        self._frame_timer.setSingleShot(True)
+        self._frame_timer.timeout.connect(self._on_frame)
+        self._settle_timer = QTimer()
+        self._settle_timer.setSingleShot(True)
+        self._settle_timer.timeout.connect(self.flush)
+
+        self._counters = dict.fromkeys(
+            ('resize_events', 'coalesced_events', 'scaled_layouts', 'exact_layouts'), 0
+        )
+
+    def request(self, layout: 'GridLayout', rect: QRect):
+        """处理布局的尺寸变化"""
+        self._count('resize_events')
+        if not self._coalesce or not layout._can_scale():
+            self._count('exact_layouts')
+            layout._apply_geometry(rect)
+            return
+
+        # 父布局在处理中设置子 Row 的尺寸时，子布局在同一帧内直接处理
+        if self._phase == "settle":
+            self._count('exact_layouts')
+            self._scaled.pop(id(layout), None)
+            layout._apply_geometry(rect)
+            return
+        if self._phase == "frame":
+            self._scale(layout, rect)
+            return
+
+        self._count('coalesced_events')
+        self._pending[id(layout)] = (layout, rect)
+        if self._scale_while_resizing and not self._frame_timer.isActive():
+            self._frame_timer.start(self._frame_ms)
+        self._settle_timer.start(self._settle_ms)
+
+    def _scale(self, layout: 'GridLayout', rect: QRect):
+        """按上次精确布局的结果等比缩放"""
+        self._count('scaled_layouts')
+        self._scaled[id(layout)] = layout
+        layout._apply_scaled(rect)
+
+    def _on_frame(self):
+        """每帧处理一次待处理的布局，父布局先于子布局"""
+        pending, self._pending = self._pending, {}
+        self._phase = "frame"
+        try:
+            for layout, rect in sorted(pending.values(), key=lambda value: value[0]._depth()):
+                try:
+                    self._scale(layout, rect)
+                except RuntimeError:
+                    # 布局已随组件销毁
+                    continue
+        finally:
+            self._phase = "idle"
+
+    def flush(self):
+        """立即对所有缩放过或待处理的布局执行精确布局"""
+        self._frame_timer.stop()
+        self._settle_timer.stop()
+        pending, self._pending = self._pending, {}
+        layouts = {key: (layout, None) for key, layout in self._scaled.items()}
+        layouts.update(pending)
+        self._scaled = {}
+        self._phase = "settle"
+        try:
+            for layout, rect in sorted(layouts.values(), key=lambda value: value[0]._depth()):
+                try:
+                    if rect is None:
+                        # 已由父布局精确处理过的子布局不再重复计算
+                        if not layout._scaled:
+                            continue
+                        rect = layout.geometry()
+                    self._count('exact_layouts')
+                    layout._apply_geometry(rect)
+                except RuntimeError:
+                    continue
+        finally:
+            self._phase = "idle"
+
+    def is_pending(self) -> bool:
+        """是否有尚未精确布局的尺寸变化"""
+        return bool(self._pending or self._scaled)
+
+    def _count(self, key: str):
+        """计数加一，同时累加到所有策略的合计"""
+        self._counters[key] += 1
+        _resize_counters[key] += 1
+
+    def get_counters(self) -> Dict[str, int]:
+        """
+        获取统计计数
+
+        - resize_events: 收到的尺寸变化次数
+        - coalesced_events: 被合并延迟处理的次数
+        - scaled_layouts: 等比缩放的次数
+        - exact_layouts: 精确布局的次数
+        """
+        return dict(self._counters)
+
+    def reset_counters(self):
+        """清零统计计数"""
+        for key in self._counters:
+            self._counters[key] = 0
+
+    # 属性的 getter 和 setter 方法
+    def get_coalesce(self) -> bool:
+        """获取是否合并尺寸变化事件"""
+        return self._coalesce
+
+    def set_coalesce(self, coalesce: bool):
+        """设置是否合并尺寸变化事件"""
+        self._coalesce = coalesce
+        if not coalesce:
+            self.flush()
+
+    def get_scale_while_resizing(self) -> bool:
+        """获取调整过程中是否等比缩放"""
+        return self._scale_while_resizing
+
+    def set_scale_while_resizing(self, scale_while_resizing: bool):
+        """设置调整过程中是否等比缩放"""
+        self._scale_while_resizing = scale_while_resizing
+
+    def get_settle_ms(self) -> int:
+        """获取停止调整后执行精确布局的延迟"""
+        return self._settle_ms
+
+    def set_settle_ms(self, settle_ms: int):
+        """设置停止调整后执行精确布局的延迟"""
+        self._settle_ms = settle_ms
+
+
+def get_resize_counters() -> Dict[str, int]:
+    """获取所有 ResizePolicy 的累计统计计数 (见 ResizePolicy.get_counters)，包括已经回收的策略"""
+    return dict(_resize_counters)
+
+
+def reset_resize_counters():
+    """清零所有 ResizePolicy 的累计统计计数 (各策略自己的计数不受影响)"""
+    for key in _resize_counters:
+        _resize_counters[key] = 0
+
+
+class GridLayout(QLayout):
+    """
+    24 栅格布局
+
+    子组件的 span、offset、push、pull、order 来自 Col.get_responsive_entry()，
+    普通组件按内容宽度排列
+    """
+
+    # 垃圾回收先清空了 Python 对象的属性、随后 Qt 才销毁父组件时，布局按空布局处理
+    _items = ()
+
+    def __init__(self, parent: Optional[QWidget] = None):
+        """
+        初始化栅格布局
+
+        Args:
+            parent: 父级组件
+        """
+        super().__init__(parent)
+
+        # 存储属性
+        self._items: List[QLayoutItem] = []
+        self._horizontal_gutter = 0
+        self._vertical_gutter = 0
+        self._justify = "start"
+        self._align = "top"
+        self._wrap = True
+
+        # 按宽度缓存的求解结果: 宽度 -> ([(行内各项 (item, x, width, height)), 行高], 总高度)
+        self._solutions: Dict[int, Tuple[list, int]] = {}
+
+        # 缓存的推荐尺寸和最小尺寸
+        self._size_hint: Optional[QSize] = None
+        self._minimum_size: Optional[QSize] = None
+
+        # 上次计算时对父布局的尺寸贡献
+        self._contribution: Optional[tuple] = None
+
+        # 尺寸变化策略，以及上次精确布局的矩形和各项几何位置 (用于等比缩放)
+        self._resize_policy: Optional[ResizePolicy] = None
+        self._exact_rect: Optional[QRect] = None
+        self._exact_geometry: List[Tuple[QLayoutItem, QRect]] = []
+        self._scaled = False
+
+        self.setContentsMargins(0, 0, 0, 0)
+
+    def __del__(self):
+        item = self.takeAt(0)
+        while item:
+            item = self.takeAt(0)
+
+    # QLayout 接口
+    def addItem(self, item: QLayoutItem):
+        """添加布局项"""
+        self._items.append(item)
+
+    def count(self) -> int:
+        """布局项数量"""
+        return len(self._items)
+
+    def itemAt(self, index: int) -> Optional[QLayoutItem]:
+        """获取布局项"""
+        if 0 <= index < len(self._items):
+            return self._items[index]
+        return None
+
+    def takeAt(self, index: int) -> Optional[QLayoutItem]:
+        """移除布局项"""
+        if 0 <= index < len(self._items):
+            # 移除的项不能再参与等比缩放
+            self._exact_rect = None
+            self._exact_geometry = []
+            return self._items.pop(index)
+        return None
+
+    def expandingDirections(self):
+        """栅格行在水平方向扩展"""
+        return Qt.Orientation.Horizontal
+
+    def hasHeightForWidth(self) -> bool:
+        """换行时高度依赖于宽度，列的高度也可能依赖于宽度"""
+        if self._wrap and self._items:
+            return True
+        return any(item.hasHeightForWidth() for item in self._items)
+
+    def heightForWidth(self, width: int) -> int:
+        """计算给定宽度下的高度，结果按宽度缓存"""
+        left, top, right, bottom = self.getContentsMargins()
+        return self._solve(width - left - right)[1] + top + bottom
+
+    def invalidate(self):
+        """
+        布局失效时清空缓存并加入重新计算队列
+
+        不调用 QLayout.invalidate()，避免 Qt 无条件地沿祖先链逐级重新布局；
+        只有尺寸贡献变化时才通知父组件 (见 _relayout)。
+        """
+        self._solutions.clear()
+        self._size_hint = self._minimum_size = None
+        _dirty_layouts.mark(self)
+        notify_content_changed(self.parentWidget())
+
+    def _depth(self) -> int:
+        """布局所属组件在组件树中的深度"""
+        depth = 0
+        widget = self.parentWidget()
+        while widget is not None:
+            depth += 1
+            widget = widget.parentWidget()
+        return depth
+
+    def _size_contribution(self, width: int) -> tuple:
+        """布局对父布局的尺寸贡献"""
+        hint = self.sizeHint()
+        minimum = self.minimumSize()
+        height = self.heightForWidth(width) if self.hasHeightForWidth() else -1
+        return hint.width(), hint.height(), minimum.width(), minimum.height(), height
+
+    def _relayout(self):
+        """重新计算本布局，尺寸贡献变化时才通知父组件"""
+        rect = self.geometry()
+        contribution = self._size_contribution(rect.width())
+        if rect.isValid():
+            self._apply_geometry(rect)
+        if contribution != self._contribution:
+            self._contribution = contribution
+            widget = self.parentWidget()
+            if widget is not None:
+                widget.updateGeometry()
+
+    def sizeHint(self) -> QSize:
+        """推荐尺寸，结果缓存到布局失效为止"""
+        if self._size_hint is None:
+            self._size_hint = self._size_from(lambda item: item.sizeHint())
+        return QSize(self._size_hint)
+
+    def minimumSize(self) -> QSize:
+        """最小尺寸，结果缓存到布局失效为止"""
+        if self._minimum_size is None:
+            left, top, right, bottom = self.getContentsMargins()
+            width = height = 0
+            for item in self._visible_items():
+                size = item.minimumSize()
+                width = max(width, size.width())
+                height = max(height, size.height())
+            self._minimum_size = QSize(width + left + right, height + top + bottom)
+        return QSize(self._minimum_size)
+
+    def setGeometry(self, rect: QRect):
+        """设置布局几何位置，设置了尺寸变化策略时由策略决定何时计算"""
+        policy = self.get_resize_policy()
+        if policy is None:
+            self._apply_geometry(rect)
+        else:
+            policy.request(self, rect)
+
+    def _apply_geometry(self, rect: QRect):
+        """精确计算并设置各项的几何位置"""
+        super().setGeometry(rect)
+        self._scaled = False
+        left, top, right, bottom = self.getContentsMargins()
+        area = rect.adjusted(left, top, -right, -bottom)
+
+        lines = self._solve(area.width())[0]
+        exact = []
+        line_y = area.y()
+        for line, line_height in lines:
+            # 单行时行高撑满容器
+            if len(lines) == 1:
+                line_height = max(line_height, area.height())
+            for item, x, w, h in line:
+                y, h = self._align_item(h, line_height, item.maximumSize().height())
+                geometry = QRect(area.x() + x, line_y + y, w, h)
+                item.setGeometry(geometry)
+                exact.append((item, geometry))
+            line_y += line_height + self._vertical_gutter
+        self._exact_rect = QRect(rect)
+        self._exact_geometry = exact
+
+    def _can_scale(self) -> bool:
+        """是否可以基于上次精确布局做等比缩放"""
+        return self._exact_rect is not None and self._exact_rect.width() > 0
+
+    def _apply_scaled(self, rect: QRect):
+        """按上次精确布局的结果在水平方向等比缩放，不重新求解"""
+        super().setGeometry(rect)
+        self._scaled = True
+        base = self._exact_rect
+        scale = rect.width() / base.width()
+        for item, geometry in self._exact_geometry:
+            x = round((geometry.x() - base.x()) * scale)
+            right = round((geometry.x() + geometry.width() - base.x()) * scale)
+            item.setGeometry(QRect(
+                rect.x() + x, rect.y() + geometry.y() - base.y(), right - x, geometry.height()
+            ))
+
+    def get_resize_policy(self) -> Optional[ResizePolicy]:
+        """获取生效的尺寸变化策略 (未设置时使用最近的祖先 Row 的策略)"""
+        if self._resize_policy is not None:
+            return self._resize_policy
+        widget = self.parentWidget()
+        widget = widget.parentWidget() if widget is not None else None
+        while widget is not None:
+            layout = widget.layout()
+            if isinstance(layout, GridLayout) and layout._resize_policy is not None:
+                return layout._resize_policy
+            widget = widget.parentWidget()
+        return None
+
+    def set_resize_policy(self, policy: Optional[ResizePolicy]):
+        """设置尺寸变化策略，None 表示使用祖先的策略或立即精确布局"""
+        if self._resize_policy is not None and policy is not self._resize_policy:
+            self._resize_policy.flush()
+        self._resize_policy = policy
+
+    def add_grid_item(self, item: GridItem):
+        """添加轻量列布局项，子组件直接成为布局所属组件的子组件"""
+        self.addChildWidget(item.widget())
+        self.addItem(item)
+        self.invalidate()
+
+    def add_grid_items(self, items: List[QLayoutItem]):
+        """批量添加布局项 (GridItem 或组件布局项)，所有项加入后只标记一次重新计算"""
+        for item in items:
+            self.addChildWidget(item.widget())
+        self._items.extend(items)
+        self.invalidate()
+
+    def grid_items(self) -> List[QLayoutItem]:
+        """获取所有栅格列布局项 (GridItem 或包含 Col 的布局项)"""
+        return [
+            item for item in self._items
+            if isinstance(item, GridItem) or hasattr(item.widget(), '_set_breakpoint_index')
+        ]
+
+    # 栅格属性
+    def get_gutter(self) -> Tuple[int, int]:
+        """获取 (水平间距, 垂直间距)"""
+        return self._horizontal_gutter, self._vertical_gutter
+
+    def set_gutter(self, horizontal: int, vertical: int = 0):
+        """设置水平间距和垂直间距"""
+        if (horizontal, vertical) == (self._horizontal_gutter, self._vertical_gutter):
+            return
+        self._horizontal_gutter = horizontal
+        self._vertical_gutter = vertical
+        self.invalidate()
+
+    def get_wrap(self) -> bool:
+        """获取是否自动换行"""
+        return self._wrap
+
+    def set_wrap(self, wrap: bool):
+        """设置是否自动换行"""
+        if wrap == self._wrap:
+            return
+        self._wrap = wrap
+        self.invalidate()
+
+    def get_justify(self) -> str:
+        """获取水平排列方式"""
+        return self._justify
+
+    def set_justify(self, justify: str):
+        """设置水平排列方式"""
+        if justify == self._justify:
+            return
+        self._justify = justify
+        self.invalidate()
+
+    def get_align(self) -> str:
+        """获取垂直对齐方式"""
+        return self._align
+
+    def set_align(self, align: str):
+        """设置垂直对齐方式"""
+        if align == self._align:
+            return
+        self._align = align
+        self.invalidate()
+
+    # 布局计算
+    def _visible_items(self) -> List[QLayoutItem]:
+        """获取参与布局的项 (隐藏的组件不参与)"""
+        return [item for item in self._items if not item.isEmpty()]
+
+    @staticmethod
+    def _item_entry(item: QLayoutItem) -> tuple:
+        """获取布局项的栅格表项"""
+        if isinstance(item, GridItem):
+            return item.get_responsive_entry()
+        get_entry = getattr(item.widget(), 'get_responsive_entry', None)
+        return get_entry() if get_entry is not None else _AUTO_ENTRY
+
+    @staticmethod
+    def _item_flex(item: QLayoutItem) -> Optional[FlexSpec]:
+        """获取布局项的 flex 属性"""
+        if isinstance(item, GridItem):
+            return item.get_flex_spec()
+        get_flex = getattr(item.widget(), 'get_flex_spec', None)
+        return get_flex() if get_flex is not None else None
+
+    def _solve(self, width: int) -> Tuple[list, int]:
+        """
+        求解给定宽度下的布局，结果按宽度缓存
+
+        Returns:
+            ([(行内各项 (item, x, width, height), 行高)], 总高度)
+        """
+        solution = self._solutions.get(width)
+        if solution is not None:
+            return solution
+
+        items = self._visible_items()
+        entries = [self._item_entry(item) for item in items]
+        flexes = [self._item_flex(item) for item in items]
+        auto_widths = [
+            item.sizeHint().width() if entry[0] is None or flex is not None else 0
+            for item, entry, flex in zip(items, entries, flexes)
+        ]
+        gutter = self._horizontal_gutter
+        limits = [
+            (item.minimumSize().width() + gutter, item.maximumSize().width() + gutter)
+            for item in items
+        ]
+
+        lines = []
+        for columns in solve_columns(
+            entries, auto_widths, width, gutter, self._justify, self._wrap, flexes, limits
+        ):
+            line = [(items[index], x, w, self._item_height(items[index], w)) for index, x, w in columns]
+            lines.append((line, max(h for _item, _x, _w, h in line)))
+
+        height = sum(line_height for _line, line_height in lines)
+        height += self._vertical_gutter * max(0, len(lines) - 1)
+
+        if len(self._solutions) >= _SOLUTION_CACHE_SIZE:
+            self._solutions.clear()
+        solution = self._solutions[width] = (lines, height)
+        return solution
+
+    @staticmethod
+    def _item_height(item: QLayoutItem, width: int) -> int:
+        """获取布局项在给定宽度下的高度"""
+        if item.hasHeightForWidth():
+            return item.heightForWidth(width)
+        return item.sizeHint().height()
+
+    def _align_item(self, height: int, line_height: int, maximum_height: int) -> Tuple[int, int]:
+        """按垂直对齐方式计算 (y, height)"""
+        return align_in_line(self._align, height, line_height, maximum_height)
+
+    def _size_from(self, size_of) -> QSize:
+        """根据各项尺寸计算布局尺寸"""
+        left, top, right, bottom = self.getContentsMargins()
+        gutter = self._horizontal_gutter
+
+        # 未设置 span 的列按内容宽度占位，其余列按比例需要的宽度取最大值
+        fixed_width = 0
+        used_units = 0
+        unit_width = 0.0
+        height = 0
+        for item in self._visible_items():
+            span, offset = self._item_entry(item)[:2]
+            size = size_of(item)
+            height = max(height, size.height())
+            used_units += offset
+            if span is None:
+                fixed_width += size.width() + gutter
+            elif span > 0:
+                used_units += span
+                unit_width = max(unit_width, (size.width() + gutter) / span)
+
+        width = max(0, round(fixed_width + unit_width * min(used_units, GRID_COLUMNS)) - gutter)
+        return QSize(width + left + right, height + top + bottom)
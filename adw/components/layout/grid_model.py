@@ -0,0 +1,799 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Ant Design 24 栅格布局模型
+
+不依赖 Qt 的栅格计算核心: 根据 Row/Col 属性和容器宽度计算各列的矩形。
+GridLayout 委托本模块完成计算，也可以在工作线程、子进程或没有显示设备的测试中直接使用。
+"""
+
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
+from adw.styles.breakpoints import Breakpoint, BreakpointManager, BREAKPOINT_ORDER, BREAKPOINT_INDEX
+
+# 可选依赖: 批量求解时使用 NumPy
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+# 栅格总数
+GRID_COLUMNS = 24
+
+# 未设置栅格属性的子组件使用的表项: (span, offset, push, pull, order)
+_AUTO_ENTRY = (None, 0, 0, 0, 0)
+
+# 响应式表中每个断点对应的栅格属性
+_TABLE_FIELDS = ('span', 'offset', 'push', 'pull', 'order')
+
+# 响应式表项: (span, offset, push, pull, order)，span 为 None 表示未设置 (按内容宽度)
+SpanEntry = Tuple[Optional[int], int, int, int, int]
+
+# 支持的水平排列方式
+JUSTIFY_VALUES = ("start", "end", "center", "space-around", "space-between", "space-evenly")
+
+# 支持的垂直对齐方式
+ALIGN_VALUES = ("top", "middle", "bottom", "stretch")
+
+# 浮点累加误差容限
+_EPSILON = 1e-6
+
+# flex 基准值: 200px / 50% / auto
+_BASIS_PATTERN = re.compile(r'^(\d+(?:\.\d+)?)(px|%)$')
+
+# flex 伸缩因子
+_FACTOR_PATTERN = re.compile(r'^\d+(?:\.\d+)?$')
+
+
+class FlexSpec(NamedTuple):
+    """解析后的 flex 属性"""
+    grow: float
+    shrink: float
+    # 基准值，None 表示 auto (按内容宽度)
+    basis: Optional[float] = None
+    # 基准值是否为百分比
+    percent: bool = False
+
+
+@lru_cache(maxsize=256)
+def parse_flex(flex: Union[str, int, float, None]) -> Optional[FlexSpec]:
+    """
+    解析 Ant Design 的 flex 属性，结果按取值缓存
+
+    - 数字 n: 等价于 "n n auto"
+    - "auto": 等价于 "1 1 auto"
+    - "none": 等价于 "0 0 auto"
+    - "200px" / "50%": 等价于 "0 0 200px"
+    - "1 1 200px": 完整的 grow shrink basis 写法，省略部分按 CSS 规则补全
+
+    Args:
+        flex: flex 属性
+
+    Returns:
+        FlexSpec，flex 为 None 时返回 None
+    """
+    if flex is None:
+        return None
+    if isinstance(flex, (int, float)):
+        return FlexSpec(float(flex), float(flex))
+
+    value = flex.strip().lower()
+    if value == "auto":
+        return FlexSpec(1.0, 1.0)
+    if value == "none":
+        return FlexSpec(0.0, 0.0)
+
+    tokens = value.split()
+    factors = []
+    basis: Optional[Tuple[float, bool]] = None
+    for token in tokens:
+        match = _BASIS_PATTERN.match(token)
+        if match is not None and basis is None:
+            basis = (float(match.group(1)), match.group(2) == '%')
+        elif token == "auto" and basis is None:
+            basis = (None, False)
+        elif _FACTOR_PATTERN.match(token) and basis is None and len(factors) < 2:
+            factors.append(float(token))
+        else:
+            raise ValueError(f"Invalid flex value: {flex!r}")
+    if not tokens:
+        raise ValueError(f"Invalid flex value: {flex!r}")
+
+    # 只有基准值时不伸缩，省略基准值时按 CSS 规则为 0%
+    if not factors:
+        return FlexSpec(0.0, 0.0, *basis)
+    if basis is None:
+        basis = (0.0, True)
+    grow = factors[0]
+    shrink = factors[1] if len(factors) > 1 else 1.0
+    return FlexSpec(grow, shrink, *basis)
+
+
+def _outer_bases(
+    entries: Sequence[tuple],
+    auto_widths: Sequence[int],
+    total: float,
+    gutter: int,
+    flexes: Optional[Sequence[Optional[FlexSpec]]]
+) -> List[float]:
+    """计算各列的基准外框宽度 (含 gutter 内边距，不含 offset)"""
+    unit = total / GRID_COLUMNS
+    bases = []
+    for index, (entry, auto_width) in enumerate(zip(entries, auto_widths)):
+        flex = flexes[index] if flexes is not None else None
+        if flex is not None:
+            if flex.basis is None:
+                bases.append(auto_width + gutter)
+            elif flex.percent:
+                bases.append(total * flex.basis / 100)
+            else:
+                bases.append(flex.basis)
+        elif entry[0] is not None:
+            bases.append(entry[0] * unit)
+        else:
+            bases.append(auto_width + gutter)
+    return bases
+
+
+def resolve_flex(
+    bases: Sequence[float],
+    flexes: Sequence[Optional[FlexSpec]],
+    free: float,
+    limits: Optional[Sequence[Tuple[float, float]]] = None
+) -> List[float]:
+    """
+    按 flexbox 规则在一行内分配剩余空间
+
+    span 列不伸缩；未设置 span 的列等价于 "0 1 auto"。违反最小/最大宽度的列被冻结在
+    约束值上，其余列重新分配，通常一次遍历即可完成。
+
+    Args:
+        bases: 各列基准外框宽度
+        flexes: 各列的 FlexSpec，span 列为 None
+        free: 剩余空间 (可以为负)
+        limits: 各列的 (最小外框宽度, 最大外框宽度)
+
+    Returns:
+        各列最终外框宽度
+    """
+    sizes = list(bases)
+    active = [
+        index for index, flex in enumerate(flexes)
+        if flex is not None and (flex.grow > 0 if free > 0 else flex.shrink > 0)
+    ]
+    while active and abs(free) > _EPSILON:
+        if free > 0:
+            weights = [flexes[index].grow for index in active]
+        else:
+            weights = [flexes[index].shrink * bases[index] for index in active]
+        total_weight = sum(weights)
+        if total_weight <= 0:
+            break
+
+        violation = 0.0
+        clamped = {}
+        for index, weight in zip(active, weights):
+            target = bases[index] + free * weight / total_weight
+            if limits is not None:
+                minimum, maximum = limits[index]
+                clamped_target = max(minimum, min(maximum, target))
+                if clamped_target != target:
+                    clamped[index] = clamped_target
+                    violation += clamped_target - target
+            sizes[index] = target
+
+        if not clamped:
+            break
+
+        # 冻结违反约束的列后重新分配
+        freeze = [
+            index for index, value in clamped.items()
+            if violation == 0 or (value > sizes[index]) == (violation > 0)
+        ]
+        for index in freeze:
+            sizes[index] = clamped[index]
+            free -= clamped[index] - bases[index]
+        active = [index for index in active if index not in freeze]
+        if not active:
+            break
+    return sizes
+
+
+def _compile_responsive_table(
+    span: int,
+    offset: int,
+    push: int,
+    pull: int,
+    order: int,
+    responsive: Dict[Breakpoint, Optional[Union[int, Dict[str, Any]]]]
+) -> List[SpanEntry]:
+    """
+    将 xs - xxl 配置编译为按断点索引的 6 项密集表
+
+    与 Ant Design 一致，较大断点未设置的属性继承较小断点 (最终继承基础属性) 的值。
+    基础 span 为 0 表示未设置；响应式 span 为 0 表示在该断点隐藏。
+    """
+    current: list = [span if span > 0 else None, offset, push, pull, order]
+    table = []
+    for bp in BREAKPOINT_ORDER:
+        value = responsive.get(bp)
+        if isinstance(value, int):
+            current[0] = value
+        elif isinstance(value, dict):
+            for index, name in enumerate(_TABLE_FIELDS):
+                if name in value:
+                    current[index] = value[name]
+        table.append(tuple(current))
+    return table
+
+
+def _justify_offsets(justify: str, free: float, count: int) -> Tuple[float, float]:
+    """
+    计算水平排列的起始偏移和列间额外间距
+
+    Args:
+        justify: 水平排列方式
+        free: 剩余空间
+        count: 列数
+
+    Returns:
+        (起始偏移, 列间额外间距)
+    """
+    if free <= 0 or count == 0:
+        return 0.0, 0.0
+    if justify == "end":
+        return free, 0.0
+    if justify == "center":
+        return free / 2, 0.0
+    if justify == "space-between":
+        if count == 1:
+            return 0.0, 0.0
+        return 0.0, free / (count - 1)
+    if justify == "space-around":
+        return free / (count * 2), free / count
+    if justify == "space-evenly":
+        between = free / (count + 1)
+        return between, between
+    return 0.0, 0.0
+
+
+def break_lines(
+    entries: Sequence[tuple],
+    auto_widths: Sequence[int],
+    width: int,
+    gutter: int,
+    flexes: Optional[Sequence[Optional[FlexSpec]]] = None
+) -> List[List[int]]:
+    """
+    计算换行位置
+
+    与 flex-wrap 一致，放不下的列 (含 offset) 移到新的一行，每行至少包含一列
+
+    Args:
+        entries: 按显示顺序排列的 (span, offset, push, pull, order) 表项
+        auto_widths: 未设置 span 的列使用的内容宽度
+        width: 容器宽度
+        gutter: 水平间距
+        flexes: 各列的 FlexSpec，按基准宽度参与换行
+
+    Returns:
+        每行包含的列索引
+    """
+    total = width + gutter
+    unit = total / GRID_COLUMNS
+    bases = _outer_bases(entries, auto_widths, total, gutter, flexes)
+    lines: List[List[int]] = []
+    line: List[int] = []
+    cursor = 0.0
+    for index, (entry, basis) in enumerate(zip(entries, bases)):
+        outer = entry[1] * unit + basis
+        if line and cursor + outer > total + _EPSILON:
+            lines.append(line)
+            line, cursor = [], 0.0
+        line.append(index)
+        cursor += outer
+    if line:
+        lines.append(line)
+    return lines
+
+
+def solve_line(
+    entries: Sequence[tuple],
+    auto_widths: Sequence[int],
+    width: int,
+    gutter: int,
+    justify: str = "start",
+    flexes: Optional[Sequence[Optional[FlexSpec]]] = None,
+    limits: Optional[Sequence[Tuple[float, float]]] = None
+) -> List[Tuple[int, int]]:
+    """
+    计算一行中各列的水平位置
+
+    与 Ant Design 一致，Row 两侧有 -gutter/2 的外边距，每列左右有 gutter/2 的内边距，
+    因此栅格宽度以 width + gutter 为基准，列内容宽度为栅格宽度减去 gutter。
+
+    Args:
+        entries: 按显示顺序排列的 (span, offset, push, pull, order) 表项
+        auto_widths: 未设置 span 的列使用的内容宽度
+        width: 容器宽度
+        gutter: 水平间距
+        justify: 水平排列方式
+        flexes: 各列的 FlexSpec，未设置 flex 的列为 None
+        limits: 各列的 (最小外框宽度, 最大外框宽度)，用于 flex 分配
+
+    Returns:
+        与 entries 对应的 (x, width) 列表，x 相对于容器左边缘
+    """
+    # 只包含 span 列时与批量求解使用相同的编译结果，保证取整一致
+    if is_span_row(entries, flexes):
+        compiled = _compile_span_row(
+            tuple(entry[:4] + (0,) for entry in entries), justify, False
+        )
+        unit = (width + gutter) / GRID_COLUMNS
+        geometry = []
+        for start, end in zip(compiled.starts, compiled.ends):
+            x0 = round(start * unit)
+            geometry.append((x0, max(0, round(end * unit - gutter) - x0)))
+        return geometry
+
+    total = width + gutter
+    unit = total / GRID_COLUMNS
+    outers = _outer_bases(entries, auto_widths, total, gutter, flexes)
+
+    # 存在可伸缩的列时按 flexbox 规则分配剩余空间
+    if (flexes is not None and any(flexes)) or any(entry[0] is None for entry in entries):
+        line_flexes = [
+            (flexes[index] if flexes is not None else None) or
+            (_AUTO_FLEX if entry[0] is None else None)
+            for index, entry in enumerate(entries)
+        ]
+        free = total - sum(outers) - sum(entry[1] for entry in entries) * unit
+        outers = resolve_flex(outers, line_flexes, free, limits)
+
+    boxes = []
+    cursor = 0.0
+    for (_span, offset, push, pull, _order), outer in zip(entries, outers):
+        cursor += offset * unit
+        boxes.append((cursor, outer, (push - pull) * unit))
+        cursor += outer
+
+    start, between = _justify_offsets(justify, width + gutter - cursor, len(boxes))
+
+    geometry = []
+    for index, (left, outer, shift) in enumerate(boxes):
+        x = left + start + index * between + shift
+        x0 = round(x)
+        geometry.append((x0, max(0, round(x + outer - gutter) - x0)))
+    return geometry
+
+
+# 未设置 span 和 flex 的列等价于 CSS 默认的 "0 1 auto"
+_AUTO_FLEX = FlexSpec(0.0, 1.0)
+
+
+def _compile_gutter_table(gutter: Union[int, Dict[str, int], List[int]]) -> List[Tuple[int, int]]:
+    """将 gutter 配置编译为按断点索引的 (水平间距, 垂直间距) 表"""
+    if isinstance(gutter, (list, tuple)):
+        horizontal = gutter[0] if len(gutter) > 0 else 0
+        vertical = gutter[1] if len(gutter) > 1 else 0
+    else:
+        horizontal, vertical = gutter, 0
+
+    def resolve(value) -> List[int]:
+        if isinstance(value, dict):
+            values, current = [], 0
+            for bp in BREAKPOINT_ORDER:
+                current = value.get(bp.value, current)
+                values.append(current)
+            return values
+        return [value or 0] * len(BREAKPOINT_ORDER)
+
+    return list(zip(resolve(horizontal), resolve(vertical)))
+
+
+def solve_columns(
+    entries: Sequence[tuple],
+    auto_widths: Sequence[int],
+    width: int,
+    gutter: int,
+    justify: str = "start",
+    wrap: bool = True,
+    flexes: Optional[Sequence[Optional[FlexSpec]]] = None,
+    limits: Optional[Sequence[Tuple[float, float]]] = None
+) -> List[List[Tuple[int, int, int]]]:
+    """
+    计算一个 Row 中所有列的水平位置
+
+    列按 order 稳定排序后换行 (wrap 为 True 时)，再逐行计算位置
+
+    Args:
+        entries: 参与布局的列的 (span, offset, push, pull, order) 表项
+        auto_widths: 未设置 span 的列使用的内容宽度
+        width: 容器宽度
+        gutter: 水平间距
+        justify: 水平排列方式
+        wrap: 是否自动换行
+        flexes: 各列的 FlexSpec，未设置 flex 的列为 None
+        limits: 各列的 (最小外框宽度, 最大外框宽度)，用于 flex 分配
+
+    Returns:
+        每行的 (列在 entries 中的索引, x, 宽度) 列表
+    """
+    # 只包含 span 列的行使用按签名缓存的编译结果
+    if is_span_row(entries, flexes):
+        return _solve_span_columns(entries, width, gutter, justify, wrap)
+
+    ordered = sorted(range(len(entries)), key=lambda index: entries[index][4])
+    entries = [entries[index] for index in ordered]
+    auto_widths = [auto_widths[index] for index in ordered]
+    if flexes is not None:
+        flexes = [flexes[index] for index in ordered]
+        if not any(flexes):
+            flexes = None
+    if limits is not None:
+        limits = [limits[index] for index in ordered]
+
+    if wrap:
+        breaks = break_lines(entries, auto_widths, width, gutter, flexes)
+    else:
+        breaks = [list(range(len(entries)))] if entries else []
+
+    lines = []
+    for indexes in breaks:
+        geometry = solve_line(
+            [entries[index] for index in indexes],
+            [auto_widths[index] for index in indexes],
+            width, gutter, justify,
+            [flexes[index] for index in indexes] if flexes is not None else None,
+            [limits[index] for index in indexes] if limits is not None else None
+        )
+        lines.append([
+            (ordered[index], x, w) for index, (x, w) in zip(indexes, geometry)
+        ])
+    return lines
+
+
+def align_in_line(align: str, height: int, line_height: int, maximum_height: int) -> Tuple[int, int]:
+    """
+    按垂直对齐方式计算列在行内的位置
+
+    Args:
+        align: 垂直对齐方式
+        height: 列的高度
+        line_height: 行高
+        maximum_height: 列的最大高度 (stretch 时使用)
+
+    Returns:
+        (相对行顶部的 y, 高度)
+    """
+    if align == "stretch":
+        return 0, min(line_height, maximum_height)
+    height = min(height, line_height)
+    if align == "middle":
+        return (line_height - height) // 2, height
+    if align == "bottom":
+        return line_height - height, height
+    return 0, height
+
+
+# 无最大尺寸限制时使用的值 (与 Qt 的 QWIDGETSIZE_MAX 相同)
+_SIZE_MAX = 16777215
+
+
+class Rect(NamedTuple):
+    """列的矩形，坐标相对于 Row 的左上角"""
+    x: int
+    y: int
+    width: int
+    height: int
+
+
+@dataclass
+class ColModel:
+    """
+    列模型
+
+    栅格属性与 Col 相同；width 为未设置 span 或 flex 基准为 auto 时的内容宽度，
+    height 为列高或按列宽计算高度的函数
+    """
+    span: int = 0
+    offset: int = 0
+    pull: int = 0
+    push: int = 0
+    order: int = 0
+    flex: Optional[Union[str, int]] = None
+    xs: Optional[Union[int, Dict[str, Any]]] = None
+    sm: Optional[Union[int, Dict[str, Any]]] = None
+    md: Optional[Union[int, Dict[str, Any]]] = None
+    lg: Optional[Union[int, Dict[str, Any]]] = None
+    xl: Optional[Union[int, Dict[str, Any]]] = None
+    xxl: Optional[Union[int, Dict[str, Any]]] = None
+    width: int = 0
+    height: Union[int, Callable[[int], int]] = 0
+    min_width: int = 0
+    max_width: int = _SIZE_MAX
+    max_height: int = _SIZE_MAX
+
+    def responsive_table(self) -> List[SpanEntry]:
+        """编译按断点索引的 (span, offset, push, pull, order) 表"""
+        return _compile_responsive_table(
+            self.span, self.offset, self.push, self.pull, self.order,
+            {bp: getattr(self, bp.value) for bp in BREAKPOINT_ORDER}
+        )
+
+    def height_for_width(self, width: int) -> int:
+        """获取给定列宽下的高度"""
+        return self.height(width) if callable(self.height) else self.height
+
+
+@dataclass
+class RowModel:
+    """行模型，属性与 Row 相同"""
+    cols: List[ColModel] = field(default_factory=list)
+    gutter: Union[int, Dict[str, int], List[int]] = 0
+    justify: str = "start"
+    align: str = "top"
+    wrap: bool = True
+
+
+class RowLayout(NamedTuple):
+    """Row 的计算结果"""
+    # 与 cols 一一对应，当前断点下隐藏的列为 None
+    rects: List[Optional[Rect]]
+    # 所有行的总高度
+    height: int
+
+
+def layout_row(
+    row: RowModel,
+    width: int,
+    height: int = 0,
+    breakpoint: Optional[Union[Breakpoint, str]] = None
+) -> RowLayout:
+    """
+    计算 Row 中各列的矩形
+
+    Args:
+        row: 行模型
+        width: 容器宽度
+        height: 容器高度，只有一行时行高撑满容器
+        breakpoint: 响应式断点，默认按容器宽度确定
+
+    Returns:
+        RowLayout
+    """
+    if breakpoint is None:
+        breakpoint = BreakpointManager.get_breakpoint_for_width(width)
+    index = BREAKPOINT_INDEX[Breakpoint(breakpoint)]
+    horizontal_gutter, vertical_gutter = _compile_gutter_table(row.gutter)[index]
+
+    visible, entries, flexes = [], [], []
+    for col_index, col in enumerate(row.cols):
+        entry = col.responsive_table()[index]
+        if entry[0] == 0:
+            continue
+        visible.append(col_index)
+        entries.append(entry)
+        flexes.append(parse_flex(col.flex))
+    cols = [row.cols[col_index] for col_index in visible]
+    limits = [
+        (col.min_width + horizontal_gutter, col.max_width + horizontal_gutter) for col in cols
+    ]
+    lines = solve_columns(
+        entries, [col.width for col in cols], width, horizontal_gutter,
+        row.justify, row.wrap, flexes, limits
+    )
+
+    rects: List[Optional[Rect]] = [None] * len(row.cols)
+    y = total = 0
+    for line in lines:
+        heights = [cols[index].height_for_width(w) for index, _x, w in line]
+        line_height = max(heights)
+        total += line_height
+        if len(lines) == 1:
+            line_height = max(line_height, height)
+        for (index, x, w), item_height in zip(line, heights):
+            offset, h = align_in_line(row.align, item_height, line_height, cols[index].max_height)
+            rects[visible[index]] = Rect(x, y + offset, w, h)
+        y += line_height + vertical_gutter
+    total += vertical_gutter * max(0, len(lines) - 1)
+    return RowLayout(rects, total)
+
+
+class _SpanRow(NamedTuple):
+    """只包含 span 列的行的编译结果，位置以栅格单位表示，与容器宽度无关"""
+    # 每列所在的行号，隐藏的列为 -1
+    lines: Tuple[int, ...]
+    # 每列左边缘和右边缘 (含 gutter 内边距) 的栅格单位
+    starts: Tuple[float, ...]
+    ends: Tuple[float, ...]
+
+
+@lru_cache(maxsize=1024)
+def _compile_span_row(entries: Tuple[SpanEntry, ...], justify: str, wrap: bool) -> _SpanRow:
+    """
+    编译只包含 span 列的行
+
+    span 列的换行只取决于栅格单位，列的位置和宽度都与 unit = (width + gutter) / 24 成正比，
+    因此同一签名的行只需编译一次，之后任意宽度下的几何位置都是一次乘法和取整。
+    """
+    count = len(entries)
+    lines = [-1] * count
+    starts = [0.0] * count
+    ends = [0.0] * count
+
+    ordered = sorted(
+        (index for index in range(count) if entries[index][0] != 0),
+        key=lambda index: entries[index][4]
+    )
+    breaks: List[List[int]] = []
+    cursor = 0
+    for index in ordered:
+        span, offset = entries[index][:2]
+        if breaks and (not wrap or cursor + offset + span <= GRID_COLUMNS + _EPSILON):
+            breaks[-1].append(index)
+            cursor += offset + span
+        else:
+            breaks.append([index])
+            cursor = offset + span
+
+    for line_number, indexes in enumerate(breaks):
+        cursor = 0
+        boxes = []
+        for index in indexes:
+            span, offset, push, pull, _order = entries[index]
+            cursor += offset
+            boxes.append((index, cursor, span, push - pull))
+            cursor += span
+        start, between = _justify_offsets(justify, GRID_COLUMNS - cursor, len(boxes))
+        for position, (index, left, span, shift) in enumerate(boxes):
+            lines[index] = line_number
+            starts[index] = left + start + position * between + shift
+            ends[index] = starts[index] + span
+    return _SpanRow(tuple(lines), tuple(starts), tuple(ends))
+
+
+def is_span_row(entries: Sequence[tuple], flexes: Optional[Sequence[Optional[FlexSpec]]] = None) -> bool:
+    """是否为只包含 span 列 (无按内容宽度的列、无 flex 列) 的行"""
+    return all(entry[0] is not None for entry in entries) and not (flexes and any(flexes))
+
+
+def _solve_span_columns(
+    entries: Sequence[tuple],
+    width: int,
+    gutter: int,
+    justify: str,
+    wrap: bool
+) -> List[List[Tuple[int, int, int]]]:
+    """使用编译缓存计算只包含 span 列的行，返回值与 solve_columns 相同"""
+    compiled = _compile_span_row(tuple(entries), justify, wrap)
+    unit = (width + gutter) / GRID_COLUMNS
+    lines: List[List[Tuple[int, int, int]]] = []
+    ordered = sorted(range(len(entries)), key=lambda index: entries[index][4])
+    for index in ordered:
+        line = compiled.lines[index]
+        if line < 0:
+            continue
+        while len(lines) <= line:
+            lines.append([])
+        x = round(compiled.starts[index] * unit)
+        lines[line].append((index, x, max(0, round(compiled.ends[index] * unit - gutter) - x)))
+    return lines
+
+
+class BatchLayout(NamedTuple):
+    """
+    批量求解结果
+
+    使用 NumPy 时为 N x C 的数组 (C 为最大列数，不足的部分 x、width 为 0，line 为 -1)，
+    否则为与输入形状相同的嵌套列表
+    """
+    x: Any
+    width: Any
+    line: Any
+
+
+def solve_span_rows(
+    rows: Sequence[Sequence[SpanEntry]],
+    widths: Union[int, Sequence[int]],
+    gutters: Union[int, Sequence[int]] = 0,
+    justify: str = "start",
+    wrap: bool = True,
+    use_numpy: Optional[bool] = None
+) -> BatchLayout:
+    """
+    批量计算多个只包含 span 列的行
+
+    签名 (表项、justify、wrap) 相同的行共享编译结果，所有行的 x、宽度和所在行号在一次
+    向量运算中得到；没有安装 NumPy 时退回纯 Python 实现，结果相同。span 为 0 的列视为隐藏。
+
+    Args:
+        rows: 每行的 (span, offset, push, pull, order) 表项
+        widths: 每行的容器宽度，或所有行共用的宽度
+        gutters: 每行的水平间距，或所有行共用的间距
+        justify: 水平排列方式
+        wrap: 是否自动换行
+        use_numpy: 是否使用 NumPy，默认在可用时使用
+
+    Returns:
+        BatchLayout
+    """
+    count = len(rows)
+    if isinstance(widths, int):
+        widths = [widths] * count
+    if isinstance(gutters, int):
+        gutters = [gutters] * count
+
+    # 按签名去重编译
+    compiled: List[_SpanRow] = []
+    signature_index: Dict[tuple, int] = {}
+    row_signatures = []
+    for entries in rows:
+        key = tuple(entries)
+        index = signature_index.get(key)
+        if index is None:
+            if not is_span_row(key):
+                raise ValueError("solve_span_rows requires every column to have a span")
+            index = signature_index[key] = len(compiled)
+            compiled.append(_compile_span_row(key, justify, wrap))
+        row_signatures.append(index)
+
+    if use_numpy is None:
+        use_numpy = numpy is not None
+    if use_numpy:
+        return _solve_span_rows_numpy(compiled, row_signatures, widths, gutters)
+
+    # 纯 Python 实现: 签名、宽度和间距都相同的行直接复用结果
+    solved: Dict[Tuple[int, int, int], Tuple[list, list]] = {}
+    xs, ws, lines = [], [], []
+    for signature, width, gutter in zip(row_signatures, widths, gutters):
+        key = (signature, width, gutter)
+        result = solved.get(key)
+        if result is None:
+            row = compiled[signature]
+            unit = (width + gutter) / GRID_COLUMNS
+            x = [round(start * unit) for start in row.starts]
+            w = [
+                max(0, round(end * unit - gutter) - left) if line >= 0 else 0
+                for left, end, line in zip(x, row.ends, row.lines)
+            ]
+            x = [left if line >= 0 else 0 for left, line in zip(x, row.lines)]
+            result = solved[key] = (x, w)
+        xs.append(result[0])
+        ws.append(result[1])
+        lines.append(list(compiled[signature].lines))
+    return BatchLayout(xs, ws, lines)
+
+
+def _solve_span_rows_numpy(
+    compiled: List[_SpanRow],
+    row_signatures: List[int],
+    widths: Sequence[int],
+    gutters: Sequence[int]
+) -> BatchLayout:
+    """solve_span_rows 的 NumPy 实现"""
+    columns = max((len(row.lines) for row in compiled), default=0)
+    starts = numpy.zeros((len(compiled), columns))
+    ends = numpy.zeros((len(compiled), columns))
+    lines = numpy.full((len(compiled), columns), -1, dtype=numpy.int64)
+    for index, row in enumerate(compiled):
+        size = len(row.lines)
+        starts[index, :size] = row.starts
+        ends[index, :size] = row.ends
+        lines[index, :size] = row.lines
+
+    signatures = numpy.asarray(row_signatures, dtype=numpy.int64)
+    gutter = numpy.asarray(gutters, dtype=numpy.float64)[:, None]
+    unit = (numpy.asarray(widths, dtype=numpy.float64)[:, None] + gutter) / GRID_COLUMNS
+    line = lines[signatures]
+    visible = line >= 0
+
+    # numpy.rint 与 round 一样采用四舍六入五成双
+    x = numpy.rint(starts[signatures] * unit)
+    width = numpy.maximum(0, numpy.rint(ends[signatures] * unit - gutter) - x)
+    x = numpy.where(visible, x, 0).astype(numpy.int64)
+    width = numpy.where(visible, width, 0).astype(numpy.int64)
+    return BatchLayout(x, width, line)
@@ -0,0 +1,299 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Ant Design 风格的虚拟栅格容器
+
+只为视口内 (加上预渲染边距) 的行创建 Row，滚出视口的 Row 被回收复用
+"""
+
+from typing import Callable, Dict, List, Optional, Union
+from adw.components.layout.grid import Row
+from adw.common.qt import QAbstractScrollArea, QWidget, Qt
+
+
+# 行工厂: (行索引, 可复用的 Row 或 None) -> Row
+RowFactory = Callable[[int, Optional[Row]], Row]
+
+
+class _HeightIndex:
+    """
+    行高前缀和索引 (树状数组)
+
+    行高的更新、前缀和查询以及按偏移量查找行都是 O(log n)
+    """
+
+    def __init__(self, heights: List[int]):
+        self._size = len(heights)
+        self._heights = list(heights)
+        self._tree = [0] * (self._size + 1)
+        for index, height in enumerate(heights, 1):
+            self._tree[index] += height
+            parent = index + (index & -index)
+            if parent <= self._size:
+                self._tree[parent] += self._tree[index]
+
+    def __len__(self) -> int:
+        return self._size
+
+    def height(self, index: int) -> int:
+        """获取行高"""
+        return self._heights[index]
+
+    def set_height(self, index: int, height: int):
+        """更新行高"""
+        delta = height - self._heights[index]
+        if delta == 0:
+            return
+        self._heights[index] = height
+        index += 1
+        while index <= self._size:
+            self._tree[index] += delta
+            index += index & -index
+
+    def offset(self, index: int) -> int:
+        """获取行的起始偏移 (之前所有行的高度之和)"""
+        total = 0
+        while index > 0:
+            total += self._tree[index]
+            index -= index & -index
+        return total
+
+    def total(self) -> int:
+        """获取总高度"""
+        return self.offset(self._size)
+
+    def index_at(self, offset: int) -> int:
+        """获取覆盖给定偏移的行索引"""
+        if offset <= 0 or self._size == 0:
+            return 0
+        index = 0
+        step = 1 << self._size.bit_length()
+        while step:
+            next_index = index + step
+            if next_index <= self._size and self._tree[next_index] <= offset:
+                index = next_index
+                offset -= self._tree[next_index]
+            step >>= 1
+        return min(index, self._size - 1)
+
+
+class VirtualGrid(QAbstractScrollArea):
+    """
+    虚拟栅格容器
+
+    按需通过工厂创建视口内的 Row，滚出视口的 Row 进入回收池，
+    再次需要时交给工厂重新绑定数据
+    """
+
+    def __init__(
+        self,
+        row_count: int = 0,
+        row_height: Union[int, Callable[[int], int]] = 32,
+        factory: Optional[RowFactory] = None,
+        overscan: int = 200,
+        parent: Optional[QWidget] = None
+    ):
+        """
+        初始化虚拟栅格容器
+
+        Args:
+            row_count: 行数
+            row_height: 行高或行高估算函数 (行索引 -> 高度)，实际高度在行创建后测量修正
+            factory: 行工厂，参数为行索引和可复用的 Row (可能为 None)，返回该行的 Row
+            overscan: 视口上下额外预渲染的像素
+            parent: 父级组件
+        """
+        super().__init__(parent)
+
+        # 存储属性
+        self._row_count = row_count
+        self._row_height = row_height
+        self._factory = factory
+        self._overscan = overscan
+
+        # 已创建的行和回收池
+        self._rows: Dict[int, Row] = {}
+        self._pool: List[Row] = []
+        self._heights = _HeightIndex([])
+        self._updating = False
+
+        # 设置对象名称用于样式
+        self.setObjectName("adw-virtual-grid")
+
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.verticalScrollBar().setSingleStep(20)
+
+        self._rebuild_heights()
+
+    def _rebuild_heights(self):
+        """重建行高索引"""
+        if callable(self._row_height):
+            heights = [self._row_height(index) for index in range(self._row_count)]
+        else:
+            heights = [self._row_height] * self._row_count
+        self._heights = _HeightIndex(heights)
+
+    def _update_scrollbar(self):
+        """更新滚动条范围"""
+        page = self.viewport().height()
+        scrollbar = self.verticalScrollBar()
+        scrollbar.setPageStep(page)
+        scrollbar.setRange(0, max(0, self._heights.total() - page))
+
+    def _release(self, index: int):
+        """回收一行"""
+        row = self._rows.pop(index)
+        row.hide()
+        self._pool.append(row)
+
+    def _materialize(self, index: int) -> Row:
+        """创建或复用一行"""
+        recycled = self._pool.pop() if self._pool else None
+        row = self._factory(index, recycled)
+        if recycled is not None and row is not recycled:
+            # 工厂没有复用时丢弃旧行
+            recycled.deleteLater()
+        if row.parentWidget() is not self.viewport():
+            row.setParent(self.viewport())
+        row.show()
+        return row
+
+    def _update_visible(self):
+        """创建视口内的行，回收视口外的行，并放置所有可见行"""
+        # 更新滚动条范围可能触发滚动，避免重入
+        if self._updating:
+            return
+        self._updating = True
+        try:
+            # 滚动范围缩小会修改滚动位置，此时按新位置重新放置
+            top = None
+            while top != self.verticalScrollBar().value():
+                top = self.verticalScrollBar().value()
+                self._place_rows()
+            # 回收池只保留一屏所需的数量
+            while len(self._pool) > len(self._rows):
+                self._pool.pop().deleteLater()
+        finally:
+            self._updating = False
+
+    def _place_rows(self):
+        """按当前滚动位置放置行"""
+        if self._factory is None or self._row_count == 0:
+            for index in list(self._rows):
+                self._release(index)
+            return
+
+        top = self.verticalScrollBar().value()
+        width = self.viewport().width()
+        bottom = top + self.viewport().height() + self._overscan
+        first = self._heights.index_at(top - self._overscan)
+
+        for index in list(self._rows):
+            if index < first:
+                self._release(index)
+
+        # 创建缺少的行并测量实际高度，直到测量后的偏移到达视口底部 (估算的行高可能偏大或偏小)
+        index = first
+        while index < self._row_count and (index == first or self._heights.offset(index) < bottom):
+            row = self._rows.get(index)
+            if row is None:
+                row = self._rows[index] = self._materialize(index)
+            if row.hasHeightForWidth():
+                height = row.heightForWidth(width)
+            else:
+                height = row.sizeHint().height()
+            self._heights.set_height(index, max(1, height))
+            index += 1
+        last = index - 1
+
+        for index in list(self._rows):
+            if index > last:
+                self._release(index)
+
+        for index in range(first, last + 1):
+            y = self._heights.offset(index) - top
+            self._rows[index].setGeometry(0, y, width, self._heights.height(index))
+
+        self._update_scrollbar()
+
+    def scrollContentsBy(self, dx: int, dy: int):
+        """滚动时更新可见行"""
+        self._update_visible()
+
+    def resizeEvent(self, event):
+        """尺寸变化时更新滚动范围和可见行"""
+        super().resizeEvent(event)
+        self._update_scrollbar()
+        self._update_visible()
+
+    def showEvent(self, event):
+        """显示时创建可见行"""
+        super().showEvent(event)
+        self._update_visible()
+
+    # 公共方法
+    def reset(self):
+        """重新估算行高并重建所有可见行"""
+        for index in list(self._rows):
+            self._release(index)
+        self._rebuild_heights()
+        self._update_scrollbar()
+        self._update_visible()
+
+    def update_row(self, index: int):
+        """数据变化时重新绑定一行 (仅对已创建的行生效)"""
+        row = self._rows.get(index)
+        if row is None:
+            return
+        self._factory(index, row)
+        self._update_visible()
+
+    def scroll_to_row(self, index: int):
+        """滚动到指定行"""
+        index = max(0, min(index, self._row_count - 1))
+        self.verticalScrollBar().setValue(self._heights.offset(index))
+
+    def visible_rows(self) -> Dict[int, Row]:
+        """获取当前已创建的行 (行索引 -> Row)"""
+        return dict(self._rows)
+
+    # 属性的 getter 和 setter 方法
+    def get_row_count(self) -> int:
+        """获取行数"""
+        return self._row_count
+
+    def set_row_count(self, row_count: int):
+        """设置行数"""
+        self._row_count = row_count
+        self.reset()
+
+    def get_row_height(self) -> Union[int, Callable[[int], int]]:
+        """获取行高或行高估算函数"""
+        return self._row_height
+
+    def set_row_height(self, row_height: Union[int, Callable[[int], int]]):
+        """设置行高或行高估算函数"""
+        self._row_height = row_height
+        self.reset()
+
+    def get_factory(self) -> Optional[RowFactory]:
+        """获取行工厂"""
+        return self._factory
+
+    def set_factory(self, factory: Optional[RowFactory]):
+        """设置行工厂"""
+        for row in list(self._rows.values()) + self._pool:
+            row.deleteLater()
+        self._rows.clear()
+        self._pool.clear()
+        self._factory = factory
+        self._update_visible()
+
+    def get_overscan(self) -> int:
+        """获取预渲染边距"""
+        return self._overscan
+
+    def set_overscan(self, overscan: int):
+        """设置预渲染边距"""
+        self._overscan = overscan
+        self._update_visible()
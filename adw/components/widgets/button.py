@@ -8,21 +8,10 @@ from typing import Optional, Callable, Union
 from adw.styles.colors import ColorPalette, ThemeType
 from adw.styles.typography import Typography, TypographyScale
 from adw.styles.spacing import Spacing
-
-# 动态导入 PySide6 或 PyQt6
-try:
-    from PySide6.QtWidgets import QPushButton, QWidget
-    from PySide6.QtCore import Qt, QSize, Signal as pyqtSignal
-    from PySide6.QtGui import QIcon
-    Signal = pyqtSignal
-except ImportError:
-    try:
-        from PyQt6.QtWidgets import QPushButton, QWidget
-        from PyQt6.QtCore import Qt, QSize, pyqtSignal
-        from PyQt6.QtGui import QIcon
-        Signal = pyqtSignal
-    except ImportError:
-        raise ImportError("Requires either PySide6 or PyQt6")
+from adw.styles.cache import StyleCache
+from adw.styles.icons import IconManager
+from adw.i18n import I18nManager
+from adw.common.qt import QPushButton, QWidget, Qt, QSize, QEvent, Signal, QIcon
 
 
 class Button(QPushButton):
@@ -35,6 +24,9 @@ class Button(QPushButton):
     # 点击信号
     clicked_signal = Signal()
 
+    # 按钮类型
+    TYPES = ("default", "primary", "dashed", "text", "link")
+
     def __init__(
         self,
         text: str = "",
@@ -52,6 +44,7 @@ class Button(QPushButton):
         href: Optional[str] = None,
         target: Optional[str] = None,
         on_click: Optional[Callable] = None,
+        text_key: Optional[str] = None,
     ):
         """
         初始化按钮组件
@@ -61,7 +54,7 @@ class Button(QPushButton):
             parent: 父级组件
             type: 按钮类型 (primary, dashed, text, link, default)
             size: 按钮尺寸 (large, middle, small)
-            icon: 图标
+            icon: 图标名称 (见 IconManager.get_names())
             danger: 是否为危险按钮
             disabled: 是否禁用
             loading: 是否加载中
@@ -72,6 +65,7 @@ class Button(QPushButton):
             href: 链接地址
             target: 链接打开方式
             on_click: 点击回调函数
+            text_key: 文本的翻译键 (如 common.submit)，设置后 text 由当前语言的翻译决定
         """
         super().__init__(text, parent)
         
@@ -88,6 +82,7 @@ class Button(QPushButton):
         self._html_type = html_type
         self._href = href
         self._target = target
+        self._text_key = None
         
         # 设置对象名称用于样式
         self.setObjectName(f"adw-button-{type}")
@@ -99,8 +94,17 @@ class Button(QPushButton):
         self.setDisabled(disabled)
         self.set_loading(loading)
         
+        # 设置图标
+        self._update_icon()
+        
+        # 设置翻译文本
+        if text_key:
+            self.set_text_key(text_key)
+        
         # 连接信号
         self.clicked.connect(self._on_clicked)
+        self.pressed.connect(self._update_icon)
+        self.released.connect(self._update_icon)
         if on_click:
             self.clicked_signal.connect(on_click)
 
@@ -119,10 +123,27 @@ class Button(QPushButton):
         if self._block:
             self.setMinimumWidth(200)  # 默认最小宽度
             
+    def paintEvent(self, event):
+        """绘制 (定义在类中，adw.perf 开启后已创建的实例也能统计绘制)"""
+        super().paintEvent(event)
+            
     def _update_style(self):
         """更新按钮样式 - 使用样式系统"""
-        # 获取当前主题设置
-        theme = ColorPalette.get_theme()
+        self.setStyleSheet(self.build_style_sheet(self._type, self._danger, self._ghost, self._loading))
+        
+    @classmethod
+    def build_style_sheet(cls, type: str = "default", danger: bool = False, ghost: bool = False,
+                          loading: bool = False) -> str:
+        """
+        生成按钮样式表
+        
+        结果通过 StyleCache 按主题和变体缓存，同一变体的按钮共享同一个样式表字符串。
+        只读取样式系统，可以在工作线程中调用 (见 adw.common.warmup)。
+        """
+        variant = (type, danger, ghost, loading)
+        style = StyleCache.get_style_sheet("button", variant)
+        if style is not None:
+            return style
         
         # 基础样式
         style = f"""
@@ -155,7 +176,7 @@ class Button(QPushButton):
         """
         
         # 根据类型设置样式
-        if self._type == "primary":
+        if type == "primary":
             style += f"""
             QPushButton {{
                 background-color: {ColorPalette.get_primary_color()};
@@ -182,7 +203,7 @@ class Button(QPushButton):
             }}
             """
             
-        elif self._type == "dashed":
+        elif type == "dashed":
             style += f"""
             QPushButton {{
                 border-style: dashed;
@@ -192,7 +213,7 @@ class Button(QPushButton):
             }}
             """
             
-        elif self._type == "text":
+        elif type == "text":
             style += f"""
             QPushButton {{
                 border: none;
@@ -217,7 +238,7 @@ class Button(QPushButton):
             }}
             """
             
-        elif self._type == "link":
+        elif type == "link":
             style += f"""
             QPushButton {{
                 border: none;
@@ -244,8 +265,8 @@ class Button(QPushButton):
             """
         
         # 危险按钮样式
-        if self._danger:
-            if self._type == "primary":
+        if danger:
+            if type == "primary":
                 style += f"""
                 QPushButton {{
                     background-color: {ColorPalette.get_error_color()};
@@ -295,14 +316,14 @@ class Button(QPushButton):
                 """
         
         # 幽灵按钮样式
-        if self._ghost:
+        if ghost:
             style += """
             QPushButton {
                 background-color: transparent;
             }
             """
             
-            if self._type == "primary":
+            if type == "primary":
                 style += f"""
                 QPushButton {{
                     border-color: {ColorPalette.get_primary_color()};
@@ -322,7 +343,7 @@ class Button(QPushButton):
                 }}
                 """
                 
-            elif self._danger:
+            elif danger:
                 style += f"""
                 QPushButton {{
                     border-color: {ColorPalette.get_error_color()};
@@ -342,15 +363,19 @@ class Button(QPushButton):
                 }}
                 """
         
-        # 加载中状态样式
-        if self._loading:
-            style += """
-            QPushButton {
-                cursor: wait;
-            }
-            """
+        # 加载中状态的光标由 set_loading 通过 setCursor 设置 (样式表不支持 cursor 属性)
             
-        self.setStyleSheet(style)
+        StyleCache.put_style_sheet("button", variant, style)
+        return style
+        
+    @classmethod
+    def get_style_variants(cls):
+        """所有样式变体 (类型, 危险, 幽灵, 加载中)，用于预热样式表缓存"""
+        for type in cls.TYPES:
+            for danger in (False, True):
+                for ghost in (False, True):
+                    for loading in (False, True):
+                        yield type, danger, ghost, loading
         
     def _update_size(self):
         """更新按钮尺寸 - 使用样式系统"""
@@ -395,6 +420,77 @@ class Button(QPushButton):
                 self.setMinimumHeight(32)
                 self.setStyleSheet(self.styleSheet() + "border-radius: 16px;")
                 
+    def _get_icon_size(self) -> int:
+        """图标尺寸与字号一致"""
+        if self._size == "large":
+            return 16
+        if self._size == "small":
+            return 12
+        return 14
+        
+    def _get_icon_color(self) -> str:
+        """按当前状态从调色板中选择图标颜色，与样式表中的文字颜色一致"""
+        if not self.isEnabled():
+            return ColorPalette.get_disabled_text_color()
+        if self.isDown():
+            level = 7
+        elif self.underMouse():
+            level = 5
+        else:
+            level = None
+            
+        if self._type == "primary" and not self._ghost:
+            return "#ffffff"
+        if self._danger:
+            return ColorPalette.get_color('red', level) if level else ColorPalette.get_error_color()
+        if level:
+            return ColorPalette.get_primary_color(level)
+        if self._type in ["primary", "text", "link"]:
+            return ColorPalette.get_primary_color()
+        return ColorPalette.get_text_color()
+        
+    def _update_icon(self):
+        """
+        更新图标
+        
+        图标由 IconManager 光栅化并缓存，状态变化时只查询缓存；首次光栅化在工作线程中进行，
+        完成前显示同样尺寸的透明占位图。
+        """
+        if not self._icon:
+            self.setIcon(QIcon())
+            return
+        size = self._get_icon_size()
+        pixmap = IconManager.request_pixmap(
+            self._icon, size, self._get_icon_color(), self.devicePixelRatioF(), self._on_icon_ready
+        )
+        self.setIcon(QIcon(pixmap))
+        self.setIconSize(QSize(size, size))
+        
+    def _on_icon_ready(self, pixmap):
+        """图标光栅化完成"""
+        self._update_icon()
+        
+    def enterEvent(self, event):
+        """悬停时切换图标颜色"""
+        super().enterEvent(event)
+        self._update_icon()
+        
+    def leaveEvent(self, event):
+        """离开时恢复图标颜色"""
+        super().leaveEvent(event)
+        self._update_icon()
+        
+    def changeEvent(self, event):
+        """启用状态变化时切换图标颜色"""
+        super().changeEvent(event)
+        if event.type() == QEvent.Type.EnabledChange:
+            self._update_icon()
+            
+    def retranslate_ui(self):
+        """按当前语言重新设置文本"""
+        if self._text_key:
+            self.set_text(I18nManager.translate(self._text_key))
+            
     def _on_clicked(self):
         """点击事件处理"""
         if not self._loading and not self._disabled:
@@ -410,6 +506,7 @@ class Button(QPushButton):
         self._type = type
         self.setObjectName(f"adw-button-{type}")
         self._update_style()
+        self._update_icon()
         
     def get_size(self) -> str:
         """获取按钮尺寸"""
@@ -419,10 +516,20 @@ class Button(QPushButton):
         """设置按钮尺寸"""
         self._size = size
         self._update_size()
+        self._update_icon()
         # 如果是圆形按钮，需要重新设置尺寸
         if self._shape == "circle":
             self._update_shape()
             
+    def get_icon(self) -> Optional[str]:
+        """获取图标名称"""
+        return self._icon
+        
+    def set_icon(self, icon: Optional[str]):
+        """设置图标名称"""
+        self._icon = icon
+        self._update_icon()
+        
     def get_danger(self) -> bool:
         """获取危险状态"""
         return self._danger
@@ -431,6 +538,7 @@ class Button(QPushButton):
         """设置危险状态"""
         self._danger = danger
         self._update_style()
+        self._update_icon()
         
     def get_disabled(self) -> bool:
         """获取禁用状态"""
@@ -451,9 +559,9 @@ class Button(QPushButton):
         self._update_style()
         # 设置加载中状态
         if loading:
-            self.setCursor(Qt.WaitCursor)
+            self.setCursor(Qt.CursorShape.WaitCursor)
         else:
-            self.setCursor(Qt.ArrowCursor)
+            self.setCursor(Qt.CursorShape.ArrowCursor)
             
     def get_ghost(self) -> bool:
         """获取幽灵状态"""
@@ -463,6 +571,7 @@ class Button(QPushButton):
         """设置幽灵状态"""
         self._ghost = ghost
         self._update_style()
+        self._update_icon()
         
     def get_block(self) -> bool:
         """获取块级状态"""
@@ -485,6 +594,19 @@ class Button(QPushButton):
         self._shape = shape
         self._update_shape()
         
+    def get_text_key(self) -> Optional[str]:
+        """获取文本的翻译键"""
+        return self._text_key
+        
+    def set_text_key(self, text_key: Optional[str]):
+        """设置文本的翻译键，切换语言时自动重新翻译"""
+        self._text_key = text_key
+        if text_key:
+            I18nManager.register_widget(self)
+            self.retranslate_ui()
+        else:
+            I18nManager.unregister_widget(self)
+            
     def get_text(self) -> str:
         """获取按钮文本"""
         return self.text()
@@ -8,19 +8,9 @@ from typing import Optional, Union
 from adw.styles.colors import ColorPalette
 from adw.styles.typography import Typography, TypographyScale
 from adw.styles.spacing import Spacing
-
-# 动态导入 PySide6 或 PyQt6
-try:
-    from PySide6.QtWidgets import QWidget, QFrame, QHBoxLayout, QVBoxLayout, QLabel
-    from PySide6.QtCore import Qt
-    from PySide6.QtGui import QFont
-except ImportError:
-    try:
-        from PyQt6.QtWidgets import QWidget, QFrame, QHBoxLayout, QVBoxLayout, QLabel
-        from PyQt6.QtCore import Qt
-        from PyQt6.QtGui import QFont
-    except ImportError:
-        raise ImportError("Requires either PySide6 or PyQt6")
+from adw.styles.cache import StyleCache
+from adw.i18n import I18nManager
+from adw.common.qt import QWidget, QFrame, QHBoxLayout, QVBoxLayout, QLabel, Qt, QFont
 
 
 class Divider(QFrame):
@@ -39,6 +29,7 @@ class Divider(QFrame):
         orientation: str = "center",  # left, right, center
         orientation_margin: Optional[Union[int, str]] = None,
         plain: bool = True,
+        text_key: Optional[str] = None,
     ):
         """
         初始化分割线组件
@@ -51,6 +42,7 @@ class Divider(QFrame):
             orientation: 文本位置 (left, right, center)
             orientation_margin: 文本与最近边界的间距
             plain: 文本是否为普通样式
+            text_key: 文本的翻译键，设置后 text 由当前语言的翻译决定
         """
         super().__init__(parent)
         
@@ -61,20 +53,26 @@ class Divider(QFrame):
         self._orientation = orientation
         self._orientation_margin = orientation_margin
         self._plain = plain
+        self._text_key = None
+        self._label = None
         
         # 设置对象名称用于样式
         self.setObjectName(f"adw-divider-{type}")
         
         # 初始化UI
         self._setup_ui()
+        
+        # 设置翻译文本
+        if text_key:
+            self.set_text_key(text_key)
 
     def _setup_ui(self):
         """设置UI样式"""
         if self._type == "horizontal":
-            self.setFrameShape(QFrame.Shape.HLine if hasattr(QFrame, 'Shape') else QFrame.HLine)
+            self.setFrameShape(QFrame.Shape.HLine)
             self.setLayout(QHBoxLayout())
         else:
-            self.setFrameShape(QFrame.Shape.VLine if hasattr(QFrame, 'Shape') else QFrame.VLine)
+            self.setFrameShape(QFrame.Shape.VLine)
             self.setLayout(QVBoxLayout())
             
         # 设置分割线样式
@@ -84,37 +82,40 @@ class Divider(QFrame):
         if self._text and self._type == "horizontal":
             self._setup_text()
             
+    def paintEvent(self, event):
+        """绘制 (定义在类中，adw.perf 开启后已创建的实例也能统计绘制)"""
+        super().paintEvent(event)
+            
     def _update_style(self):
         """更新分割线样式 - 使用样式系统"""
-        # 获取当前主题设置
-        theme = ColorPalette.get_theme()
-        
-        # 基础样式
-        if self._dashed:
-            frame_shape = QFrame.Shape.HLine if hasattr(QFrame, 'Shape') else QFrame.HLine
-            frame_shadow = QFrame.Shadow.Plain if hasattr(QFrame, 'Shadow') else QFrame.Plain
-            if self._type == "vertical":
-                frame_shape = QFrame.Shape.VLine if hasattr(QFrame, 'Shape') else QFrame.VLine
-            # 设置框架样式
-            self.setFrameStyle(frame_shape | frame_shadow)
-            # 设置虚线样式需要通过样式表
-            self.setStyleSheet(f"""
+        frame_shape = QFrame.Shape.VLine if self._type == "vertical" else QFrame.Shape.HLine
+        # 虚线需要通过样式表设置
+        frame_shadow = QFrame.Shadow.Plain if self._dashed else QFrame.Shadow.Sunken
+        # 设置框架样式
+        self.setFrameStyle(frame_shape | frame_shadow)
+        self.setStyleSheet(self.build_style_sheet(self._type, self._dashed))
+        
+    @classmethod
+    def build_style_sheet(cls, type: str = "horizontal", dashed: bool = False) -> str:
+        """
+        生成分割线样式表
+        
+        结果通过 StyleCache 按主题和变体缓存，只读取样式系统，可以在工作线程中调用。
+        """
+        style = StyleCache.get_style_sheet("divider", (type, dashed))
+        if style is not None:
+            return style
+        
+        if dashed:
+            style = f"""
                 QFrame {{
                     color: {ColorPalette.get_border_color()};
                     border-style: dashed;
                     border-width: 1px 0 0 0;
                     margin: {Spacing.get_lg()}px 0;
                 }}
-            """)
+            """
         else:
-            frame_shape = QFrame.Shape.HLine if hasattr(QFrame, 'Shape') else QFrame.HLine
-            frame_shadow = QFrame.Shadow.Sunken if hasattr(QFrame, 'Shadow') else QFrame.Sunken
-            if self._type == "vertical":
-                frame_shape = QFrame.Shape.VLine if hasattr(QFrame, 'Shape') else QFrame.VLine
-            # 设置框架样式
-            self.setFrameStyle(frame_shape | frame_shadow)
-            
-            # 设置样式表
             style = f"""
             QFrame {{
                 color: {ColorPalette.get_border_color()};
@@ -123,21 +124,41 @@ class Divider(QFrame):
             }}
             """
             
-            if self._type == "horizontal":
+            if type == "horizontal":
                 style += f"QFrame {{ margin: {Spacing.get_lg()}px 0; }}"
             else:
                 style += f"QFrame {{ margin: 0 {Spacing.get_sm()}px; }}"
                 
-            self.setStyleSheet(style)
+        StyleCache.put_style_sheet("divider", (type, dashed), style)
+        return style
+        
+    @classmethod
+    def build_label_style_sheet(cls) -> str:
+        """生成文本标签样式表，按主题缓存"""
+        style = StyleCache.get_style_sheet("divider-label")
+        if style is None:
+            style = f"""
+            color: {ColorPalette.get_text_color()};
+            background-color: {ColorPalette.get_background_color()};
+            padding: 0 {Spacing.get_sm()}px;
+        """
+            StyleCache.put_style_sheet("divider-label", (), style)
+        return style
+        
+    @classmethod
+    def get_style_variants(cls):
+        """所有样式变体 (类型, 虚线)，用于预热样式表缓存"""
+        for type in ("horizontal", "vertical"):
+            for dashed in (False, True):
+                yield type, dashed
         
     def _setup_text(self):
         """设置文本显示 - 使用样式系统"""
         # 清除现有布局
-        for i in reversed(range(self.layout().count())): 
-            self.layout().itemAt(i).widget().setParent(None)
+        self._clear_text()
             
         # 创建文本标签
-        label = QLabel(self._text)
+        label = self._label = QLabel(self._text)
         
         # 设置文本样式
         if not self._plain:
@@ -153,11 +174,7 @@ class Divider(QFrame):
             label.setFont(font)
             
         # 设置文本颜色
-        label.setStyleSheet(f"""
-            color: {ColorPalette.get_text_color()};
-            background-color: {ColorPalette.get_background_color()};
-            padding: 0 {Spacing.get_sm()}px;
-        """)
+        label.setStyleSheet(self.build_label_style_sheet())
             
         # 根据对齐方式添加布局
         if self._orientation == "left":
@@ -183,7 +200,40 @@ class Divider(QFrame):
             return int(self._orientation_margin)
         return 0
 
+    def _clear_text(self):
+        """清除文本标签及其两侧的间距"""
+        layout = self.layout()
+        while layout.count():
+            item = layout.takeAt(0)
+            if item.widget() is not None:
+                item.widget().setParent(None)
+        self._label = None
+        
+    def retranslate_ui(self):
+        """按当前语言重新设置文本，已有文本标签时只更新标签文字"""
+        if not self._text_key:
+            return
+        text = I18nManager.translate(self._text_key)
+        if self._label is not None and text:
+            self._text = text
+            self._label.setText(text)
+        else:
+            self.set_text(text)
+            
     # 属性的 getter 和 setter 方法
+    def get_text_key(self) -> Optional[str]:
+        """获取文本的翻译键"""
+        return self._text_key
+        
+    def set_text_key(self, text_key: Optional[str]):
+        """设置文本的翻译键，切换语言时自动重新翻译"""
+        self._text_key = text_key
+        if text_key:
+            I18nManager.register_widget(self)
+            self.retranslate_ui()
+        else:
+            I18nManager.unregister_widget(self)
+            
     def get_text(self) -> Optional[str]:
         """获取文本"""
         return self._text
@@ -195,8 +245,7 @@ class Divider(QFrame):
             self._setup_text()
         else:
             # 清除文本显示
-            for i in reversed(range(self.layout().count())): 
-                self.layout().itemAt(i).widget().setParent(None)
+            self._clear_text()
         
     def get_type(self) -> str:
         """获取分割线类型"""
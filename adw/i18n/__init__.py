@@ -0,0 +1,26 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Ant Design 国际化支持
+"""
+
+from .manager import (
+    I18nManager,
+    build_catalogs,
+    translate,
+    tr,
+    set_locale,
+    get_locale
+)
+from .catalog import Catalog, compile_catalog
+
+__all__ = [
+    'I18nManager',
+    'build_catalogs',
+    'translate',
+    'tr',
+    'set_locale',
+    'get_locale',
+    'Catalog',
+    'compile_catalog'
+]
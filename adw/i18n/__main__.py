@@ -0,0 +1,9 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+编译翻译目录: python -m adw.i18n [-o 输出目录] [语言 ...]
+"""
+
+from adw.i18n.manager import main
+
+main()
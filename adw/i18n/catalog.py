@@ -0,0 +1,168 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+编译后的翻译目录
+
+翻译按命名空间编译为开放寻址的哈希表，整个语言保存为一个可以内存映射的二进制文件。
+打开时只读取命名空间表，某个命名空间的哈希表在第一次查询该命名空间时才定位，
+查询只读取探测到的槽位和对应的字符串。
+"""
+
+import mmap
+import struct
+import zlib
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+# 文件格式:
+#   头部        magic(8s) version(I) namespace_count(I)
+#   命名空间表  namespace_count 项: name_length(H) name(utf-8) section_offset(I)
+#   命名空间段  slot_count(I) entry_count(I)，随后 slot_count 个槽位
+#               槽位: hash(I) key_offset(I) key_length(I) value_offset(I) value_length(I)，key_length 为 0 表示空槽
+#   字符串区    所有键和值的 utf-8 编码
+# 所有偏移都是相对文件起点的绝对偏移，哈希为键 (不含命名空间) 的 CRC32。
+CATALOG_MAGIC = b"ADWI18N\0"
+CATALOG_VERSION = 1
+_HEADER = struct.Struct("<8sII")
+_NAME_LENGTH = struct.Struct("<H")
+_OFFSET = struct.Struct("<I")
+_SECTION = struct.Struct("<II")
+_SLOT = struct.Struct("<IIIII")
+
+# 哈希表装载因子上限
+_LOAD_FACTOR = 0.5
+
+
+def flatten(translations: Dict[str, Union[str, dict]], prefix: str = "") -> Iterator[Tuple[str, str]]:
+    """把嵌套的翻译字典展开为 "a.b.c" 形式的键"""
+    for key, value in translations.items():
+        if isinstance(value, dict):
+            yield from flatten(value, f"{prefix}{key}.")
+        else:
+            yield f"{prefix}{key}", str(value)
+
+
+def compile_catalog(translations: Dict[str, dict]) -> bytes:
+    """
+    编译翻译目录
+
+    Args:
+        translations: {命名空间: {键: 文本或嵌套字典}}
+
+    Returns:
+        编译后的二进制数据
+    """
+    namespaces = [(name.encode("utf-8"), dict(flatten(entries))) for name, entries in translations.items()]
+
+    # 先确定各段的位置，字符串区紧跟在所有段之后
+    position = _HEADER.size + sum(_NAME_LENGTH.size + len(name) + _OFFSET.size for name, _ in namespaces)
+    layouts = []
+    for name, entries in namespaces:
+        slot_count = 1
+        while slot_count * _LOAD_FACTOR < max(1, len(entries)):
+            slot_count *= 2
+        layouts.append((position, slot_count))
+        position += _SECTION.size + slot_count * _SLOT.size
+
+    header = bytearray(_HEADER.pack(CATALOG_MAGIC, CATALOG_VERSION, len(namespaces)))
+    sections = bytearray()
+    strings = bytearray()
+    for (name, entries), (offset, slot_count) in zip(namespaces, layouts):
+        header += _NAME_LENGTH.pack(len(name)) + name + _OFFSET.pack(offset)
+        slots = [None] * slot_count
+        for key, value in entries.items():
+            key_bytes, value_bytes = key.encode("utf-8"), value.encode("utf-8")
+            key_hash = zlib.crc32(key_bytes)
+            index = key_hash & (slot_count - 1)
+            while slots[index] is not None:
+                index = (index + 1) & (slot_count - 1)
+            key_offset = position + len(strings)
+            strings += key_bytes
+            value_offset = position + len(strings)
+            strings += value_bytes
+            slots[index] = (key_hash, key_offset, len(key_bytes), value_offset, len(value_bytes))
+        sections += _SECTION.pack(slot_count, len(entries))
+        for slot in slots:
+            sections += _SLOT.pack(*(slot or (0, 0, 0, 0, 0)))
+    return bytes(header + sections + strings)
+
+
+class Catalog:
+    """
+    编译后的翻译目录
+
+    可以从文件内存映射打开，也可以直接使用内存中的编译结果。
+    """
+
+    def __init__(self, data: Union[bytes, mmap.mmap], source: str = "<memory>"):
+        """
+        初始化翻译目录
+
+        Args:
+            data: 编译后的二进制数据或内存映射
+            source: 来源描述，用于错误信息
+        """
+        self._data = data
+        self._source = source
+        self._namespaces: Dict[str, int] = {}
+        # 已定位的命名空间: (槽位起点, 槽位掩码)
+        self._sections: Dict[str, Tuple[int, int]] = {}
+
+        magic, version, count = _HEADER.unpack_from(data, 0)
+        if magic != CATALOG_MAGIC or version != CATALOG_VERSION:
+            raise ValueError(f"Not a compiled catalog: {source}")
+        position = _HEADER.size
+        for _ in range(count):
+            (length,) = _NAME_LENGTH.unpack_from(data, position)
+            position += _NAME_LENGTH.size
+            name = bytes(data[position:position + length]).decode("utf-8")
+            position += length
+            (self._namespaces[name],) = _OFFSET.unpack_from(data, position)
+            position += _OFFSET.size
+
+    @classmethod
+    def open(cls, path: str) -> "Catalog":
+        """内存映射打开编译后的翻译文件"""
+        with open(path, "rb") as file:
+            return cls(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ), path)
+
+    def get_namespaces(self) -> List[str]:
+        """获取命名空间列表"""
+        return list(self._namespaces)
+
+    def get_loaded_namespaces(self) -> List[str]:
+        """获取已经查询过的命名空间"""
+        return list(self._sections)
+
+    def lookup(self, namespace: str, key: str) -> Optional[str]:
+        """
+        查询翻译
+
+        Args:
+            namespace: 命名空间
+            key: 命名空间内的键
+
+        Returns:
+            翻译文本，不存在时返回 None
+        """
+        section = self._sections.get(namespace)
+        if section is None:
+            offset = self._namespaces.get(namespace)
+            if offset is None:
+                return None
+            slot_count, _ = _SECTION.unpack_from(self._data, offset)
+            section = self._sections[namespace] = (offset + _SECTION.size, slot_count - 1)
+
+        data = self._data
+        base, mask = section
+        key_bytes = key.encode("utf-8")
+        key_hash = zlib.crc32(key_bytes)
+        index = key_hash & mask
+        while True:
+            slot_hash, key_offset, key_length, value_offset, value_length = _SLOT.unpack_from(
+                data, base + index * _SLOT.size
+            )
+            if key_length == 0:
+                return None
+            if slot_hash == key_hash and data[key_offset:key_offset + key_length] == key_bytes:
+                return bytes(data[value_offset:value_offset + value_length]).decode("utf-8")
+            index = (index + 1) & mask
@@ -0,0 +1,45 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+英文翻译
+"""
+
+TRANSLATIONS = {
+    "common": {
+        "ok": "OK",
+        "cancel": "Cancel",
+        "confirm": "Confirm",
+        "submit": "Submit",
+        "reset": "Reset",
+        "search": "Search",
+        "close": "Close",
+        "delete": "Delete",
+        "edit": "Edit",
+        "save": "Save",
+        "add": "Add",
+        "more": "More",
+        "loading": "Loading",
+    },
+    "components": {
+        "button": {
+            "loading": "Loading",
+        },
+        "divider": {
+            "text": "Divider",
+        },
+        "empty": {
+            "description": "No data",
+        },
+    },
+    "dialog": {
+        "confirm_title": "Confirm",
+        "delete_title": "Are you sure you want to delete?",
+        "delete_content": "This cannot be undone",
+    },
+    "validation": {
+        "required": "Please enter {field}",
+        "min_length": "{field} must be at least {min} characters",
+        "max_length": "{field} cannot be longer than {max} characters",
+        "email": "{field} is not a valid email",
+    },
+}
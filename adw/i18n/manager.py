@@ -0,0 +1,304 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+国际化管理
+
+按 "命名空间.键" 查询当前语言的翻译，切换语言时一次性重新翻译所有注册的组件
+"""
+
+import argparse
+import importlib
+import os
+import re
+import weakref
+from typing import Any, Dict, List, Optional
+from adw.i18n.catalog import Catalog, compile_catalog
+
+# 内置翻译目录 (zh_CN.py 等源文件及编译后的 .cat 文件)
+BUILTIN_CATALOG_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# 编译后的翻译文件扩展名
+CATALOG_SUFFIX = ".cat"
+
+# 语言名称，例如 zh_CN、en_US
+_LOCALE_PATTERN = re.compile(r"[a-z]{2,3}(_[A-Z]{2})?")
+
+
+def _merge(target: Dict[str, Any], source: Dict[str, Any]):
+    """把 source 递归合并到 target"""
+    for key, value in source.items():
+        if isinstance(value, dict) and isinstance(target.get(key), dict):
+            _merge(target[key], value)
+        elif isinstance(value, dict):
+            target[key] = {}
+            _merge(target[key], value)
+        else:
+            target[key] = value
+
+
+class I18nManager:
+    """
+    国际化管理器
+
+    每种语言编译为一个按命名空间分段的哈希表 (见 adw.i18n.catalog)。存在编译好的 <语言>.cat 时
+    通过内存映射打开，否则在第一次使用时把源文件编译到内存中；命名空间在第一次查询时才定位，
+    查询结果按语言缓存，切换回之前的语言不需要再次查询目录。
+    """
+
+    # 当前语言与后备语言
+    _locale = "zh_CN"
+    _fallback_locale = "zh_CN"
+
+    # 按顺序查找 <语言>.cat 的目录
+    _catalog_dirs: List[str] = [BUILTIN_CATALOG_DIR]
+    # 通过 add_translations 添加的翻译
+    _extra_translations: Dict[str, Dict[str, Any]] = {}
+
+    # 已打开的目录 (None 表示该语言没有翻译) 与按语言的查询缓存
+    _catalogs: Dict[str, Optional[Catalog]] = {}
+    _caches: Dict[str, Dict[str, str]] = {}
+
+    # 需要在切换语言时重新翻译的组件
+    _widgets: "weakref.WeakSet" = weakref.WeakSet()
+
+    @classmethod
+    def get_locale(cls) -> str:
+        """获取当前语言"""
+        return cls._locale
+
+    @classmethod
+    def set_locale(cls, locale: str):
+        """
+        切换语言
+
+        所有注册的组件在一次批量处理中重新翻译，期间暂停所在窗口的重绘。
+
+        Args:
+            locale: 语言，例如 zh_CN、en_US
+        """
+        if locale == cls._locale:
+            return
+        cls._locale = locale
+        cls.retranslate()
+
+    @classmethod
+    def get_fallback_locale(cls) -> str:
+        """获取后备语言"""
+        return cls._fallback_locale
+
+    @classmethod
+    def set_fallback_locale(cls, locale: str):
+        """设置后备语言 (当前语言缺少某个键时使用)"""
+        cls._fallback_locale = locale
+        cls._caches.clear()
+
+    @classmethod
+    def get_locales(cls) -> List[str]:
+        """获取可用的语言"""
+        locales = set(cls._extra_translations)
+        for directory in cls._catalog_dirs:
+            if not os.path.isdir(directory):
+                continue
+            for entry in os.listdir(directory):
+                name, suffix = os.path.splitext(entry)
+                if suffix in (CATALOG_SUFFIX, ".py") and _LOCALE_PATTERN.fullmatch(name):
+                    locales.add(name)
+        return sorted(locales)
+
+    @classmethod
+    def add_catalog_path(cls, path: str):
+        """添加编译后翻译文件 (<语言>.cat) 的目录，先添加的目录优先于内置目录"""
+        if path not in cls._catalog_dirs:
+            cls._catalog_dirs.insert(len(cls._catalog_dirs) - 1, path)
+            cls._reset()
+
+    @classmethod
+    def add_translations(cls, locale: str, translations: Dict[str, Any]):
+        """
+        添加翻译
+
+        Args:
+            locale: 语言
+            translations: {命名空间: {键: 文本或嵌套字典}}，与已有翻译合并
+        """
+        _merge(cls._extra_translations.setdefault(locale, {}), translations)
+        cls._catalogs.pop(locale, None)
+        cls._caches.clear()
+
+    @classmethod
+    def translate(cls, key: str, **kwargs) -> str:
+        """
+        翻译文本
+
+        Args:
+            key: "命名空间.键"，例如 common.ok
+            **kwargs: 替换文本中的 {参数}
+
+        Returns:
+            翻译文本，当前语言和后备语言都没有时返回 key
+        """
+        cache = cls._caches.get(cls._locale)
+        if cache is None:
+            cache = cls._caches[cls._locale] = {}
+        text = cache.get(key)
+        if text is None:
+            text = cache[key] = cls._resolve(key)
+        return text.format(**kwargs) if kwargs else text
+
+    @classmethod
+    def _resolve(cls, key: str) -> str:
+        """在当前语言和后备语言的目录中查询"""
+        namespace, _, name = key.partition(".")
+        for locale in (cls._locale, cls._fallback_locale):
+            catalog = cls.get_catalog(locale)
+            if catalog is not None:
+                text = catalog.lookup(namespace, name)
+                if text is not None:
+                    return text
+        return key
+
+    @classmethod
+    def get_catalog(cls, locale: str) -> Optional[Catalog]:
+        """获取语言的翻译目录，第一次使用时打开或编译"""
+        if locale in cls._catalogs:
+            return cls._catalogs[locale]
+
+        catalog = None
+        source = cls._find_source(locale)
+        if locale not in cls._extra_translations:
+            for directory in cls._catalog_dirs:
+                path = os.path.join(directory, locale + CATALOG_SUFFIX)
+                # 源文件比编译结果新时忽略编译结果
+                if os.path.isfile(path) and (source is None or os.path.getmtime(path) >= os.path.getmtime(source)):
+                    catalog = Catalog.open(path)
+                    break
+        if catalog is None:
+            translations = cls._load_translations(locale)
+            if translations:
+                catalog = Catalog(compile_catalog(translations), locale)
+        cls._catalogs[locale] = catalog
+        return catalog
+
+    @classmethod
+    def _find_source(cls, locale: str) -> Optional[str]:
+        """内置翻译源文件路径"""
+        path = os.path.join(BUILTIN_CATALOG_DIR, locale + ".py")
+        if _LOCALE_PATTERN.fullmatch(locale) and os.path.isfile(path):
+            return path
+        return None
+
+    @classmethod
+    def _load_translations(cls, locale: str) -> Dict[str, Any]:
+        """读取语言的源翻译 (内置翻译与 add_translations 添加的翻译)"""
+        translations: Dict[str, Any] = {}
+        if cls._find_source(locale) is not None:
+            _merge(translations, importlib.import_module(f"adw.i18n.{locale}").TRANSLATIONS)
+        _merge(translations, cls._extra_translations.get(locale, {}))
+        return translations
+
+    @classmethod
+    def _reset(cls):
+        """丢弃已打开的目录和查询缓存"""
+        cls._catalogs.clear()
+        cls._caches.clear()
+
+    @classmethod
+    def register_widget(cls, widget):
+        """
+        注册组件，切换语言时调用其 retranslate_ui()
+
+        只保存弱引用，组件销毁后自动移除。
+        """
+        cls._widgets.add(widget)
+
+    @classmethod
+    def unregister_widget(cls, widget):
+        """取消注册组件"""
+        cls._widgets.discard(widget)
+
+    @classmethod
+    def get_widget_count(cls) -> int:
+        """获取注册的组件数量"""
+        return len(cls._widgets)
+
+    @classmethod
+    def retranslate(cls):
+        """重新翻译所有注册的组件，期间暂停所在窗口的重绘"""
+        widgets = []
+        windows = {}
+        for widget in list(cls._widgets):
+            try:
+                window = widget.window()
+            except RuntimeError:
+                # Qt 对象已经销毁
+                cls._widgets.discard(widget)
+                continue
+            widgets.append(widget)
+            if window.updatesEnabled():
+                windows[id(window)] = window
+
+        for window in windows.values():
+            window.setUpdatesEnabled(False)
+        try:
+            for widget in widgets:
+                widget.retranslate_ui()
+        finally:
+            for window in windows.values():
+                window.setUpdatesEnabled(True)
+
+
+def build_catalogs(output_dir: Optional[str] = None, locales: Optional[List[str]] = None) -> List[str]:
+    """
+    把内置翻译编译为 <语言>.cat 文件
+
+    Args:
+        output_dir: 输出目录，默认为内置翻译目录
+        locales: 要编译的语言，默认为所有内置语言
+
+    Returns:
+        生成的文件路径
+    """
+    output_dir = output_dir or BUILTIN_CATALOG_DIR
+    if locales is None:
+        locales = [
+            entry[:-3] for entry in sorted(os.listdir(BUILTIN_CATALOG_DIR))
+            if entry.endswith(".py") and _LOCALE_PATTERN.fullmatch(entry[:-3])
+        ]
+    paths = []
+    for locale in locales:
+        path = os.path.join(output_dir, locale + CATALOG_SUFFIX)
+        with open(path, "wb") as file:
+            file.write(compile_catalog(I18nManager._load_translations(locale)))
+        paths.append(path)
+    return paths
+
+
+def main(argv: Optional[List[str]] = None):
+    """命令行入口"""
+    parser = argparse.ArgumentParser(description="编译 ADW 翻译目录")
+    parser.add_argument("locales", nargs="*", help="要编译的语言，默认为所有内置语言")
+    parser.add_argument("-o", "--output", default=None, help="输出目录，默认为 adw/i18n")
+    args = parser.parse_args(argv)
+    for path in build_catalogs(args.output, args.locales or None):
+        print(f"{path}: {os.path.getsize(path)} 字节")
+
+
+# 便捷函数
+def translate(key: str, **kwargs) -> str:
+    """翻译文本"""
+    return I18nManager.translate(key, **kwargs)
+
+
+def tr(key: str, **kwargs) -> str:
+    """translate 的简写"""
+    return I18nManager.translate(key, **kwargs)
+
+
+def set_locale(locale: str):
+    """切换语言"""
+    I18nManager.set_locale(locale)
+
+
+def get_locale() -> str:
+    """获取当前语言"""
+    return I18nManager.get_locale()
@@ -0,0 +1,45 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+简体中文翻译
+"""
+
+TRANSLATIONS = {
+    "common": {
+        "ok": "确定",
+        "cancel": "取消",
+        "confirm": "确认",
+        "submit": "提交",
+        "reset": "重置",
+        "search": "搜索",
+        "close": "关闭",
+        "delete": "删除",
+        "edit": "编辑",
+        "save": "保存",
+        "add": "添加",
+        "more": "更多",
+        "loading": "加载中",
+    },
+    "components": {
+        "button": {
+            "loading": "加载中",
+        },
+        "divider": {
+            "text": "分割线",
+        },
+        "empty": {
+            "description": "暂无数据",
+        },
+    },
+    "dialog": {
+        "confirm_title": "确认",
+        "delete_title": "确定要删除吗？",
+        "delete_content": "删除后无法恢复",
+    },
+    "validation": {
+        "required": "请输入{field}",
+        "min_length": "{field}至少为 {min} 个字符",
+        "max_length": "{field}不能超过 {max} 个字符",
+        "email": "{field}不是有效的邮箱地址",
+    },
+}
@@ -0,0 +1,556 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+性能统计
+
+统计组件热点方法的调用次数和耗时，按类分别记录，并按分类汇总:
+
+- style_build: 生成样式表 (build_style_sheet)
+- style_update: 组件更新自身样式 (_update_style、_apply_style)
+- style_apply: 设置样式表 (setStyleSheet)
+- setup: 初始化界面 (_setup_ui)
+- relayout: 重新布局 (GridLayout 的几何计算、Row 的间距更新)
+- font: 设置字体 (setFont)
+- theme: 切换和应用主题
+- construct: 创建组件 (__init__)
+- layout_request: 布局请求 (Qt 调用 GridLayout.setGeometry)
+- paint: 绘制 (paintEvent)
+
+统计默认关闭。enable() 时把登记的方法替换为计时包装，disable() 时恢复原方法，
+关闭时组件的调用路径与未使用 adw.perf 时完全相同，没有额外开销。耗时包含嵌套调用，
+例如 Button._update_style 的耗时包含其中的 build_style_sheet 和 setStyleSheet:
+
+    import adw
+    adw.perf.enable()
+    ...
+    print(adw.perf.to_json())
+    adw.perf.disable()
+
+start_trace() 在统计的同时把每次调用记录为带组件类名和 objectName 的时间段，保存在有上限的环形缓冲区中，
+save_trace() 导出为 Chrome / Perfetto 的 trace event JSON，可以在 chrome://tracing 或 ui.perfetto.dev 中打开:
+
+    adw.perf.start_trace()
+    window = MainWindow()
+    window.show()
+    QTimer.singleShot(1000, lambda: adw.perf.save_trace("startup.json"))
+
+注意: 开启统计之前已经绑定的方法 (例如连接到信号的 self._update_icon) 不经过包装；
+子类重写了登记的方法且没有调用父类实现时，只统计父类实现被调用的部分；
+PySide6 会为每个组件记住 "没有 Python 实现的虚函数"，因此开启统计之前已经绘制过的组件不会记录 paint。
+"""
+
+import bisect
+import contextlib
+import importlib
+import json
+import os
+import sys
+import threading
+import time
+from collections import deque
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+# 耗时直方图的桶上界 (毫秒)，最后一个桶统计超过最大上界的调用
+HISTOGRAM_BOUNDS_MS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100)
+
+# 与上界比较时使用纳秒，避免每次调用做浮点换算
+_HISTOGRAM_BOUNDS_NS = tuple(int(bound * 1e6) for bound in HISTOGRAM_BOUNDS_MS)
+
+# 分类
+CATEGORIES = (
+    "style_build", "style_update", "style_apply", "setup", "relayout", "font", "theme",
+    "construct", "layout_request", "paint"
+)
+
+# 跟踪缓冲区默认保存的时间段数量，超过后丢弃最早的
+DEFAULT_TRACE_CAPACITY = 100000
+
+# 默认登记的方法 (模块, 类名, 方法名, 分类)
+_DEFAULT_HOOKS = (
+    ("adw.components.widgets.button", "Button", "__init__", "construct"),
+    ("adw.components.widgets.button", "Button", "paintEvent", "paint"),
+    ("adw.components.widgets.button", "Button", "build_style_sheet", "style_build"),
+    ("adw.components.widgets.button", "Button", "_update_style", "style_update"),
+    ("adw.components.widgets.button", "Button", "setStyleSheet", "style_apply"),
+    ("adw.components.widgets.button", "Button", "_setup_ui", "setup"),
+    ("adw.components.widgets.button", "Button", "setFont", "font"),
+    ("adw.components.widgets.divider", "Divider", "__init__", "construct"),
+    ("adw.components.widgets.divider", "Divider", "paintEvent", "paint"),
+    ("adw.components.widgets.divider", "Divider", "build_style_sheet", "style_build"),
+    ("adw.components.widgets.divider", "Divider", "build_label_style_sheet", "style_build"),
+    ("adw.components.widgets.divider", "Divider", "_update_style", "style_update"),
+    ("adw.components.widgets.divider", "Divider", "setStyleSheet", "style_apply"),
+    ("adw.components.widgets.divider", "Divider", "_setup_ui", "setup"),
+    ("adw.components.widgets.divider", "Divider", "setFont", "font"),
+    ("adw.components.layout.grid", "Row", "__init__", "construct"),
+    ("adw.components.layout.grid", "Row", "paintEvent", "paint"),
+    ("adw.components.layout.grid", "Row", "_apply_style", "style_update"),
+    ("adw.components.layout.grid", "Row", "setStyleSheet", "style_apply"),
+    ("adw.components.layout.grid", "Row", "_setup_ui", "setup"),
+    ("adw.components.layout.grid", "Row", "_update_gutter", "relayout"),
+    ("adw.components.layout.grid", "Col", "__init__", "construct"),
+    ("adw.components.layout.grid", "Col", "paintEvent", "paint"),
+    ("adw.components.layout.grid", "Col", "_apply_style", "style_update"),
+    ("adw.components.layout.grid", "Col", "setStyleSheet", "style_apply"),
+    ("adw.components.layout.grid", "Col", "_setup_ui", "setup"),
+    ("adw.components.layout.grid_layout", "GridLayout", "setGeometry", "layout_request"),
+    ("adw.components.layout.grid_layout", "GridLayout", "_apply_geometry", "relayout"),
+    ("adw.styles.theme", "ThemeManager", "build_style_sheet", "style_build"),
+    ("adw.styles.theme", "ThemeManager", "set_theme", "theme"),
+    ("adw.styles.theme", "ThemeManager", "apply_theme_to_widget", "theme"),
+)
+
+
+class _Record:
+    """一个 "类.方法" 的统计"""
+
+    __slots__ = ("category", "count", "total_ns", "min_ns", "max_ns", "histogram")
+
+    def __init__(self, category: str):
+        self.category = category
+        self.count = 0
+        self.total_ns = 0
+        self.min_ns = 0
+        self.max_ns = 0
+        self.histogram = [0] * (len(_HISTOGRAM_BOUNDS_NS) + 1)
+
+    def add(self, elapsed: int):
+        if not self.count or elapsed < self.min_ns:
+            self.min_ns = elapsed
+        if elapsed > self.max_ns:
+            self.max_ns = elapsed
+        self.count += 1
+        self.total_ns += elapsed
+        self.histogram[bisect.bisect_left(_HISTOGRAM_BOUNDS_NS, elapsed)] += 1
+
+    def to_dict(self) -> Dict:
+        return {
+            'category': self.category,
+            'count': self.count,
+            'total_ms': round(self.total_ns / 1e6, 4),
+            'mean_ms': round(self.total_ns / self.count / 1e6, 4) if self.count else 0.0,
+            'min_ms': round(self.min_ns / 1e6, 4),
+            'max_ms': round(self.max_ns / 1e6, 4),
+            'histogram': list(self.histogram),
+        }
+
+
+class PerfMonitor:
+    """
+    性能统计管理器
+
+    登记的方法以 (模块, 类名, 方法名) 描述，开启统计时才导入对应模块并替换方法。
+    统计按调用对象的实际类记录，Button 的子类 MyButton 调用 _update_style 记为 "MyButton._update_style"。
+    """
+
+    _enabled = False
+    _hooks: List[Tuple[str, str, str, str]] = list(_DEFAULT_HOOKS)
+    # {(类, 方法名): 替换前类字典中的值，类字典中原本没有时为 None}
+    _installed: Dict[Tuple[type, str], Optional[object]] = {}
+    # {"类.方法": 统计}
+    _records: Dict[str, _Record] = {}
+    # 样式表可能在工作线程中生成 (见 adw.common.warmup)
+    _lock = threading.Lock()
+    _started = time.time()
+
+    # 跟踪: 环形缓冲区 [(名称, 分类, 开始, 耗时, 线程, 类名, objectName)]，时间为纳秒
+    _tracing = False
+    _trace: deque = deque(maxlen=DEFAULT_TRACE_CAPACITY)
+    _trace_total = 0
+    _trace_origin = 0
+    _thread_names: Dict[int, str] = {}
+    # 跟踪是否由 start_trace 开启了统计，停止跟踪时一并关闭
+    _trace_enabled_hooks = False
+
+    @classmethod
+    def enable(cls):
+        """开启统计"""
+        if cls._enabled:
+            return
+        cls._enabled = True
+        for hook in cls._hooks:
+            cls._install(*hook)
+
+    @classmethod
+    def disable(cls):
+        """关闭统计并恢复所有原方法，已有的统计保留"""
+        cls._enabled = False
+        for (owner, name), original in cls._installed.items():
+            cls._restore(owner, name, original)
+        cls._installed.clear()
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        """是否开启统计"""
+        return cls._enabled
+
+    @classmethod
+    def register_hook(cls, module: str, class_name: str, method: str, category: str):
+        """
+        登记需要统计的方法，已开启统计时立即生效
+
+        Args:
+            module: 类所在的模块，例如 "myapp.widgets"
+            class_name: 类名
+            method: 方法名，可以是普通方法、类方法、静态方法或继承自 Qt 的方法
+            category: 分类 (见 CATEGORIES，也可以使用自定义分类)
+        """
+        hook = (module, class_name, method, category)
+        if hook not in cls._hooks:
+            cls._hooks.append(hook)
+            if cls._enabled:
+                cls._install(*hook)
+
+    @classmethod
+    def unregister_hook(cls, module: str, class_name: str, method: str, category: str):
+        """取消登记，已开启统计时立即恢复原方法"""
+        hook = (module, class_name, method, category)
+        if hook not in cls._hooks:
+            return
+        cls._hooks.remove(hook)
+        owner = getattr(sys.modules.get(module), class_name, None)
+        if (owner, method) in cls._installed:
+            cls._restore(owner, method, cls._installed.pop((owner, method)))
+
+    @classmethod
+    def get_hooks(cls) -> List[Tuple[str, str, str, str]]:
+        """获取登记的方法 (模块, 类名, 方法名, 分类)"""
+        return list(cls._hooks)
+
+    @classmethod
+    def _install(cls, module: str, class_name: str, method: str, category: str):
+        """用计时包装替换方法"""
+        owner = getattr(importlib.import_module(module), class_name)
+        if (owner, method) in cls._installed:
+            return
+        original = owner.__dict__.get(method)
+        if isinstance(original, classmethod):
+            wrapper = classmethod(cls._wrap(original.__func__, method, category))
+        elif isinstance(original, staticmethod):
+            wrapper = staticmethod(cls._wrap(original.__func__, method, category, owner.__name__))
+        else:
+            # 类字典中没有时包装继承来的实现 (例如 QWidget.setStyleSheet)，关闭时删除包装
+            wrapper = cls._wrap(getattr(owner, method), method, category)
+        setattr(owner, method, wrapper)
+        cls._installed[(owner, method)] = original
+
+    @staticmethod
+    def _restore(owner: type, method: str, original: Optional[object]):
+        """恢复原方法"""
+        if original is None:
+            delattr(owner, method)
+        else:
+            setattr(owner, method, original)
+
+    @classmethod
+    def _wrap(cls, function: Callable, method: str, category: str, owner: Optional[str] = None) -> Callable:
+        """生成计时包装，统计键为调用对象的类名 (静态方法为定义的类名) 加方法名"""
+        perf_counter_ns = time.perf_counter_ns
+        record = cls._record
+
+        if owner is not None:
+            key = f"{owner}.{method}"
+
+            def wrapper(*args, **kwargs):
+                start = perf_counter_ns()
+                try:
+                    return function(*args, **kwargs)
+                finally:
+                    record(key, category, start, perf_counter_ns(), None)
+        else:
+            def wrapper(self, *args, **kwargs):
+                start = perf_counter_ns()
+                try:
+                    return function(self, *args, **kwargs)
+                finally:
+                    klass = self if isinstance(self, type) else type(self)
+                    record(f"{klass.__name__}.{method}", category, start, perf_counter_ns(), self)
+
+        wrapper.__name__ = method
+        wrapper.__doc__ = function.__doc__
+        wrapper.__wrapped__ = function
+        return wrapper
+
+    @classmethod
+    def _record(cls, key: str, category: str, start: int, end: int, target: object):
+        """记录一次调用，target 为调用对象 (类方法为类，静态方法为 None)"""
+        with cls._lock:
+            record = cls._records.get(key)
+            if record is None:
+                record = cls._records[key] = _Record(category)
+            record.add(end - start)
+            if cls._tracing:
+                thread = threading.get_ident()
+                if thread not in cls._thread_names:
+                    cls._thread_names[thread] = threading.current_thread().name
+                # 只保存名称，缓冲区不持有组件的引用
+                class_name, object_name = cls._describe(target)
+                cls._trace.append((key, category, start, end - start, thread, class_name, object_name))
+                cls._trace_total += 1
+
+    @staticmethod
+    def _describe(target: object) -> Tuple[Optional[str], str]:
+        """调用对象的类名和 objectName"""
+        if target is None:
+            return None, ""
+        if isinstance(target, type):
+            return target.__name__, ""
+        object_name = getattr(target, "objectName", None)
+        try:
+            # 构造函数中 QObject 尚未初始化，或组件已经被删除时取不到 objectName
+            return type(target).__name__, object_name() if object_name is not None else ""
+        except RuntimeError:
+            return type(target).__name__, ""
+
+    @classmethod
+    def start_trace(cls, capacity: int = DEFAULT_TRACE_CAPACITY):
+        """
+        开始跟踪，清空之前的跟踪记录；尚未开启统计时一并开启
+
+        Args:
+            capacity: 环形缓冲区保存的时间段数量，超过后丢弃最早的
+        """
+        with cls._lock:
+            cls._trace = deque(maxlen=capacity)
+            cls._trace_total = 0
+            cls._trace_origin = time.perf_counter_ns()
+            cls._thread_names = {}
+        if not cls._enabled:
+            cls.enable()
+            cls._trace_enabled_hooks = True
+        cls._tracing = True
+
+    @classmethod
+    def stop_trace(cls):
+        """停止跟踪，记录保留到下次 start_trace；统计由 start_trace 开启时一并关闭"""
+        cls._tracing = False
+        if cls._trace_enabled_hooks:
+            cls._trace_enabled_hooks = False
+            cls.disable()
+
+    @classmethod
+    def is_tracing(cls) -> bool:
+        """是否正在跟踪"""
+        return cls._tracing
+
+    @classmethod
+    def get_trace_info(cls) -> Dict[str, int]:
+        """获取跟踪缓冲区的状态: capacity、events (缓冲区中的时间段数)、dropped (被丢弃的时间段数)"""
+        with cls._lock:
+            events = len(cls._trace)
+            return {'capacity': cls._trace.maxlen, 'events': events, 'dropped': cls._trace_total - events}
+
+    @classmethod
+    def get_trace_events(cls) -> List[Dict]:
+        """
+        获取 trace event 格式的跟踪记录
+
+        每次调用是一个 "X" (完整时间段) 事件，时间单位为微秒，args 中包含组件类名 (class)
+        和 objectName (object_name)；另外包含进程和线程名称的 "M" 事件。
+        """
+        with cls._lock:
+            spans = list(cls._trace)
+            thread_names = dict(cls._thread_names)
+            origin = cls._trace_origin
+        pid = os.getpid()
+        events = [{'name': "process_name", 'ph': "M", 'pid': pid, 'tid': 0, 'args': {'name': "adw"}}]
+        for thread, name in thread_names.items():
+            events.append({'name': "thread_name", 'ph': "M", 'pid': pid, 'tid': thread, 'args': {'name': name}})
+        # 嵌套调用中外层的时间段后结束，按开始时间排序后外层在前
+        spans.sort(key=lambda span: (span[2], -span[3]))
+        for name, category, start, duration, thread, class_name, object_name in spans:
+            args = {}
+            if class_name is not None:
+                args['class'] = class_name
+            if object_name:
+                args['object_name'] = object_name
+            events.append({
+                'name': name,
+                'cat': category,
+                'ph': "X",
+                'ts': (start - origin) / 1000,
+                'dur': duration / 1000,
+                'pid': pid,
+                'tid': thread,
+                'args': args,
+            })
+        return events
+
+    @classmethod
+    def save_trace(cls, path: str):
+        """把跟踪记录保存为 Chrome / Perfetto 可以打开的 JSON 文件"""
+        from adw import __version__
+        trace = {
+            'traceEvents': cls.get_trace_events(),
+            'displayTimeUnit': "ms",
+            'otherData': dict(cls.get_trace_info(), adw=__version__),
+        }
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(trace, file, ensure_ascii=False, separators=(",", ":"))
+
+    @classmethod
+    def reset(cls):
+        """清空统计 (包括 ResizePolicy 的累计计数)"""
+        with cls._lock:
+            cls._records.clear()
+            cls._started = time.time()
+        grid_layout = sys.modules.get("adw.components.layout.grid_layout")
+        if grid_layout is not None:
+            grid_layout.reset_resize_counters()
+
+    @classmethod
+    def snapshot(cls) -> Dict:
+        """
+        获取统计快照
+
+        Returns:
+            - enabled: 是否开启统计
+            - started / time: 统计开始 (或上次 reset) 与快照的时间戳
+            - histogram_bounds_ms: 直方图各桶的上界，histogram 比上界多一个溢出桶
+            - records: {"类.方法": category、count、total_ms、mean_ms、min_ms、max_ms、histogram}
+            - categories: {分类: count、total_ms}
+            - counters: 已加载模块的内置计数 (style_cache: StyleCache，icons: IconManager，
+              resize_policy: 所有 ResizePolicy 自上次 reset 以来的合计)
+            - trace: 跟踪缓冲区的状态 (见 get_trace_info)
+        """
+        with cls._lock:
+            records = {key: record.to_dict() for key, record in sorted(cls._records.items())}
+        categories = {}
+        for record in records.values():
+            total = categories.setdefault(record['category'], {'count': 0, 'total_ms': 0.0})
+            total['count'] += record['count']
+            total['total_ms'] = round(total['total_ms'] + record['total_ms'], 4)
+        return {
+            'enabled': cls._enabled,
+            'started': cls._started,
+            'time': time.time(),
+            'histogram_bounds_ms': list(HISTOGRAM_BOUNDS_MS),
+            'records': records,
+            'categories': categories,
+            'counters': cls._get_builtin_counters(),
+            'trace': cls.get_trace_info(),
+        }
+
+    @staticmethod
+    def _get_builtin_counters() -> Dict[str, Dict[str, int]]:
+        """读取其他模块已有的计数，只读取已经导入的模块，不会因此加载 Qt"""
+        counters = {}
+        cache = sys.modules.get("adw.styles.cache")
+        if cache is not None:
+            counters['style_cache'] = cache.StyleCache.get_counters()
+        icons = sys.modules.get("adw.styles.icons.manager")
+        if icons is not None:
+            counters['icons'] = icons.IconManager.get_counters()
+        grid_layout = sys.modules.get("adw.components.layout.grid_layout")
+        if grid_layout is not None:
+            counters['resize_policy'] = grid_layout.get_resize_counters()
+        return counters
+
+
+# 便捷函数
+def enable():
+    """开启统计"""
+    PerfMonitor.enable()
+
+
+def disable():
+    """关闭统计并恢复原方法"""
+    PerfMonitor.disable()
+
+
+def is_enabled() -> bool:
+    """是否开启统计"""
+    return PerfMonitor.is_enabled()
+
+
+def register_hook(module: str, class_name: str, method: str, category: str):
+    """登记需要统计的方法"""
+    PerfMonitor.register_hook(module, class_name, method, category)
+
+
+def unregister_hook(module: str, class_name: str, method: str, category: str):
+    """取消登记"""
+    PerfMonitor.unregister_hook(module, class_name, method, category)
+
+
+def reset():
+    """清空统计"""
+    PerfMonitor.reset()
+
+
+def snapshot() -> Dict:
+    """获取统计快照"""
+    return PerfMonitor.snapshot()
+
+
+def to_json(indent: Optional[int] = 2) -> str:
+    """以 JSON 字符串导出统计快照"""
+    return json.dumps(snapshot(), ensure_ascii=False, indent=indent)
+
+
+def save(path: str):
+    """把统计快照保存为 JSON 文件"""
+    with open(path, "w", encoding="utf-8") as file:
+        file.write(to_json())
+
+
+@contextlib.contextmanager
+def profiling(reset_records: bool = True) -> Iterator[None]:
+    """
+    在 with 块中开启统计，结束后恢复之前的开关状态
+
+    Args:
+        reset_records: 开始前清空已有统计
+    """
+    if reset_records:
+        reset()
+    enabled = is_enabled()
+    enable()
+    try:
+        yield
+    finally:
+        if not enabled:
+            disable()
+
+
+def start_trace(capacity: int = DEFAULT_TRACE_CAPACITY):
+    """开始跟踪"""
+    PerfMonitor.start_trace(capacity)
+
+
+def stop_trace():
+    """停止跟踪"""
+    PerfMonitor.stop_trace()
+
+
+def is_tracing() -> bool:
+    """是否正在跟踪"""
+    return PerfMonitor.is_tracing()
+
+
+def get_trace_events() -> List[Dict]:
+    """获取 trace event 格式的跟踪记录"""
+    return PerfMonitor.get_trace_events()
+
+
+def save_trace(path: str):
+    """把跟踪记录保存为 Chrome / Perfetto 的 trace event JSON 文件"""
+    PerfMonitor.save_trace(path)
+
+
+@contextlib.contextmanager
+def tracing(path: Optional[str] = None, capacity: int = DEFAULT_TRACE_CAPACITY) -> Iterator[None]:
+    """
+    在 with 块中跟踪，结束时停止跟踪
+
+    Args:
+        path: 结束时保存跟踪记录的文件
+        capacity: 环形缓冲区保存的时间段数量
+    """
+    start_trace(capacity)
+    try:
+        yield
+    finally:
+        stop_trace()
+        if path is not None:
+            save_trace(path)
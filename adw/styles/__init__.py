@@ -4,58 +4,68 @@
 Ant Design 样式系统
 """
 
-from .colors import (
-    ColorPalette,
-    ThemeType,
-    set_theme,
-    get_theme,
-    get_primary_color,
-    get_success_color,
-    get_warning_color,
-    get_error_color,
-    get_info_color
-)
+from adw.common.lazy import lazy_exports
 
-from .typography import (
-    Typography,
-    TypographyScale,
-    FontFamily,
-    FontSettings,
-    get_heading_1_font,
-    get_heading_2_font,
-    get_heading_3_font,
-    get_heading_4_font,
-    get_body_font,
-    get_secondary_font
-)
-
-from .spacing import (
-    Spacing,
-    SpacingScale,
-    get_spacing,
-    get_xs,
-    get_sm,
-    get_md,
-    get_lg,
-    get_xl,
-    get_xxl
-)
-
-from .breakpoints import (
-    Breakpoint,
-    BreakpointManager,
-    get_breakpoint_value,
-    get_media_query
-)
-
-from .theme import (
-    ThemeManager,
-    ThemeSettings,
-    set_theme as set_global_theme,
-    get_theme as get_global_theme,
-    get_theme_settings,
-    apply_theme_to_widget
-)
+# 导出的名称在第一次访问时才导入对应模块，只用到颜色的程序不会加载排版、断点等模块
+__getattr__, __dir__ = lazy_exports(__name__, globals(), {
+    ".colors": (
+        "ColorPalette",
+        "ThemeType",
+        "set_theme",
+        "get_theme",
+        "get_primary_color",
+        "get_success_color",
+        "get_warning_color",
+        "get_error_color",
+        "get_info_color"
+    ),
+    ".typography": (
+        "Typography",
+        "TypographyScale",
+        "FontFamily",
+        "FontSettings",
+        "get_heading_1_font",
+        "get_heading_2_font",
+        "get_heading_3_font",
+        "get_heading_4_font",
+        "get_body_font",
+        "get_secondary_font"
+    ),
+    ".spacing": (
+        "Spacing",
+        "SpacingScale",
+        "get_spacing",
+        "get_xs",
+        "get_sm",
+        "get_md",
+        "get_lg",
+        "get_xl",
+        "get_xxl"
+    ),
+    ".breakpoints": (
+        "Breakpoint",
+        "BreakpointManager",
+        "MediaQuery",
+        "get_breakpoint_value",
+        "get_media_query",
+        "compile_media_query",
+        "match_media_queries",
+        "get_breakpoint_for_width"
+    ),
+    ".theme": (
+        "ThemeManager",
+        "ThemeSettings",
+        "set_theme as set_global_theme",
+        "get_theme as get_global_theme",
+        "get_theme_settings",
+        "apply_theme_to_widget"
+    ),
+    ".cache": (
+        "StyleCache",
+        "save_style_bundle",
+        "clear_style_cache"
+    ),
+})
 
 __all__ = [
     # Colors
@@ -95,8 +105,12 @@ __all__ = [
     # Breakpoints
     'Breakpoint',
     'BreakpointManager',
+    'MediaQuery',
     'get_breakpoint_value',
     'get_media_query',
+    'compile_media_query',
+    'match_media_queries',
+    'get_breakpoint_for_width',
     
     # Theme
     'ThemeManager',
@@ -104,5 +118,10 @@ __all__ = [
     'set_global_theme',
     'get_global_theme',
     'get_theme_settings',
-    'apply_theme_to_widget'
+    'apply_theme_to_widget',
+
+    # Style cache
+    'StyleCache',
+    'save_style_bundle',
+    'clear_style_cache'
 ]
\ No newline at end of file
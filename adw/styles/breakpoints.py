@@ -4,8 +4,9 @@
 Ant Design 响应式断点系统
 """
 
+import re
 from enum import Enum
-from typing import Dict
+from typing import Dict, Iterable, Set, Union
 
 
 class Breakpoint(str, Enum):
@@ -39,9 +40,99 @@ MEDIA_QUERIES = {
 }
 
 
+# 断点顺序 (从小到大)
+BREAKPOINT_ORDER = (
+    Breakpoint.XS,
+    Breakpoint.SM,
+    Breakpoint.MD,
+    Breakpoint.LG,
+    Breakpoint.XL,
+    Breakpoint.XXL
+)
+
+# 断点在顺序中的索引
+BREAKPOINT_INDEX = {bp: index for index, bp in enumerate(BREAKPOINT_ORDER)}
+
+# 无上限时使用的边界值
+_UNBOUNDED = 1 << 30
+
+# 媒体特性表达式: (min-width: 768px)
+_FEATURE_PATTERN = re.compile(
+    r'^\(\s*(min-width|max-width|min-height|max-height|width|height)\s*:\s*(\d+)\s*(px)?\s*\)$'
+)
+
+
+class MediaQuery:
+    """
+    编译后的媒体查询谓词
+
+    所有条件在解析时被折叠为宽高的闭区间，匹配只需四次整数比较
+    """
+
+    __slots__ = ('query', 'min_width', 'max_width', 'min_height', 'max_height')
+
+    def __init__(
+        self,
+        query: str,
+        min_width: int = 0,
+        max_width: int = _UNBOUNDED,
+        min_height: int = 0,
+        max_height: int = _UNBOUNDED
+    ):
+        self.query = query
+        self.min_width = min_width
+        self.max_width = max_width
+        self.min_height = min_height
+        self.max_height = max_height
+
+    def matches(self, width: int, height: int = 0) -> bool:
+        """判断窗口尺寸是否满足查询条件"""
+        return (self.min_width <= width <= self.max_width and
+                self.min_height <= height <= self.max_height)
+
+    __call__ = matches
+
+    def __repr__(self) -> str:
+        return f"MediaQuery({self.query!r})"
+
+
+def _parse_media_query(query: str) -> MediaQuery:
+    """将媒体查询字符串解析为 MediaQuery"""
+    min_width, max_width = 0, _UNBOUNDED
+    min_height, max_height = 0, _UNBOUNDED
+
+    terms = [term.strip() for term in re.split(r'\s+and\s+', query.strip().lower())]
+    for term in terms:
+        # 媒体类型对桌面窗口没有意义，直接忽略
+        if term in ('all', 'screen', 'only screen'):
+            continue
+        match = _FEATURE_PATTERN.match(term)
+        if match is None:
+            raise ValueError(f"Unsupported media query: {query!r}")
+        feature, value = match.group(1), int(match.group(2))
+        if feature == 'min-width':
+            min_width = max(min_width, value)
+        elif feature == 'max-width':
+            max_width = min(max_width, value)
+        elif feature == 'width':
+            min_width, max_width = max(min_width, value), min(max_width, value)
+        elif feature == 'min-height':
+            min_height = max(min_height, value)
+        elif feature == 'max-height':
+            max_height = min(max_height, value)
+        else:  # height
+            min_height, max_height = max(min_height, value), min(max_height, value)
+
+    return MediaQuery(query, min_width, max_width, min_height, max_height)
+
+
 class BreakpointManager:
     """断点管理器"""
     
+    # 已编译的媒体查询缓存
+    _compiled_queries: Dict[str, MediaQuery] = {}
+    
+
     @staticmethod
     def get_breakpoint_value(breakpoint: Breakpoint) -> int:
         """获取断点值"""
@@ -52,6 +143,41 @@ class BreakpointManager:
         """获取媒体查询"""
         return MEDIA_QUERIES.get(breakpoint, '')
     
+    @classmethod
+    def compile_media_query(cls, query: Union[str, Breakpoint]) -> MediaQuery:
+        """编译媒体查询，结果按查询字符串缓存"""
+        if isinstance(query, Breakpoint):
+            query = MEDIA_QUERIES[query]
+        compiled = cls._compiled_queries.get(query)
+        if compiled is None:
+            compiled = _parse_media_query(query)
+            cls._compiled_queries[query] = compiled
+        return compiled
+    
+    @classmethod
+    def match_media_query(cls, query: Union[str, Breakpoint], width: int, height: int = 0) -> bool:
+        """判断窗口尺寸是否满足媒体查询"""
+        return cls.compile_media_query(query).matches(width, height)
+    
+    @classmethod
+    def match_media_queries(
+        cls,
+        queries: Iterable[Union[str, Breakpoint]],
+        width: int,
+        height: int = 0
+    ) -> Set[Union[str, Breakpoint]]:
+        """批量匹配媒体查询，返回满足条件的查询集合"""
+        compile_query = cls.compile_media_query
+        return {query for query in queries if compile_query(query).matches(width, height)}
+    
+    @staticmethod
+    def get_breakpoint_for_width(width: int) -> Breakpoint:
+        """获取窗口宽度对应的断点 (满足条件的最大断点)"""
+        for bp in reversed(BREAKPOINT_ORDER[1:]):
+            if width >= BREAKPOINT_VALUES[bp]:
+                return bp
+        return Breakpoint.XS
+    
     @staticmethod
     def is_mobile() -> bool:
         """是否为移动设备"""
@@ -78,4 +204,20 @@ def get_breakpoint_value(breakpoint: Breakpoint) -> int:
 
 def get_media_query(breakpoint: Breakpoint) -> str:
     """获取媒体查询"""
-    return BreakpointManager.get_media_query(breakpoint)
\ No newline at end of file
+    return BreakpointManager.get_media_query(breakpoint)
+
+def compile_media_query(query: Union[str, Breakpoint]) -> MediaQuery:
+    """编译媒体查询"""
+    return BreakpointManager.compile_media_query(query)
+
+def match_media_queries(
+    queries: Iterable[Union[str, Breakpoint]],
+    width: int,
+    height: int = 0
+) -> Set[Union[str, Breakpoint]]:
+    """批量匹配媒体查询"""
+    return BreakpointManager.match_media_queries(queries, width, height)
+
+def get_breakpoint_for_width(width: int) -> Breakpoint:
+    """获取窗口宽度对应的断点"""
+    return BreakpointManager.get_breakpoint_for_width(width)
\ No newline at end of file
@@ -0,0 +1,286 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+样式表缓存
+
+组件生成的样式表完全由主题令牌和库版本决定。StyleCache 在内存中按 "组件:变体" 保存样式表，
+并可以连同解析后的令牌一起保存为用户缓存目录中的样式包，之后启动时一次读取整个样式包，
+不再重新生成。样式包的文件名由库版本、主题设置和自定义设置的哈希决定，任何一项变化都会换用新的样式包。
+
+缓存目录依次取环境变量 ADW_CACHE_DIR、系统的用户缓存目录 (例如 ~/.cache/adw)；
+设置 ADW_STYLE_CACHE=0 可以禁用样式包。
+"""
+
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import threading
+from dataclasses import asdict
+from typing import Dict, Iterable, Optional
+from adw.styles.colors import ColorPalette
+from adw.styles.theme import ThemeManager
+
+# 样式包格式版本
+BUNDLE_FORMAT = 1
+
+# 样式包文件名前缀与扩展名
+BUNDLE_PREFIX = "styles-"
+BUNDLE_SUFFIX = ".json"
+
+
+def get_default_cache_dir() -> str:
+    """获取默认的用户缓存目录"""
+    path = os.environ.get("ADW_CACHE_DIR")
+    if path:
+        return path
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~\\AppData\\Local")
+        return os.path.join(base, "adw", "Cache")
+    if sys.platform == "darwin":
+        return os.path.expanduser("~/Library/Caches/adw")
+    return os.path.join(os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"), "adw")
+
+
+def _variant_key(component: str, variant: Iterable) -> str:
+    """样式表在样式包中的键，例如 button:primary,True,False,False"""
+    return component + ":" + ",".join(map(str, variant))
+
+
+class StyleCache:
+    """
+    样式表缓存
+
+    内存中的样式表按样式包的哈希分组，切换主题或修改自定义设置后自动使用另一组；
+    某一组第一次被查询时尝试读取对应的样式包。
+    样式包可能在工作线程中保存 (见 adw.common.warmup)，分组、令牌和待保存状态由锁保护。
+    """
+
+    # 缓存目录 (None 表示使用默认目录) 与是否使用样式包
+    _cache_dir: Optional[str] = None
+    _enabled = os.environ.get("ADW_STYLE_CACHE", "1") != "0"
+
+    # 计算当前哈希时的 (主题, 自定义设置版本)，未变化时不重新计算
+    _state = None
+    _key: Optional[str] = None
+
+    # {样式包哈希: {组件:变体: 样式表}}
+    _style_sheets: Dict[str, Dict[str, str]] = {}
+    # {样式包哈希: 令牌}
+    _tokens: Dict[str, Dict[str, str]] = {}
+    # 已经尝试读取样式包的哈希，以及有新样式表尚未保存的哈希
+    _loaded = set()
+    _dirty = set()
+    _lock = threading.RLock()
+
+    _counters = {
+        'hits': 0,
+        'misses': 0,
+        'bundle_loads': 0,
+        'bundle_saves': 0,
+    }
+
+    @classmethod
+    def get_cache_dir(cls) -> str:
+        """获取缓存目录"""
+        return cls._cache_dir or get_default_cache_dir()
+
+    @classmethod
+    def set_cache_dir(cls, path: Optional[str]):
+        """设置缓存目录，None 表示使用默认目录；已读取的样式包会重新读取"""
+        with cls._lock:
+            cls._cache_dir = path
+            cls._loaded.clear()
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        """是否使用样式包"""
+        return cls._enabled
+
+    @classmethod
+    def set_enabled(cls, enabled: bool):
+        """设置是否使用样式包 (只影响读写文件，内存缓存始终有效)"""
+        cls._enabled = enabled
+
+    @classmethod
+    def get_key(cls) -> str:
+        """
+        获取当前样式包的哈希
+
+        由库版本、主题设置和自定义设置决定，只在主题或自定义设置变化后重新计算。
+        """
+        state = (ColorPalette.get_theme(), ThemeManager.get_settings_version())
+        if state != cls._state or cls._key is None:
+            from adw import __version__
+            source = json.dumps({
+                'format': BUNDLE_FORMAT,
+                'version': __version__,
+                'theme': state[0].value,
+                'settings': asdict(ThemeManager.get_theme_settings()),
+                'custom': ThemeManager.get_custom_settings(),
+            }, sort_keys=True, default=repr)
+            cls._key = hashlib.sha256(source.encode("utf-8")).hexdigest()
+            cls._state = state
+        return cls._key
+
+    @classmethod
+    def get_bundle_path(cls, key: Optional[str] = None) -> str:
+        """获取样式包路径"""
+        key = key or cls.get_key()
+        return os.path.join(cls.get_cache_dir(), f"{BUNDLE_PREFIX}{key[:16]}{BUNDLE_SUFFIX}")
+
+    @classmethod
+    def _get_group(cls) -> Dict[str, str]:
+        """当前哈希的样式表，第一次使用时读取样式包 (调用方持有锁)"""
+        key = cls.get_key()
+        group = cls._style_sheets.get(key)
+        if group is None:
+            group = cls._style_sheets[key] = {}
+        if key not in cls._loaded:
+            cls._loaded.add(key)
+            cls._load(key, group)
+        return group
+
+    @classmethod
+    def get_style_sheet(cls, component: str, variant: Iterable = ()) -> Optional[str]:
+        """
+        查询样式表
+
+        Args:
+            component: 组件名称，例如 button
+            variant: 变体，例如 (类型, 危险, 幽灵, 加载中)
+
+        Returns:
+            缓存的样式表，没有时返回 None
+        """
+        with cls._lock:
+            style = cls._get_group().get(_variant_key(component, variant))
+            cls._counters['hits' if style is not None else 'misses'] += 1
+        return style
+
+    @classmethod
+    def put_style_sheet(cls, component: str, variant: Iterable, style: str):
+        """保存生成的样式表"""
+        with cls._lock:
+            cls._get_group()[_variant_key(component, variant)] = style
+            cls._dirty.add(cls.get_key())
+
+    @classmethod
+    def get_tokens(cls) -> Dict[str, str]:
+        """获取当前主题解析后的令牌 (主题设置与中性色)"""
+        with cls._lock:
+            key = cls.get_key()
+            cls._get_group()
+            tokens = cls._tokens.get(key)
+            if tokens is None:
+                tokens = asdict(ThemeManager.get_theme_settings())
+                for name in ('heading', 'text', 'secondary_text', 'disabled_text', 'border', 'divider',
+                             'background', 'card_background'):
+                    tokens[f"palette.{name}"] = getattr(ColorPalette, f"get_{name}_color")()
+                tokens = cls._tokens[key] = {name: str(value) for name, value in tokens.items()}
+                cls._dirty.add(key)
+        return tokens
+
+    @classmethod
+    def _load(cls, key: str, group: Dict[str, str]) -> bool:
+        """读取样式包并合并到内存缓存"""
+        if not cls._enabled:
+            return False
+        try:
+            with open(cls.get_bundle_path(key), "rb") as file:
+                bundle = json.loads(file.read())
+        except (OSError, ValueError):
+            return False
+        if not isinstance(bundle, dict) or bundle.get('key') != key:
+            return False
+        for name, style in bundle.get('style_sheets', {}).items():
+            group.setdefault(name, style)
+        if 'tokens' in bundle:
+            cls._tokens.setdefault(key, bundle['tokens'])
+        cls._counters['bundle_loads'] += 1
+        return True
+
+    @classmethod
+    def save(cls) -> Optional[str]:
+        """
+        把当前哈希的样式表和令牌保存为样式包
+
+        样式包先写入临时文件再替换，多个进程同时保存也不会读到不完整的文件。
+        写入的是加锁时复制的内容，其他线程在写入期间可以继续添加样式表。
+
+        Returns:
+            样式包路径，没有新内容、已禁用或写入失败时返回 None
+        """
+        with cls._lock:
+            key = cls.get_key()
+            if not cls._enabled or key not in cls._dirty:
+                return None
+            bundle = {
+                'format': BUNDLE_FORMAT,
+                'key': key,
+                'tokens': dict(cls.get_tokens()),
+                'style_sheets': dict(cls._get_group()),
+            }
+            # 写入期间新增的样式表会重新标记为待保存
+            cls._dirty.discard(key)
+        path = cls.get_bundle_path(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            descriptor, temporary = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            try:
+                with os.fdopen(descriptor, "w", encoding="utf-8") as file:
+                    json.dump(bundle, file, ensure_ascii=False, separators=(",", ":"))
+                os.replace(temporary, path)
+            except BaseException:
+                os.unlink(temporary)
+                raise
+        except OSError:
+            with cls._lock:
+                cls._dirty.add(key)
+            return None
+        with cls._lock:
+            cls._counters['bundle_saves'] += 1
+        return path
+
+    @classmethod
+    def clear(cls, remove_files: bool = False):
+        """
+        清空内存缓存
+
+        Args:
+            remove_files: 同时删除缓存目录中的样式包
+        """
+        with cls._lock:
+            cls._style_sheets.clear()
+            cls._tokens.clear()
+            cls._loaded.clear()
+            cls._dirty.clear()
+        if remove_files:
+            directory = cls.get_cache_dir()
+            if os.path.isdir(directory):
+                for entry in os.listdir(directory):
+                    if entry.startswith(BUNDLE_PREFIX) and entry.endswith(BUNDLE_SUFFIX):
+                        os.remove(os.path.join(directory, entry))
+
+    @classmethod
+    def get_counters(cls) -> Dict[str, int]:
+        """获取统计: hits、misses、bundle_loads、bundle_saves"""
+        return dict(cls._counters)
+
+    @classmethod
+    def reset_counters(cls):
+        """重置统计"""
+        for name in cls._counters:
+            cls._counters[name] = 0
+
+
+# 便捷函数
+def save_style_bundle() -> Optional[str]:
+    """保存当前主题的样式包"""
+    return StyleCache.save()
+
+
+def clear_style_cache(remove_files: bool = False):
+    """清空样式表缓存"""
+    StyleCache.clear(remove_files)
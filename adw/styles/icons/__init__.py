@@ -0,0 +1,24 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Ant Design 图标系统
+"""
+
+from .manager import (
+    IconManager,
+    BUILTIN_ICON_DIR,
+    parse_color,
+    register_icon,
+    get_icon_pixmap
+)
+from .atlas import IconAtlas, build_atlas
+
+__all__ = [
+    'IconManager',
+    'BUILTIN_ICON_DIR',
+    'parse_color',
+    'register_icon',
+    'get_icon_pixmap',
+    'IconAtlas',
+    'build_atlas'
+]
@@ -0,0 +1,9 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+生成图标图集: python -m adw.styles.icons [--sizes 12,14,16] [--ratios 1,2] [-o 输出文件] [图标目录 ...]
+"""
+
+from adw.styles.icons.atlas import main
+
+main()
@@ -0,0 +1,177 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+图标图集
+
+把图标预先光栅化为 8 位透明度蒙版并打包为一个带索引的文件，运行时通过内存映射读取，
+用到的图标直接在映射内存上构造 QImage，不需要读取和解析 SVG。
+
+生成内置图标的图集:
+    python -m adw.styles.icons [--sizes 12,14,16] [--ratios 1,2] [-o 输出文件] [图标目录 ...]
+"""
+
+import argparse
+import mmap
+import os
+import struct
+from typing import Dict, Iterable, List, Optional, Tuple
+from adw.common.qt import QImage
+
+
+# 文件格式:
+#   头部    magic(8s) version(I) count(I)
+#   索引    count 项: name_length(H) name(utf-8) size(H) ratio_percent(H) width(H) height(H) offset(Q)
+#   数据    每个图块为 width * height 字节的透明度
+ATLAS_MAGIC = b"ADWATLAS"
+ATLAS_VERSION = 1
+_HEADER = struct.Struct("<8sII")
+_ENTRY = struct.Struct("<HHHHQ")
+_NAME_LENGTH = struct.Struct("<H")
+
+# 内置图集位置
+BUILTIN_ATLAS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "icons.atlas")
+
+# 默认打包的尺寸 (与 Button 的图标尺寸一致) 和 devicePixelRatio
+DEFAULT_SIZES = (12, 14, 16, 20, 24)
+DEFAULT_RATIOS = (1.0, 1.25, 1.5, 2.0)
+
+# (名称, 逻辑尺寸, devicePixelRatio 百分比)
+TileKey = Tuple[str, int, int]
+
+
+class IconAtlas:
+    """
+    内存映射的图标图集
+
+    打开时只解析索引，图块在 get_mask 时才从映射内存中切出，返回的 QImage 直接引用映射内存，
+    因此图集在使用期间不能关闭。
+    """
+
+    def __init__(self, path: str):
+        """
+        打开图集
+
+        Args:
+            path: 图集文件路径
+        """
+        self._path = path
+        with open(path, "rb") as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._map)
+        self._index: Dict[TileKey, Tuple[int, int, int]] = {}
+        self._parse_index()
+
+    def _parse_index(self):
+        """解析索引"""
+        magic, version, count = _HEADER.unpack_from(self._map, 0)
+        if magic != ATLAS_MAGIC or version != ATLAS_VERSION:
+            raise ValueError(f"Not an icon atlas: {self._path}")
+        position = _HEADER.size
+        for _ in range(count):
+            (length,) = _NAME_LENGTH.unpack_from(self._map, position)
+            position += _NAME_LENGTH.size
+            name = bytes(self._view[position:position + length]).decode("utf-8")
+            position += length
+            size, ratio, width, height, offset = _ENTRY.unpack_from(self._map, position)
+            position += _ENTRY.size
+            self._index[(name, size, ratio)] = (width, height, offset)
+
+    def get_path(self) -> str:
+        """获取图集文件路径"""
+        return self._path
+
+    def get_names(self) -> List[str]:
+        """获取图集中的图标名称"""
+        return sorted({key[0] for key in self._index})
+
+    def has_tile(self, name: str, size: int, ratio: float = 1.0) -> bool:
+        """图集中是否有该尺寸的图块"""
+        return (name, size, round(ratio * 100)) in self._index
+
+    def get_mask(self, name: str, size: int, ratio: float = 1.0) -> Optional[QImage]:
+        """
+        获取图标蒙版
+
+        Args:
+            name: 图标名称
+            size: 逻辑尺寸
+            ratio: devicePixelRatio
+
+        Returns:
+            直接引用映射内存的 Alpha8 QImage，图集中没有时返回 None
+        """
+        entry = self._index.get((name, size, round(ratio * 100)))
+        if entry is None:
+            return None
+        width, height, offset = entry
+        return QImage(self._view[offset:offset + width * height], width, height, width, QImage.Format.Format_Alpha8)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+
+def build_atlas(
+    output: str,
+    icon_dirs: Optional[Iterable[str]] = None,
+    sizes: Iterable[int] = DEFAULT_SIZES,
+    ratios: Iterable[float] = DEFAULT_RATIOS
+) -> int:
+    """
+    把图标目录中的 SVG 打包为图集
+
+    Args:
+        output: 输出文件路径
+        icon_dirs: 图标目录，默认为内置图标目录；同名图标以先出现的目录为准
+        sizes: 打包的逻辑尺寸
+        ratios: 打包的 devicePixelRatio
+
+    Returns:
+        图块数量
+    """
+    from adw.styles.icons.manager import BUILTIN_ICON_DIR, _rasterize
+
+    sources: Dict[str, bytes] = {}
+    for directory in icon_dirs or [BUILTIN_ICON_DIR]:
+        for entry in sorted(os.listdir(directory)):
+            if entry.endswith(".svg") and entry[:-4] not in sources:
+                with open(os.path.join(directory, entry), "rb") as file:
+                    sources[entry[:-4]] = file.read()
+
+    entries = []
+    data = bytearray()
+    for name, svg in sources.items():
+        for size in sizes:
+            for ratio in ratios:
+                image = _rasterize(svg, size, ratio).convertToFormat(QImage.Format.Format_Alpha8)
+                width, height, line = image.width(), image.height(), image.bytesPerLine()
+                bits = bytes(image.constBits())
+                entries.append((name.encode("utf-8"), size, round(ratio * 100), width, height, len(data)))
+                data += b"".join(bits[row * line:row * line + width] for row in range(height))
+
+    # 索引中的偏移是相对文件起点的绝对偏移
+    base = _HEADER.size + sum(_NAME_LENGTH.size + len(entry[0]) + _ENTRY.size for entry in entries)
+    with open(output, "wb") as file:
+        file.write(_HEADER.pack(ATLAS_MAGIC, ATLAS_VERSION, len(entries)))
+        for name, size, ratio, width, height, offset in entries:
+            file.write(_NAME_LENGTH.pack(len(name)) + name)
+            file.write(_ENTRY.pack(size, ratio, width, height, base + offset))
+        file.write(data)
+    return len(entries)
+
+
+def main(argv: Optional[List[str]] = None):
+    """命令行入口"""
+    parser = argparse.ArgumentParser(description="生成 ADW 图标图集")
+    parser.add_argument("icon_dirs", nargs="*", help="图标目录，默认为内置图标目录")
+    parser.add_argument("-o", "--output", default=BUILTIN_ATLAS_PATH, help="输出文件")
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)), help="逻辑尺寸，逗号分隔")
+    parser.add_argument("--ratios", default=",".join(map(str, DEFAULT_RATIOS)), help="devicePixelRatio，逗号分隔")
+    args = parser.parse_args(argv)
+
+    count = build_atlas(
+        args.output,
+        args.icon_dirs or None,
+        [int(value) for value in args.sizes.split(",")],
+        [float(value) for value in args.ratios.split(",")]
+    )
+    print(f"{args.output}: {count} 个图块, {os.path.getsize(args.output)} 字节")
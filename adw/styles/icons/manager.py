@@ -0,0 +1,461 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Ant Design 图标系统
+
+按名称加载 SVG 图标，每个 (名称, 尺寸, 颜色, devicePixelRatio) 组合只光栅化一次并放入共享缓存；
+存在图标图集 (见 adw.styles.icons.atlas) 时优先从图集中读取预先光栅化的蒙版
+"""
+
+import os
+import re
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple, Union
+from adw.styles.icons.atlas import IconAtlas, BUILTIN_ATLAS_PATH
+from adw.common.qt import (
+    Qt, QObject, QRunnable, QThreadPool, QByteArray, QRectF, QCoreApplication, Signal,
+    QColor, QImage, QPainter, QPixmap, QSvgRenderer
+)
+
+
+# 内置图标目录
+BUILTIN_ICON_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'svg')
+
+# CSS rgba() 颜色写法 (ColorPalette 的中性色使用这种写法)
+_RGBA_PATTERN = re.compile(r'rgba?\(\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*(?:,\s*([\d.]+)\s*)?\)')
+
+# 解析过的颜色 {颜色字符串: QColor}
+_parsed_colors: Dict[str, QColor] = {}
+
+# (名称, 逻辑尺寸, devicePixelRatio)
+MaskKey = Tuple[str, int, float]
+
+
+def parse_color(color: Union[str, QColor]) -> QColor:
+    """
+    解析颜色
+
+    支持 QColor、`#rrggbb` 等 Qt 能识别的写法以及 CSS 的 `rgb()`/`rgba()` 写法，
+    解析结果按字符串缓存
+    """
+    if isinstance(color, QColor):
+        return color
+    result = _parsed_colors.get(color)
+    if result is None:
+        match = _RGBA_PATTERN.fullmatch(color.strip())
+        if match:
+            red, green, blue, alpha = match.groups()
+            result = QColor(int(red), int(green), int(blue))
+            if alpha is not None:
+                result.setAlphaF(float(alpha))
+        else:
+            result = QColor(color)
+        _parsed_colors[color] = result
+    # 返回副本，调用方修改结果不影响缓存
+    return QColor(result)
+
+
+def _rasterize(data: bytes, size: int, ratio: float) -> QImage:
+    """把 SVG 光栅化为覆盖度蒙版 (可以在工作线程中调用)"""
+    pixels = max(1, round(size * ratio))
+    image = QImage(pixels, pixels, QImage.Format.Format_ARGB32_Premultiplied)
+    image.fill(Qt.GlobalColor.transparent)
+    renderer = QSvgRenderer(QByteArray(data))
+    painter = QPainter(image)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    renderer.render(painter, QRectF(0, 0, pixels, pixels))
+    painter.end()
+    return image
+
+
+class _Dispatcher(QObject):
+    """把工作线程的光栅化结果转发到主线程"""
+
+    rasterized = Signal(object, object)
+
+    def __init__(self):
+        super().__init__()
+        self.rasterized.connect(self._on_rasterized)
+
+    def _on_rasterized(self, key, image):
+        IconManager._finish(key, image)
+
+
+class _RasterizeTask(QRunnable):
+    """在线程池中光栅化一个图标蒙版"""
+
+    def __init__(self, key: MaskKey, data: bytes, dispatcher: _Dispatcher):
+        super().__init__()
+        self._key = key
+        self._data = data
+        self._dispatcher = dispatcher
+
+    def run(self):
+        self._dispatcher.rasterized.emit(self._key, _rasterize(self._data, self._key[1], self._key[2]))
+
+
+class IconManager:
+    """
+    图标管理器
+
+    图标先按 (名称, 尺寸, devicePixelRatio) 光栅化为蒙版，再按颜色着色为 QPixmap；蒙版和着色结果
+    都保存在有上限的 LRU 缓存中，所有组件共享。切换悬停、禁用等状态颜色只需要一次缓存查询，
+    数百个使用同一图标的按钮只光栅化一次。
+    """
+
+    # 图标的 SVG 数据 (通过 register 注册或从图标目录读取)
+    _sources: Dict[str, bytes] = {}
+    # 通过 register 注册的图标，不从图集读取
+    _registered = set()
+    # 按顺序查找 <名称>.svg 的目录
+    _search_paths: List[str] = [BUILTIN_ICON_DIR]
+
+    # 缓存上限 (蒙版和着色结果分别计算)
+    _cache_limit = 512
+    _masks: "OrderedDict[MaskKey, QImage]" = OrderedDict()
+    _pixmaps: "OrderedDict[tuple, QPixmap]" = OrderedDict()
+    _placeholders: Dict[Tuple[int, float], QPixmap] = {}
+
+    # 正在光栅化的蒙版及等待结果的回调
+    _pending: Dict[MaskKey, List[Tuple[str, Callable]]] = {}
+    _async = True
+    _dispatcher: Optional[_Dispatcher] = None
+
+    # 图标图集，首次需要蒙版时打开内置图集
+    _atlas = None
+    _atlas_loaded = False
+
+    _counters = dict.fromkeys(('hits', 'misses', 'rasterizations', 'atlas_tiles', 'tints'), 0)
+
+    @classmethod
+    def register(cls, name: str, svg: Union[str, bytes]):
+        """
+        注册图标
+
+        Args:
+            name: 图标名称
+            svg: SVG 文件路径或 SVG 内容
+        """
+        if isinstance(svg, str):
+            if svg.lstrip().startswith('<'):
+                svg = svg.encode('utf-8')
+            else:
+                with open(svg, 'rb') as file:
+                    svg = file.read()
+        cls._sources[name] = svg
+        cls._registered.add(name)
+        cls._drop(name)
+
+    @classmethod
+    def add_search_path(cls, path: str):
+        """添加图标目录，目录中的 <名称>.svg 可以直接按名称使用，先添加的目录优先"""
+        if path not in cls._search_paths:
+            cls._search_paths.insert(len(cls._search_paths) - 1, path)
+
+    @classmethod
+    def get_names(cls) -> List[str]:
+        """获取所有可用的图标名称"""
+        names = set(cls._sources)
+        atlas = cls.get_atlas()
+        if atlas is not None:
+            names.update(atlas.get_names())
+        for path in cls._search_paths:
+            if os.path.isdir(path):
+                names.update(entry[:-4] for entry in os.listdir(path) if entry.endswith('.svg'))
+        return sorted(names)
+
+    @classmethod
+    def has_icon(cls, name: str) -> bool:
+        """是否存在该名称的图标"""
+        if cls._find(name) is not None:
+            return True
+        atlas = cls.get_atlas()
+        return atlas is not None and name in atlas.get_names()
+
+    @classmethod
+    def _find(cls, name: str) -> Optional[bytes]:
+        """查找图标的 SVG 数据"""
+        data = cls._sources.get(name)
+        if data is None:
+            for path in cls._search_paths:
+                filename = os.path.join(path, name + '.svg')
+                if os.path.isfile(filename):
+                    with open(filename, 'rb') as file:
+                        data = cls._sources[name] = file.read()
+                    break
+        return data
+
+    @classmethod
+    def _load(cls, name: str) -> bytes:
+        """读取图标的 SVG 数据，不存在时抛出 ValueError"""
+        data = cls._find(name)
+        if data is None:
+            raise ValueError(f"Unknown icon: {name}")
+        return data
+
+    @classmethod
+    def get_pixmap(cls, name: str, size: int, color: Union[str, QColor], ratio: float = 1.0) -> QPixmap:
+        """
+        获取着色后的图标 (需要时在当前线程同步光栅化)
+
+        Args:
+            name: 图标名称
+            size: 逻辑尺寸 (像素)
+            color: 颜色
+            ratio: devicePixelRatio
+
+        Returns:
+            设置了 devicePixelRatio 的 QPixmap
+        """
+        pixmap = cls._lookup(name, size, color, ratio)
+        if pixmap is not None:
+            return pixmap
+        key = (name, size, ratio)
+        mask = cls._masks.get(key)
+        if mask is None:
+            mask = cls._atlas_mask(key)
+        if mask is None:
+            mask = cls._rasterize_now(key)
+        return cls._tint(key, mask, color)
+
+    @classmethod
+    def request_pixmap(
+        cls,
+        name: str,
+        size: int,
+        color: Union[str, QColor],
+        ratio: float = 1.0,
+        callback: Optional[Callable[[QPixmap], None]] = None
+    ) -> QPixmap:
+        """
+        获取着色后的图标，需要光栅化时在工作线程中进行
+
+        缓存中没有时立即返回同样尺寸的透明占位图，光栅化完成后在主线程中调用 callback。
+        同一个蒙版同时只会有一个光栅化任务。
+
+        Args:
+            name: 图标名称
+            size: 逻辑尺寸 (像素)
+            color: 颜色
+            ratio: devicePixelRatio
+            callback: 光栅化完成后接收 QPixmap 的回调
+
+        Returns:
+            缓存的图标或占位图
+        """
+        pixmap = cls._lookup(name, size, color, ratio)
+        if pixmap is not None:
+            return pixmap
+        key = (name, size, ratio)
+        mask = cls._masks.get(key)
+        if mask is None:
+            mask = cls._atlas_mask(key)
+        if mask is not None:
+            return cls._tint(key, mask, color)
+        if not cls._async or QCoreApplication.instance() is None:
+            return cls._tint(key, cls._rasterize_now(key), color)
+
+        data = cls._load(name)
+        waiters = cls._pending.get(key)
+        if waiters is None:
+            waiters = cls._pending[key] = []
+            if cls._dispatcher is None:
+                cls._dispatcher = _Dispatcher()
+            QThreadPool.globalInstance().start(_RasterizeTask(key, data, cls._dispatcher))
+        if callback is not None:
+            waiters.append((color, callback))
+        return cls.get_placeholder(size, ratio)
+
+    @classmethod
+    def _atlas_mask(cls, key: MaskKey) -> Optional[QImage]:
+        """从图集中读取蒙版并缓存"""
+        if key[0] in cls._registered:
+            return None
+        atlas = cls.get_atlas()
+        if atlas is None:
+            return None
+        mask = atlas.get_mask(*key)
+        if mask is not None:
+            cls._counters['atlas_tiles'] += 1
+            cls._store(cls._masks, key, mask)
+        return mask
+
+    @classmethod
+    def get_atlas(cls) -> Optional[IconAtlas]:
+        """获取使用中的图标图集 (首次调用时打开存在的内置图集)"""
+        if not cls._atlas_loaded:
+            cls._atlas_loaded = True
+            if os.path.isfile(BUILTIN_ATLAS_PATH):
+                cls._atlas = IconAtlas(BUILTIN_ATLAS_PATH)
+        return cls._atlas
+
+    @classmethod
+    def set_atlas(cls, atlas: Optional[Union[IconAtlas, str]]):
+        """
+        设置图标图集
+
+        Args:
+            atlas: IconAtlas、图集文件路径，None 表示不使用图集
+        """
+        if isinstance(atlas, str):
+            atlas = IconAtlas(atlas)
+        cls._atlas = atlas
+        cls._atlas_loaded = True
+        cls.clear_cache()
+
+    @classmethod
+    def _rasterize_now(cls, key: MaskKey) -> QImage:
+        """在当前线程光栅化蒙版并缓存"""
+        mask = _rasterize(cls._load(key[0]), key[1], key[2])
+        cls._counters['rasterizations'] += 1
+        cls._store(cls._masks, key, mask)
+        return mask
+
+    @classmethod
+    def get_placeholder(cls, size: int, ratio: float = 1.0) -> QPixmap:
+        """获取透明占位图"""
+        pixmap = cls._placeholders.get((size, ratio))
+        if pixmap is None:
+            pixels = max(1, round(size * ratio))
+            pixmap = QPixmap(pixels, pixels)
+            pixmap.fill(Qt.GlobalColor.transparent)
+            pixmap.setDevicePixelRatio(ratio)
+            cls._placeholders[(size, ratio)] = pixmap
+        return pixmap
+
+    @classmethod
+    def flush(cls):
+        """等待所有光栅化任务完成并立即调用回调"""
+        if cls._pending:
+            QThreadPool.globalInstance().waitForDone()
+            QCoreApplication.sendPostedEvents(cls._dispatcher, 0)
+
+    @classmethod
+    def is_pending(cls) -> bool:
+        """是否有尚未完成的光栅化任务"""
+        return bool(cls._pending)
+
+    @classmethod
+    def _finish(cls, key: MaskKey, image: QImage):
+        """光栅化完成：缓存蒙版并通知等待的回调"""
+        cls._counters['rasterizations'] += 1
+        cls._store(cls._masks, key, image)
+        for color, callback in cls._pending.pop(key, ()):
+            pixmap = cls._pixmaps.get((key[0], key[1], cls._color_key(color), key[2]))
+            if pixmap is None:
+                pixmap = cls._tint(key, image, color)
+            try:
+                callback(pixmap)
+            except RuntimeError:
+                # 等待结果的组件已经被销毁
+                pass
+
+    @classmethod
+    def _lookup(cls, name: str, size: int, color: Union[str, QColor], ratio: float) -> Optional[QPixmap]:
+        """查询着色结果缓存"""
+        key = (name, size, cls._color_key(color), ratio)
+        pixmap = cls._pixmaps.get(key)
+        if pixmap is None:
+            cls._counters['misses'] += 1
+            return None
+        cls._counters['hits'] += 1
+        cls._pixmaps.move_to_end(key)
+        return pixmap
+
+    @classmethod
+    def _tint(cls, key: MaskKey, mask: QImage, color: Union[str, QColor]) -> QPixmap:
+        """把蒙版着色为 QPixmap 并缓存 (必须在主线程调用)"""
+        image = QImage(mask.size(), QImage.Format.Format_ARGB32_Premultiplied)
+        image.fill(parse_color(color))
+        painter = QPainter(image)
+        painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_DestinationIn)
+        painter.drawImage(0, 0, mask)
+        painter.end()
+        pixmap = QPixmap.fromImage(image)
+        pixmap.setDevicePixelRatio(key[2])
+        cls._counters['tints'] += 1
+        cls._store(cls._pixmaps, (key[0], key[1], cls._color_key(color), key[2]), pixmap)
+        return pixmap
+
+    @staticmethod
+    def _color_key(color: Union[str, QColor]):
+        """颜色的缓存键"""
+        return color.rgba() if isinstance(color, QColor) else color
+
+    @classmethod
+    def _store(cls, cache: OrderedDict, key, value):
+        """写入 LRU 缓存，超过上限时淘汰最久未使用的项"""
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > cls._cache_limit:
+            cache.popitem(last=False)
+
+    @classmethod
+    def _drop(cls, name: str):
+        """丢弃某个图标的所有缓存"""
+        for cache in (cls._masks, cls._pixmaps):
+            for key in [key for key in cache if key[0] == name]:
+                del cache[key]
+
+    @classmethod
+    def clear_cache(cls):
+        """清空蒙版和着色结果缓存"""
+        cls._masks.clear()
+        cls._pixmaps.clear()
+        cls._placeholders.clear()
+
+    @classmethod
+    def get_cache_limit(cls) -> int:
+        """获取缓存上限"""
+        return cls._cache_limit
+
+    @classmethod
+    def set_cache_limit(cls, limit: int):
+        """设置缓存上限 (蒙版和着色结果分别计算)"""
+        cls._cache_limit = max(1, limit)
+        for cache in (cls._masks, cls._pixmaps):
+            while len(cache) > cls._cache_limit:
+                cache.popitem(last=False)
+
+    @classmethod
+    def get_cache_size(cls) -> int:
+        """获取缓存中着色结果的数量"""
+        return len(cls._pixmaps)
+
+    @classmethod
+    def get_async(cls) -> bool:
+        """获取是否在工作线程中光栅化"""
+        return cls._async
+
+    @classmethod
+    def set_async(cls, enabled: bool):
+        """设置是否在工作线程中光栅化，关闭后 request_pixmap 与 get_pixmap 相同"""
+        cls._async = enabled
+
+    @classmethod
+    def get_counters(cls) -> Dict[str, int]:
+        """
+        获取统计计数
+
+        - hits / misses: 着色结果缓存的命中与未命中次数
+        - rasterizations: SVG 光栅化次数
+        - atlas_tiles: 从图集读取的蒙版数量
+        - tints: 着色次数
+        """
+        return dict(cls._counters)
+
+    @classmethod
+    def reset_counters(cls):
+        """重置统计计数"""
+        cls._counters = dict.fromkeys(cls._counters, 0)
+
+
+# 便捷函数
+def register_icon(name: str, svg: Union[str, bytes]):
+    """注册图标"""
+    IconManager.register(name, svg)
+
+
+def get_icon_pixmap(name: str, size: int, color: Union[str, QColor], ratio: float = 1.0) -> QPixmap:
+    """获取着色后的图标"""
+    return IconManager.get_pixmap(name, size, color, ratio)
@@ -46,6 +46,10 @@ class ThemeManager:
     _instance = None
     _current_theme_type = ThemeType.LIGHT
     _custom_settings = {}
+    # 自定义设置的版本，每次修改加一 (样式表缓存据此判断是否需要重新计算哈希)
+    _settings_version = 0
+    # Qt 绑定 (adw.common.qt)，第一次应用主题时导入
+    _qt = None
     
     def __new__(cls):
         if cls._instance is None:
@@ -74,12 +78,23 @@ class ThemeManager:
     def set_custom_setting(cls, key: str, value: Any):
         """设置自定义主题属性"""
         cls._custom_settings[key] = value
+        cls._settings_version += 1
     
     @classmethod
     def get_custom_setting(cls, key: str, default: Any = None):
         """获取自定义主题属性"""
         return cls._custom_settings.get(key, default)
     
+    @classmethod
+    def get_custom_settings(cls) -> Dict[str, Any]:
+        """获取所有自定义主题属性"""
+        return dict(cls._custom_settings)
+    
+    @classmethod
+    def get_settings_version(cls) -> int:
+        """获取自定义设置的版本"""
+        return cls._settings_version
+    
     @classmethod
     def get_theme_settings(cls) -> ThemeSettings:
         """获取当前主题设置"""
@@ -106,17 +121,17 @@ class ThemeManager:
     @classmethod
     def apply_theme_to_widget(cls, widget):
         """应用主题到Qt组件"""
-        try:
-            from PySide6.QtWidgets import QWidget
-            from PySide6.QtGui import QPalette, QColor
-        except ImportError:
+        qt = cls._qt
+        if qt is None:
+            # 样式系统本身不依赖 Qt，第一次应用主题时才导入
             try:
-                from PyQt6.QtWidgets import QWidget
-                from PyQt6.QtGui import QPalette, QColor
+                from adw.common import qt
             except ImportError:
                 return
+            cls._qt = qt
+        QPalette, QColor = qt.QPalette, qt.QColor
         
-        if not isinstance(widget, QWidget):
+        if not isinstance(widget, qt.QWidget):
             return
             
         settings = cls.get_theme_settings()
@@ -140,14 +155,24 @@ class ThemeManager:
         widget.setPalette(palette)
         
         # 设置样式表
-        style_sheet = f"""
+        widget.setStyleSheet(cls.build_style_sheet())
+    
+    @classmethod
+    def build_style_sheet(cls) -> str:
+        """生成组件的主题样式表 (通过 StyleCache 缓存)"""
+        from adw.styles.cache import StyleCache
+        style_sheet = StyleCache.get_style_sheet("theme")
+        if style_sheet is None:
+            settings = cls.get_theme_settings()
+            style_sheet = f"""
         QWidget {{
             background-color: {settings.background_color};
             color: {settings.text_color};
             font-family: {settings.font_family};
         }}
         """
-        widget.setStyleSheet(style_sheet)
+            StyleCache.put_style_sheet("theme", (), style_sheet)
+        return style_sheet
 
 
 # 便利函数
@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+声明式布局构建器基准测试
+
+比较手写 Row.add_col 代码与 LayoutBuilder 构建同一个大型表单的耗时
+
+用法:
+    QT_QPA_PLATFORM=offscreen python benchmarks/bench_builder.py [组件数]
+"""
+
+import sys
+import os
+import time
+
+# 添加项目根目录到 Python 路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+# 动态导入 PySide6 或 PyQt6
+try:
+    from PySide6.QtWidgets import QApplication, QWidget, QLabel, QLineEdit, QVBoxLayout
+except ImportError:
+    from PyQt6.QtWidgets import QApplication, QWidget, QLabel, QLineEdit, QVBoxLayout
+
+from adw.components.layout.grid import Row
+from adw.components.layout.builder import build_layout
+
+
+# 每行的 标签 + 输入框 对数 (每对占 6 格)
+PAIRS_PER_ROW = 4
+
+
+def build_imperative(widgets: int) -> QWidget:
+    """手写代码构建表单"""
+    root = QWidget()
+    layout = QVBoxLayout(root)
+    for row_index in range(widgets // (PAIRS_PER_ROW * 2)):
+        row = Row(gutter=8)
+        for pair in range(PAIRS_PER_ROW):
+            row.add_col(QLabel(f"字段 {row_index}-{pair}"), span=2)
+            row.add_col(QLineEdit(), span=4)
+        layout.addWidget(row)
+    layout.activate()
+    return root
+
+
+def form_spec(widgets: int) -> list:
+    """与 build_imperative 等价的表单描述"""
+    rows = []
+    for row_index in range(widgets // (PAIRS_PER_ROW * 2)):
+        cols = []
+        for pair in range(PAIRS_PER_ROW):
+            cols.append({'span': 2, 'widget': f"字段 {row_index}-{pair}"})
+            cols.append({'span': 4, 'widget': {'component': 'input'}})
+        rows.append({'component': 'row', 'gutter': 8, 'cols': cols})
+    return rows
+
+
+def build_declarative(widgets: int) -> QWidget:
+    """使用 LayoutBuilder 构建表单"""
+    return build_layout(form_spec(widgets))
+
+
+def measure(name: str, build, widgets: int) -> dict:
+    """测量一次构建 (包含首次布局计算)"""
+    start = time.perf_counter()
+    root = build(widgets)
+    elapsed = time.perf_counter() - start
+    result = {
+        'name': name,
+        'widgets': widgets,
+        'time_ms': elapsed * 1000,
+        'created': len(root.findChildren(QWidget)),
+    }
+    root.deleteLater()
+    QApplication.processEvents()
+    return result
+
+
+def main():
+    """运行基准测试"""
+    widgets = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    app = QApplication.instance() or QApplication(sys.argv)
+
+    # 预热导入和样式缓存
+    measure("预热", build_declarative, 64)
+    measure("预热", build_imperative, 64)
+
+    results = [
+        measure("手写代码", build_imperative, widgets),
+        measure("构建器", build_declarative, widgets),
+    ]
+
+    print(f"{'方式':<10}{'表单组件数':>10}{'耗时(ms)':>12}{'创建组件数':>12}")
+    for result in results:
+        print(
+            f"{result['name']:<10}{result['widgets']:>10}{result['time_ms']:>12.1f}{result['created']:>12}"
+        )
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,371 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+组件基准测试套件
+
+在 offscreen 平台上测量 ADW 组件的开销:
+- construct.*: 创建 N 个 Button、Divider、Row、Col
+- setter.*: 每个 setter 在 N 个组件上的重新设置样式/布局的开销 (含事件处理)
+- theme.switch: 在 N 个组件上切换主题
+- grid.layout.*: 24 列响应式栅格在不同窗口宽度下的布局
+- paint.*: 通过 QWidget.grab 绘制 N 个组件
+
+结果可以保存为 JSON，并与保存的基线比较，变慢超过阈值的项目标记为退化。
+
+用法:
+    QT_QPA_PLATFORM=offscreen python benchmarks/bench_components.py [-n 数量] [-r 重复次数] [-k 名称过滤]
+        [-o 结果.json] [--baseline benchmarks/baseline.json] [--threshold 0.3] [--check]
+
+更新基线:
+    QT_QPA_PLATFORM=offscreen python benchmarks/bench_components.py -o benchmarks/baseline.json
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from typing import Callable, Dict, List, Optional
+
+# 添加项目根目录到 Python 路径
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import adw
+from adw.common import qt
+from adw.common.qt import QApplication, QEvent, QWidget, QVBoxLayout, QLabel
+from adw.components.widgets.button import Button
+from adw.components.widgets.divider import Divider
+from adw.components.layout.grid import Row, Col
+from adw.components.layout.grid_layout import flush_layouts
+from adw.styles.colors import ThemeType
+from adw.styles.theme import ThemeManager
+
+# 默认基线位置
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+# 栅格布局测量的窗口宽度 (覆盖 xs、md、xl、xxl 断点)
+GRID_WIDTHS = (360, 768, 1280, 1920)
+
+# 只执行一次操作的测试 (栅格布局、绘制) 在每次测量中重复的次数
+INNER_LOOPS = 3
+
+# 每个基准测试: 名称 -> 函数 (count) -> 本次测量的秒数 (不含准备工作)
+_benchmarks: Dict[str, Callable[[int], float]] = {}
+
+
+def benchmark(name: str):
+    """注册基准测试"""
+    def decorator(function: Callable[[int], float]):
+        _benchmarks[name] = function
+        return function
+    return decorator
+
+
+def _timed(function: Callable[[], None]) -> float:
+    """执行并返回耗时 (秒)，之后处理事件，使延迟的 polish 和布局计入"""
+    start = time.perf_counter()
+    function()
+    QApplication.processEvents()
+    return time.perf_counter() - start
+
+
+def _page(widgets: List[QWidget], width: int = 800) -> QWidget:
+    """把组件放入一个显示的页面"""
+    page = QWidget()
+    layout = QVBoxLayout(page)
+    for widget in widgets:
+        layout.addWidget(widget)
+    page.resize(width, 600)
+    page.show()
+    QApplication.processEvents()
+    return page
+
+
+def _dispose(page: QWidget):
+    """立即销毁页面 (没有运行事件循环时 deleteLater 不会自动执行)"""
+    page.hide()
+    page.deleteLater()
+    QApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+
+
+def _make_buttons(count: int) -> List[Button]:
+    types = Button.TYPES
+    return [Button(text=f"按钮 {index}", type=types[index % len(types)]) for index in range(count)]
+
+
+def _make_dividers(count: int) -> List[Divider]:
+    return [Divider(text=f"分割 {index}" if index % 2 else None, dashed=bool(index % 3 == 0)) for index in range(count)]
+
+
+def _make_grid(count: int) -> QWidget:
+    """count 个单元格的响应式栅格，每行 24 格"""
+    container = QWidget()
+    layout = QVBoxLayout(container)
+    for start in range(0, count, 8):
+        row = Row(gutter=[8, 8])
+        for index in range(start, min(start + 8, count)):
+            row.add_col(Col(xs=24, md=6, xl=3, widget=QLabel(str(index))))
+        layout.addWidget(row)
+    return container
+
+
+# 创建
+@benchmark("construct.button")
+def bench_construct_button(count: int) -> float:
+    root = QWidget()
+    elapsed = _timed(lambda: [Button(text=f"按钮 {index}", parent=root) for index in range(count)])
+    _dispose(root)
+    return elapsed
+
+
+@benchmark("construct.divider")
+def bench_construct_divider(count: int) -> float:
+    root = QWidget()
+    elapsed = _timed(lambda: [Divider(text="分割", parent=root) for _ in range(count)])
+    _dispose(root)
+    return elapsed
+
+
+@benchmark("construct.row")
+def bench_construct_row(count: int) -> float:
+    root = QWidget()
+    elapsed = _timed(lambda: [Row(gutter=8, parent=root) for _ in range(count)])
+    _dispose(root)
+    return elapsed
+
+
+@benchmark("construct.col")
+def bench_construct_col(count: int) -> float:
+    root = QWidget()
+    elapsed = _timed(lambda: [Col(span=6, xs=24, md=12, parent=root) for _ in range(count)])
+    _dispose(root)
+    return elapsed
+
+
+# setter: (组件名称, 创建 count 个组件的函数, setter 名称, 交替使用的两个值)
+SETTERS = [
+    ("button", _make_buttons, "set_type", ("primary", "default")),
+    ("button", _make_buttons, "set_size", ("large", "small")),
+    ("button", _make_buttons, "set_danger", (True, False)),
+    ("button", _make_buttons, "set_ghost", (True, False)),
+    ("button", _make_buttons, "set_loading", (True, False)),
+    ("button", _make_buttons, "set_disabled", (True, False)),
+    ("button", _make_buttons, "set_block", (True, False)),
+    ("button", _make_buttons, "set_shape", ("round", None)),
+    ("button", _make_buttons, "set_icon", ("search", None)),
+    ("button", _make_buttons, "set_text", ("确定", "Submit")),
+    ("divider", _make_dividers, "set_dashed", (True, False)),
+    ("divider", _make_dividers, "set_text", ("标题", "Title")),
+    ("divider", _make_dividers, "set_orientation", ("left", "right")),
+    ("divider", _make_dividers, "set_plain", (False, True)),
+]
+
+
+def _register_setter(component: str, factory, setter: str, values):
+    def run(count: int) -> float:
+        widgets = factory(count)
+        page = _page(widgets)
+        elapsed = 0.0
+        for value in values:
+            elapsed += _timed(lambda: [getattr(widget, setter)(value) for widget in widgets])
+        _dispose(page)
+        # 每次调用的平均耗时按 count 次 setter 计算
+        return elapsed / len(values)
+    benchmark(f"setter.{component}.{setter}")(run)
+
+
+for _component, _factory, _setter, _values in SETTERS:
+    _register_setter(_component, _factory, _setter, _values)
+
+
+def _restyle(widget: QWidget):
+    """组件没有监听主题变化，按应用的做法通过 setter 重新设置样式"""
+    if isinstance(widget, Button):
+        widget.set_type(widget.get_type())
+    elif isinstance(widget, Divider):
+        widget.set_dashed(widget.get_dashed())
+
+
+@benchmark("theme.switch")
+def bench_theme_switch(count: int) -> float:
+    widgets = _make_buttons(count // 2) + _make_dividers(count - count // 2)
+    page = _page(widgets)
+
+    def switch(theme: ThemeType):
+        ThemeManager.set_theme(theme)
+        ThemeManager.apply_theme_to_widget(page)
+        for widget in widgets:
+            _restyle(widget)
+
+    elapsed = _timed(lambda: switch(ThemeType.DARK)) + _timed(lambda: switch(ThemeType.LIGHT))
+    _dispose(page)
+    return elapsed / 2
+
+
+def _register_grid_layout(width: int):
+    def run(count: int) -> float:
+        start_width = GRID_WIDTHS[0] if width != GRID_WIDTHS[0] else GRID_WIDTHS[-1]
+        page = _page([_make_grid(count)], width=start_width)
+
+        def resize(target: int):
+            page.resize(target, 600)
+            flush_layouts()
+
+        # 从另一个断点的宽度切换过来，取 INNER_LOOPS 次的平均值
+        elapsed = 0.0
+        for _ in range(INNER_LOOPS):
+            elapsed += _timed(lambda: resize(width))
+            _timed(lambda: resize(start_width))
+        _dispose(page)
+        return elapsed / INNER_LOOPS
+    benchmark(f"grid.layout.{width}")(run)
+
+
+for _width in GRID_WIDTHS:
+    _register_grid_layout(_width)
+
+
+def _register_paint(name: str, factory):
+    def run(count: int) -> float:
+        page = _page(factory(count))
+        # 第一次 grab 包含 polish 等一次性工作，不计入
+        page.grab()
+        start = time.perf_counter()
+        for _ in range(INNER_LOOPS):
+            page.grab()
+        elapsed = (time.perf_counter() - start) / INNER_LOOPS
+        _dispose(page)
+        return elapsed
+    benchmark(f"paint.{name}")(run)
+
+
+_register_paint("button", _make_buttons)
+_register_paint("divider", _make_dividers)
+_register_paint("grid", lambda count: [_make_grid(count)])
+
+
+def run_benchmarks(count: int, repeat: int, pattern: Optional[str] = None) -> dict:
+    """
+    运行基准测试
+
+    Args:
+        count: 每项测试的组件数量
+        repeat: 重复次数，结果取中位数
+        pattern: 只运行名称包含该字符串的测试
+
+    Returns:
+        {'meta': 环境信息, 'results': {名称: 统计}}
+    """
+    results = {}
+    for name, function in _benchmarks.items():
+        if pattern and pattern not in name:
+            continue
+        # 预热一次，排除导入和首次初始化
+        function(min(count, 10))
+        samples = []
+        for _ in range(repeat):
+            gc.collect()
+            samples.append(function(count) * 1000)
+        median = statistics.median(samples)
+        results[name] = {
+            'count': count,
+            'median_ms': round(median, 3),
+            'min_ms': round(min(samples), 3),
+            'max_ms': round(max(samples), 3),
+            'per_item_us': round(median * 1000 / count, 2),
+        }
+    return {
+        'meta': {
+            'adw': adw.__version__,
+            'binding': qt.API,
+            'qt': qt.QtCore.qVersion(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'qpa': QApplication.platformName(),
+            'count': count,
+            'repeat': repeat,
+        },
+        'results': results,
+    }
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> List[dict]:
+    """
+    与基线比较
+
+    Args:
+        current: 本次结果
+        baseline: 基线结果
+        threshold: 退化阈值，例如 0.3 表示最小耗时比基线慢 30% 以上
+
+    Returns:
+        每个共同测试项的比较: name、baseline_ms、current_ms、change、regression
+    """
+    rows = []
+    for name, result in current['results'].items():
+        base = baseline.get('results', {}).get(name)
+        if base is None:
+            continue
+        # 按最小值比较 (受其它进程干扰最小)，数量不同时按比例换算
+        base_ms = base['min_ms'] * result['count'] / base['count']
+        change = result['min_ms'] / base_ms - 1 if base_ms else 0.0
+        rows.append({
+            'name': name,
+            'baseline_ms': base_ms,
+            'current_ms': result['min_ms'],
+            'change': change,
+            'regression': change > threshold,
+        })
+    return rows
+
+
+def main(argv=None):
+    """命令行入口"""
+    parser = argparse.ArgumentParser(description="ADW 组件基准测试")
+    parser.add_argument("-n", "--count", type=int, default=200, help="每项测试的组件数量")
+    parser.add_argument("-r", "--repeat", type=int, default=5, help="重复次数，取中位数")
+    parser.add_argument("-k", "--filter", default=None, help="只运行名称包含该字符串的测试")
+    parser.add_argument("-o", "--output", default=None, help="保存结果的 JSON 文件")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="基线 JSON 文件")
+    parser.add_argument("--threshold", type=float, default=0.3, help="退化阈值 (相对基线变慢的比例)")
+    parser.add_argument("--check", action="store_true", help="存在退化时以非零状态退出")
+    args = parser.parse_args(argv)
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    current = run_benchmarks(args.count, args.repeat, args.filter)
+
+    baseline = None
+    if args.baseline and os.path.isfile(args.baseline) and os.path.abspath(args.baseline) != os.path.abspath(args.output or ""):
+        with open(args.baseline, encoding="utf-8") as file:
+            baseline = json.load(file)
+    comparison = {row['name']: row for row in compare(current, baseline, args.threshold)} if baseline else {}
+
+    print(f"{'测试':<32}{'中位数(ms)':>12}{'最小(ms)':>10}{'单个(us)':>10}{'基线最小(ms)':>14}{'变化':>9}")
+    for name, result in current['results'].items():
+        line = f"{name:<32}{result['median_ms']:>12.2f}{result['min_ms']:>10.2f}{result['per_item_us']:>10.1f}"
+        row = comparison.get(name)
+        if row is not None:
+            line += f"{row['baseline_ms']:>14.2f}{row['change']:>+9.0%}"
+            if row['regression']:
+                line += "  退化"
+        print(line)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(current, file, ensure_ascii=False, indent=2)
+        print(f"\n结果已保存到 {args.output}")
+
+    regressions = [row for row in comparison.values() if row['regression']]
+    if regressions:
+        print(f"\n{len(regressions)} 项相对基线变慢超过 {args.threshold:.0%}")
+        if args.check:
+            sys.exit(1)
+    return current
+
+
+if __name__ == "__main__":
+    main()
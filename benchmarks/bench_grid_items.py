@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Grid 轻量列基准测试
+
+比较 Col 容器与 Row.add_col 轻量列模式构建大型栅格时的组件数量、内存和耗时
+
+用法:
+    QT_QPA_PLATFORM=offscreen python benchmarks/bench_grid_items.py [行数]
+"""
+
+import sys
+import os
+import time
+import tracemalloc
+
+# 添加项目根目录到 Python 路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+# 动态导入 PySide6 或 PyQt6
+try:
+    from PySide6.QtWidgets import QApplication, QWidget, QLayout, QLabel
+except ImportError:
+    from PyQt6.QtWidgets import QApplication, QWidget, QLayout, QLabel
+
+from adw.components.layout.grid import Row, Col
+
+
+# 每行列数 (24 栅格的表单行)
+CELLS_PER_ROW = 24
+
+
+def build_with_cols(root: QWidget, rows: int):
+    """使用 Col 容器构建栅格"""
+    for _ in range(rows):
+        row = Row(parent=root)
+        for index in range(CELLS_PER_ROW):
+            row.add_col(Col(span=1, widget=QLabel(str(index))))
+
+
+def build_with_items(root: QWidget, rows: int):
+    """使用轻量列模式构建栅格"""
+    for _ in range(rows):
+        row = Row(parent=root)
+        for index in range(CELLS_PER_ROW):
+            row.add_col(QLabel(str(index)), span=1)
+
+
+def measure(name: str, build, rows: int) -> dict:
+    """测量一次构建"""
+    root = QWidget()
+    tracemalloc.start()
+    start = time.perf_counter()
+    build(root, rows)
+    elapsed = time.perf_counter() - start
+    _current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    result = {
+        'name': name,
+        'rows': rows,
+        'time_ms': elapsed * 1000,
+        'widgets': len(root.findChildren(QWidget)),
+        'layouts': len(root.findChildren(QLayout)),
+        'python_peak_kb': peak / 1024,
+    }
+    root.deleteLater()
+    return result
+
+
+def main():
+    """运行基准测试"""
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    app = QApplication.instance() or QApplication(sys.argv)
+
+    results = [
+        measure("Col 容器", build_with_cols, rows),
+        measure("轻量列", build_with_items, rows),
+    ]
+
+    print(f"{'模式':<10}{'行数':>8}{'耗时(ms)':>12}{'组件数':>10}{'布局数':>10}{'Python峰值(KB)':>16}")
+    for result in results:
+        print(
+            f"{result['name']:<10}{result['rows']:>8}{result['time_ms']:>12.1f}"
+            f"{result['widgets']:>10}{result['layouts']:>10}{result['python_peak_kb']:>16.1f}"
+        )
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+图标冷启动基准测试
+
+生成一组 SVG 图标并打包为图集，分别在新进程中从 SVG 文件和从内存映射的图集加载全部图标，
+比较得到所有图标 QPixmap 的耗时
+
+用法:
+    QT_QPA_PLATFORM=offscreen python benchmarks/bench_icons.py [图标数]
+"""
+
+import sys
+import os
+import shutil
+import subprocess
+import tempfile
+import time
+
+# 添加项目根目录到 Python 路径
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+
+# 子进程中执行的加载代码
+CHILD = """
+import sys, time
+sys.path.insert(0, {root!r})
+try:
+    from PySide6.QtWidgets import QApplication
+except ImportError:
+    from PyQt6.QtWidgets import QApplication
+app = QApplication(sys.argv)
+from adw.styles.icons import IconManager
+
+start = time.perf_counter()
+if {atlas!r}:
+    IconManager.set_atlas({atlas!r})
+else:
+    IconManager.set_atlas(None)
+    IconManager.add_search_path({icon_dir!r})
+for index in range({count}):
+    IconManager.get_pixmap("icon-%04d" % index, 14, "#1890ff", 1.0)
+elapsed = time.perf_counter() - start
+counters = IconManager.get_counters()
+print(elapsed * 1000, counters['rasterizations'], counters['atlas_tiles'])
+"""
+
+
+def make_icons(directory: str, count: int):
+    """把内置图标复制为 count 个不同名称的 SVG 文件"""
+    from adw.styles.icons.manager import BUILTIN_ICON_DIR
+    sources = sorted(entry for entry in os.listdir(BUILTIN_ICON_DIR) if entry.endswith('.svg'))
+    for index in range(count):
+        shutil.copy(
+            os.path.join(BUILTIN_ICON_DIR, sources[index % len(sources)]),
+            os.path.join(directory, f"icon-{index:04d}.svg")
+        )
+
+
+def measure(name: str, count: int, icon_dir: str, atlas: str = "", runs: int = 5) -> dict:
+    """在新进程中测量冷启动加载耗时，取中位数"""
+    code = CHILD.format(root=ROOT, atlas=atlas, icon_dir=icon_dir, count=count)
+    samples = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout.split()
+        samples.append((float(output[0]), int(output[1]), int(output[2])))
+    samples.sort()
+    elapsed, rasterizations, tiles = samples[len(samples) // 2]
+    return {
+        'name': name,
+        'icons': count,
+        'time_ms': elapsed,
+        'rasterizations': rasterizations,
+        'atlas_tiles': tiles,
+    }
+
+
+def main():
+    """运行基准测试"""
+    try:
+        from PySide6.QtWidgets import QApplication
+    except ImportError:
+        from PyQt6.QtWidgets import QApplication
+    from adw.styles.icons.atlas import build_atlas
+
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    app = QApplication.instance() or QApplication(sys.argv)
+    directory = tempfile.mkdtemp()
+    try:
+        icon_dir = os.path.join(directory, "icons")
+        os.mkdir(icon_dir)
+        make_icons(icon_dir, count)
+
+        start = time.perf_counter()
+        atlas = os.path.join(directory, "icons.atlas")
+        build_atlas(atlas, [icon_dir], sizes=[14], ratios=[1.0])
+        build_ms = (time.perf_counter() - start) * 1000
+
+        results = [
+            measure("SVG 文件", count, icon_dir),
+            measure("图集", count, icon_dir, atlas),
+        ]
+    finally:
+        shutil.rmtree(directory)
+
+    print(f"生成图集: {build_ms:.1f} ms")
+    print(f"{'方式':<10}{'图标数':>8}{'耗时(ms)':>12}{'光栅化':>10}{'图集图块':>10}")
+    for result in results:
+        print(
+            f"{result['name']:<10}{result['icons']:>8}{result['time_ms']:>12.1f}"
+            f"{result['rasterizations']:>10}{result['atlas_tiles']:>10}"
+        )
+    return results
+
+
+if __name__ == "__main__":
+    main()
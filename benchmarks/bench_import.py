@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+导入耗时基准测试
+
+在新进程中用 python -X importtime 执行导入语句，统计 adw 模块 (含其导入的依赖) 的累计导入耗时，
+并检查是否加载了 Qt。只使用设计令牌的工具应该只为 adw.styles 付出导入开销。
+
+用法:
+    python benchmarks/bench_import.py [--runs 次数] [--budget 毫秒]
+
+指定 --budget 时，import adw 或 import adw.styles 超出预算则以非零状态退出。
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+# 项目根目录
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+# (说明, 导入语句, 是否受预算约束)
+STATEMENTS = [
+    ("import adw", "import adw", True),
+    ("import adw.styles", "import adw.styles", True),
+    ("from adw.styles import ColorPalette", "from adw.styles import ColorPalette", False),
+    ("import adw.components", "import adw.components", False),
+    ("from adw.components import Button", "from adw.components import Button", False),
+]
+
+# 子进程在导入后输出是否加载了 Qt
+CHILD = "{statement}\nimport sys\nprint(any(name.split('.')[0] in ('PySide6', 'PyQt6') for name in sys.modules))"
+
+
+def parse_importtime(output: str) -> float:
+    """统计 -X importtime 输出中顶层 adw 模块的累计耗时 (毫秒)"""
+    total = 0
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[1].strip().isdigit():
+            continue
+        name = fields[2]
+        # 顶层条目的名称前只有一个空格，嵌套的导入有更多缩进
+        if name.startswith(" ") and not name.startswith("  ") and name.strip().split(".")[0] == "adw":
+            total += int(fields[1])
+    return total / 1000
+
+
+def measure(statement: str, runs: int) -> dict:
+    """在新进程中测量导入耗时，取中位数"""
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    samples = []
+    qt_loaded = False
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", CHILD.format(statement=statement)],
+            capture_output=True, text=True, env=env, check=True
+        )
+        samples.append(parse_importtime(result.stderr))
+        qt_loaded = result.stdout.strip() == "True"
+    samples.sort()
+    return {'time_ms': samples[len(samples) // 2], 'qt': qt_loaded}
+
+
+def main(argv=None):
+    """运行基准测试"""
+    parser = argparse.ArgumentParser(description="ADW 导入耗时基准测试")
+    parser.add_argument("--runs", type=int, default=7, help="每条语句的运行次数")
+    parser.add_argument("--budget", type=float, default=None, help="import adw / import adw.styles 的耗时预算 (毫秒)")
+    args = parser.parse_args(argv)
+
+    results = []
+    print(f"{'导入语句':<40}{'耗时(ms)':>10}{'加载 Qt':>10}")
+    for label, statement, budgeted in STATEMENTS:
+        result = dict(measure(statement, args.runs), name=label, budgeted=budgeted)
+        results.append(result)
+        print(f"{label:<40}{result['time_ms']:>10.1f}{'是' if result['qt'] else '否':>10}")
+
+    if args.budget is not None:
+        over = [result for result in results if result['budgeted'] and result['time_ms'] > args.budget]
+        for result in over:
+            print(f"超出预算: {result['name']} {result['time_ms']:.1f} ms > {args.budget:.1f} ms")
+        if over:
+            sys.exit(1)
+    return results
+
+
+if __name__ == "__main__":
+    main()
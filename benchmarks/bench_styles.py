@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+样式包冷启动基准测试
+
+在新进程中生成 Button、Divider 所有变体和主题的样式表，分别测量没有样式包 (全部重新生成) 和
+从样式包读取两种情况的耗时
+
+用法:
+    python benchmarks/bench_styles.py [运行次数]
+"""
+
+import sys
+import os
+import shutil
+import subprocess
+import tempfile
+
+# 项目根目录
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+# 子进程中执行的代码
+CHILD = """
+import time
+from adw.styles.cache import StyleCache
+from adw.styles.theme import ThemeManager
+from adw.components.widgets.button import Button
+from adw.components.widgets.divider import Divider
+
+start = time.perf_counter()
+for component in (Button, Divider):
+    for variant in component.get_style_variants():
+        component.build_style_sheet(*variant)
+ThemeManager.build_style_sheet()
+StyleCache.get_tokens()
+elapsed = time.perf_counter() - start
+counters = StyleCache.get_counters()
+if {save!r}:
+    StyleCache.save()
+print(elapsed * 1000, counters['misses'], counters['bundle_loads'])
+"""
+
+
+def measure(name: str, cache_dir: str, enabled: bool, runs: int, save: bool = False) -> dict:
+    """在新进程中测量样式表的冷启动耗时，取中位数"""
+    env = dict(os.environ, PYTHONPATH=ROOT, ADW_CACHE_DIR=cache_dir, ADW_STYLE_CACHE="1" if enabled else "0")
+    samples = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", CHILD.format(save=save)], capture_output=True, text=True, env=env, check=True
+        ).stdout.split()
+        samples.append((float(output[0]), int(output[1]), int(output[2])))
+    samples.sort()
+    elapsed, generated, loads = samples[len(samples) // 2]
+    return {'name': name, 'time_ms': elapsed, 'generated': generated, 'bundle_loads': loads}
+
+
+def main():
+    """运行基准测试"""
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 7
+    cache_dir = tempfile.mkdtemp()
+    try:
+        results = [measure("重新生成", cache_dir, False, runs)]
+        # 生成样式包后再测量读取
+        measure("保存样式包", cache_dir, True, 1, save=True)
+        results.append(measure("读取样式包", cache_dir, True, runs))
+        bundles = [entry for entry in os.listdir(cache_dir) if entry.endswith(".json")]
+        size = sum(os.path.getsize(os.path.join(cache_dir, entry)) for entry in bundles)
+    finally:
+        shutil.rmtree(cache_dir)
+
+    print(f"样式包: {size} 字节")
+    print(f"{'方式':<12}{'耗时(ms)':>10}{'生成样式表':>12}{'读取样式包':>12}")
+    for result in results:
+        print(f"{result['name']:<12}{result['time_ms']:>10.2f}{result['generated']:>12}{result['bundle_loads']:>12}")
+    return results
+
+
+if __name__ == "__main__":
+    main()
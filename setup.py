@@ -10,6 +10,10 @@ setup(
     long_description_content_type="text/markdown",
     url="https://github.com/yourusername/ant-design-widget",
     packages=find_packages(),
+    package_data={
+        "adw.styles.icons": ["svg/*.svg", "*.atlas"],
+        "adw.i18n": ["*.cat"],
+    },
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License",
@@ -21,5 +25,6 @@ setup(
     ],
     extras_require={
         "PyQt6": ["PyQt6>=6.0.0"],
+        "numpy": ["numpy>=1.20"],
     },
 )
\ No newline at end of file
@@ -0,0 +1,20 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+pytest 配置
+
+测试函数捕获异常后打印原因并返回 False (便于直接运行测试文件)，pytest 默认只把返回值当作警告，
+这里把返回 False 的测试判为失败。
+"""
+
+import pytest
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_pyfunc_call(pyfuncitem):
+    """调用测试函数，返回 False 时判为失败"""
+    funcargs = pyfuncitem.funcargs
+    arguments = {name: funcargs[name] for name in pyfuncitem._fixtureinfo.argnames}
+    if pyfuncitem.obj(**arguments) is False:
+        pytest.fail(f"{pyfuncitem.name} 返回 False (失败原因见上方输出)", pytrace=False)
+    return True
@@ -65,12 +65,68 @@ def test_breakpoints():
         return False
 
 
+def test_media_queries():
+    """测试媒体查询编译与匹配"""
+    try:
+        from adw.styles.breakpoints import (
+            Breakpoint, BreakpointManager, MediaQuery, compile_media_query,
+            match_media_queries, get_breakpoint_for_width
+        )
+        
+        # 测试编译与缓存
+        query = compile_media_query('(min-width: 768px)')
+        assert isinstance(query, MediaQuery)
+        assert compile_media_query('(min-width: 768px)') is query
+        assert BreakpointManager.compile_media_query(Breakpoint.MD) is query
+        assert query.matches(768) and not query.matches(767)
+        print("✓ 媒体查询编译测试通过")
+        
+        # 测试复合查询
+        compound = compile_media_query('screen and (min-width: 576px) and (max-width: 991px) and (min-height: 400px)')
+        assert compound.matches(800, 600)
+        assert not compound.matches(800, 300)
+        assert not compound.matches(1000, 600)
+        assert not compound.matches(500, 600)
+        print("✓ 复合媒体查询测试通过")
+        
+        # 测试非法查询
+        try:
+            compile_media_query('(orientation: portrait)')
+            assert False, "非法查询应当抛出 ValueError"
+        except ValueError:
+            pass
+        print("✓ 非法媒体查询测试通过")
+        
+        # 测试批量匹配
+        matched = match_media_queries(list(Breakpoint), 800)
+        assert matched == {Breakpoint.SM, Breakpoint.MD}
+        matched = match_media_queries(list(Breakpoint), 320)
+        assert matched == {Breakpoint.XS}
+        print("✓ 批量媒体查询测试通过")
+        
+        # 测试宽度对应断点
+        assert get_breakpoint_for_width(0) == Breakpoint.XS
+        assert get_breakpoint_for_width(575) == Breakpoint.XS
+        assert get_breakpoint_for_width(576) == Breakpoint.SM
+        assert get_breakpoint_for_width(991) == Breakpoint.MD
+        assert get_breakpoint_for_width(1600) == Breakpoint.XXL
+        print("✓ 宽度断点测试通过")
+        
+        return True
+    except Exception as e:
+        print(f"✗ 媒体查询测试失败: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
 def main():
     """主测试函数"""
     print("开始测试断点系统...")
     
     tests = [
-        ("断点系统", test_breakpoints)
+        ("断点系统", test_breakpoints),
+        ("媒体查询", test_media_queries)
     ]
     
     passed = 0
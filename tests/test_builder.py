@@ -0,0 +1,238 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+LayoutBuilder 声明式布局构建器测试
+"""
+
+import sys
+import os
+
+# 添加项目根目录到 Python 路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+
+def test_build_from_dict():
+    """测试根据 dict 和 JSON 描述构建"""
+    try:
+        # 创建 QApplication
+        try:
+            from PySide6.QtWidgets import QApplication, QWidget, QLabel, QLineEdit
+        except ImportError:
+            from PyQt6.QtWidgets import QApplication, QWidget, QLabel, QLineEdit
+
+        app = QApplication.instance() or QApplication(sys.argv)
+
+        from adw.components.layout.grid import Row, Col
+        from adw.components.layout.grid_layout import GridItem
+        from adw.components.widgets.button import Button
+        from adw.components.layout.builder import build_layout
+        print("✓ 成功导入 build_layout")
+
+        spec = {
+            "component": "row",
+            "gutter": 16,
+            "justify": "center",
+            "cols": [
+                {"span": 6, "widget": "名称"},
+                {"span": 12, "md": 8, "widget": {"component": "input", "placeholder": "请输入"}},
+                {"span": 6, "container": True, "widget": {"component": "button", "text": "提交", "type": "primary"}},
+            ]
+        }
+
+        row = build_layout(spec)
+        assert isinstance(row, Row)
+        assert row.get_gutter() == 16
+        assert row.get_justify() == "center"
+        items = row._layout.grid_items()
+        assert len(items) == 3
+        assert isinstance(items[0], GridItem) and isinstance(items[0].widget(), QLabel)
+        assert items[0].widget().parentWidget() is row
+        assert isinstance(items[1].widget(), QLineEdit)
+        assert items[1].widget().placeholderText() == "请输入"
+        assert items[1]._table[2][0] == 8
+        col = items[2].widget()
+        assert isinstance(col, Col) and isinstance(col.get_widget(), Button)
+        assert col.get_widget().get_type() == "primary"
+        print("✓ dict 描述构建测试通过")
+
+        import json
+        stack = build_layout(json.dumps([spec, {"component": "divider"}, "结尾"]))
+        assert isinstance(stack, QWidget)
+        assert stack.layout().count() == 3
+        assert stack.updatesEnabled()
+        print("✓ JSON 描述构建测试通过")
+
+        try:
+            build_layout({"component": "unknown"})
+            assert False, "未知类型应抛出异常"
+        except ValueError:
+            pass
+        print("✓ 未知类型测试通过")
+
+        return True
+    except Exception as e:
+        print(f"✗ dict 描述构建测试失败: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_build_from_dataclass():
+    """测试根据 dataclass 描述构建"""
+    try:
+        # 创建 QApplication
+        try:
+            from PySide6.QtWidgets import QApplication, QWidget, QLabel
+        except ImportError:
+            from PyQt6.QtWidgets import QApplication, QWidget, QLabel
+
+        app = QApplication.instance() or QApplication(sys.argv)
+
+        from adw.components.layout.builder import (
+            LayoutBuilder, RowSpec, ColSpec, WidgetSpec, register_widget_type
+        )
+
+        register_widget_type("badge", lambda parent, count=0: QLabel(str(count), parent))
+        assert "badge" in LayoutBuilder.get_types()
+
+        parent = QWidget()
+        spec = RowSpec(gutter=[8, 8], cols=[
+            ColSpec(span=12, widget=WidgetSpec("badge", {"count": 3})),
+            ColSpec(span=12, widget=RowSpec(cols=[ColSpec(span=24, widget="嵌套")])),
+        ])
+        row = LayoutBuilder.build(spec, parent)
+        assert row.parentWidget() is parent
+        assert parent.updatesEnabled()
+        items = row._layout.grid_items()
+        assert items[0].widget().text() == "3"
+        assert items[1].widget()._layout.grid_items()[0].widget().text() == "嵌套"
+        print("✓ dataclass 描述构建测试通过")
+
+        # 列按 gutter 分配宽度
+        row.resize(960, 100)
+        parent.show()
+        app.processEvents()
+        assert items[0].geometry().width() == 476
+        assert items[1].geometry().x() == 484
+        parent.close()
+        print("✓ 布局计算测试通过")
+
+        return True
+    except Exception as e:
+        print(f"✗ dataclass 描述构建测试失败: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_incremental_builder():
+    """测试分时构建"""
+    try:
+        # 创建 QApplication
+        try:
+            from PySide6.QtWidgets import QApplication, QWidget, QLabel
+        except ImportError:
+            from PyQt6.QtWidgets import QApplication, QWidget, QLabel
+
+        app = QApplication.instance() or QApplication(sys.argv)
+
+        import json
+        from adw.components.layout.grid import Row
+        from adw.components.widgets.button import Button
+        from adw.components.widgets.divider import Divider
+        from adw.components.layout.builder import IncrementalBuilder, LayoutBuilder
+
+        row_spec = {"cols": [{"span": 12, "widget": "标签"}, {"span": 12, "widget": {"component": "input"}}]}
+        spec = [row_spec] * 200 + [{"component": "divider"}, {"component": "button", "text": "完成"}]
+        assert LayoutBuilder.count(spec) == 1 + 200 * 3 + 2
+        label_spec = {"cols": [{"span": 12, "widget": "[beta] feature"}]}
+        assert LayoutBuilder.count(label_spec) == 2
+        assert LayoutBuilder.count(json.dumps([label_spec])) == 3
+        print("✓ 组件计数测试通过")
+
+        window = QWidget()
+        window.resize(400, 120)
+        builder = IncrementalBuilder(spec, window, budget_ms=2)
+        progress, finished = [], []
+        builder.progress.connect(lambda created, total: progress.append((created, total)))
+        builder.finished.connect(finished.append)
+
+        root = builder.start()
+        assert builder.is_running()
+        assert 0 < root.layout().count() < 202
+        assert isinstance(root.layout().itemAt(0).widget(), Row)
+        assert progress and progress[-1][1] == LayoutBuilder.count(spec)
+        print("✓ 首屏内容同步创建")
+
+        # 顶层只有一个列表时首屏同样只创建一部分
+        nested = IncrementalBuilder([[row_spec] * 200], window, budget_ms=2)
+        nested_root = nested.start()
+        assert nested.is_running()
+        stack = nested_root.layout().itemAt(0).widget()
+        assert 0 < stack.layout().count() < 200
+        assert nested.get_progress()[0] < LayoutBuilder.count([[row_spec] * 200]) // 2
+        nested.cancel()
+        print("✓ 嵌套列表在首屏填满后停止同步创建")
+
+        # 以 [ 开头的标签文本不按 JSON 解析
+        labeled = IncrementalBuilder(label_spec, window, fold_height=0)
+        labeled_root = labeled.start()
+        while labeled.is_running():
+            app.processEvents()
+        assert labeled_root.findChild(QLabel).text() == "[beta] feature"
+        print("✓ 标签文本不按 JSON 解析")
+
+        while not finished:
+            app.processEvents()
+        assert finished[0] is root
+        assert len(progress) > 2
+        assert progress[-1][0] == progress[-1][1]
+        assert root.layout().count() == 202
+        assert isinstance(root.layout().itemAt(200).widget(), Divider)
+        assert isinstance(root.layout().itemAt(201).widget(), Button)
+        print("✓ 分批构建完成")
+
+        # 取消后不再继续创建
+        builder = IncrementalBuilder(spec, window, budget_ms=1, fold_height=0)
+        root = builder.start()
+        builder.cancel()
+        app.processEvents()
+        assert root.layout().count() < 202
+        print("✓ 取消构建测试通过")
+
+        return True
+    except Exception as e:
+        print(f"✗ 分时构建测试失败: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def main():
+    """主测试函数"""
+    print("开始测试 LayoutBuilder 声明式布局构建器...")
+
+    tests = [
+        ("dict 描述构建", test_build_from_dict),
+        ("dataclass 描述构建", test_build_from_dataclass),
+        ("分时构建", test_incremental_builder)
+    ]
+
+    passed = 0
+    total = len(tests)
+
+    for name, test_func in tests:
+        print(f"\n测试 {name}:")
+        if test_func():
+            passed += 1
+            print(f"✓ {name} 测试通过")
+        else:
+            print(f"✗ {name} 测试失败")
+
+    print(f"\nLayoutBuilder 测试完成: {passed}/{total} 通过")
+    return passed == total
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -185,6 +185,214 @@ def test_grid_responsive():
         return False
 
 
+def test_grid_responsive_table():
+    """测试响应式表预编译与断点切换"""
+    try:
+        # 创建 QApplication
+        try:
+            from PySide6.QtWidgets import QApplication, QLabel
+        except ImportError:
+            from PyQt6.QtWidgets import QApplication, QLabel
+            
+        app = QApplication.instance() or QApplication(sys.argv)
+        
+        from adw.components.layout.grid import Row, Col, Breakpoint
+        
+        # 测试继承: 未设置的断点继承较小断点的值
+        col = Col(span=6, offset=1, sm=12, lg={'span': 8, 'push': 2}, widget=QLabel("col"))
+        assert col._table[0] == (6, 1, 0, 0, 0)
+        assert col._table[1] == (12, 1, 0, 0, 0)
+        assert col._table[2] == (12, 1, 0, 0, 0)
+        assert col._table[3] == (8, 1, 2, 0, 0)
+        assert col._table[5] == (8, 1, 2, 0, 0)
+        print("✓ 响应式表继承正确")
+        
+        # 测试 Row 按窗口宽度一次性切换所有列
+        hidden_col = Col(xs=0, md=6, widget=QLabel("desktop"))
+        row = Row(gutter={'xs': 8, 'md': 24})
+        row.add_col(col)
+        row.add_col(hidden_col)
+        assert hidden_col.isHidden()
+        assert row._layout.get_gutter() == (8, 0)
+        
+        assert row._update_breakpoint(1000)
+        assert row.get_breakpoint() == Breakpoint.LG
+        assert col._get_responsive_span() == 8
+        assert col.get_responsive_entry() == (8, 1, 2, 0, 0)
+        assert not hidden_col.isHidden()
+        assert row._layout.get_gutter() == (24, 0)
+        assert not row._update_breakpoint(1100)
+        
+        row._update_breakpoint(320)
+        assert col._get_responsive_span() == 6
+        assert hidden_col.isHidden()
+        print("✓ 断点切换测试通过")
+        
+        # 测试 setter 重新编译响应式表
+        col.set_offset(3)
+        assert col.get_responsive_entry() == (6, 3, 0, 0, 0)
+        print("✓ 响应式表重新编译测试通过")
+        
+        return True
+    except Exception as e:
+        print(f"✗ 响应式表测试失败: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_grid_lazy_widget():
+    """测试按断点延迟创建子组件"""
+    try:
+        # 创建 QApplication
+        try:
+            from PySide6.QtWidgets import QApplication, QLabel
+        except ImportError:
+            from PyQt6.QtWidgets import QApplication, QLabel
+            
+        app = QApplication.instance() or QApplication(sys.argv)
+        
+        from adw.components.layout.grid import Row, Col
+        
+        created = []
+        
+        def factory():
+            created.append(QLabel("desktop"))
+            return created[-1]
+        
+        row = Row()
+        col = Col(xs=0, md=12, widget_factory=factory, release_after=0)
+        row.add_col(col)
+        row.add_col(Col(span=12, widget=QLabel("always")))
+        row.resize(400, 40)
+        row.show()
+        app.processEvents()
+        assert col.isHidden()
+        assert col.get_widget() is None and not created
+        print("✓ 隐藏的列不创建子组件")
+        
+        # 进入可见断点时创建
+        row.resize(1000, 40)
+        app.processEvents()
+        assert not col.isHidden()
+        assert col.get_widget() is created[0]
+        print("✓ 列显示时创建子组件")
+        
+        # 隐藏超过 release_after 后释放，再次显示时重新创建
+        row.resize(400, 40)
+        app.processEvents()
+        app.processEvents()
+        assert col.isHidden() and col.get_widget() is None
+        row.resize(1000, 40)
+        app.processEvents()
+        assert len(created) == 2 and col.get_widget() is created[1]
+        print("✓ 释放与重新创建测试通过")
+        
+        row.close()
+        return True
+    except Exception as e:
+        print(f"✗ 延迟创建测试失败: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_grid_freeze():
+    """测试冻结静态子树"""
+    try:
+        # 创建 QApplication
+        try:
+            from PySide6.QtWidgets import QApplication, QLabel
+            from PySide6.QtCore import QEvent, QPointF
+            from PySide6.QtGui import QEnterEvent
+        except ImportError:
+            from PyQt6.QtWidgets import QApplication, QLabel
+            from PyQt6.QtCore import QEvent, QPointF
+            from PyQt6.QtGui import QEnterEvent
+            
+        app = QApplication.instance() or QApplication(sys.argv)
+        
+        from adw.components.layout.grid import Row, Col
+        
+        row = Row(gutter=8)
+        labels = [QLabel(f"指标 {i}") for i in range(4)]
+        for label in labels:
+            row.add_col(label, span=6)
+        inner = Row()
+        inner_label = QLabel("嵌套")
+        inner.add_col(inner_label, span=24)
+        row.add_col(inner, span=24)
+        row.resize(400, 80)
+        row.show()
+        app.processEvents()
+        
+        row.freeze()
+        assert row.is_frozen()
+        effect = row.graphicsEffect()
+        for _ in range(3):
+            row.repaint()
+        counters = effect.get_counters()
+        assert counters['renders'] == 1 and counters['blits'] == 2
+        print("✓ 子树只渲染一次")
+        
+        # 内容变化后重新生成
+        labels[2].setText("已更新")
+        inner_label.setText("嵌套已更新")
+        app.processEvents()
+        row.repaint()
+        assert effect.get_counters()['renders'] == 2
+        print("✓ 内容变化后重新渲染")
+
+        # 尺寸固定的子组件只调用 update() 时也不能显示旧内容
+        fixed = QLabel("固定")
+        fixed.setFixedSize(100, 20)
+        row.add_col(fixed, span=24)
+        app.processEvents()
+        row.repaint()
+        renders = effect.get_counters()['renders']
+        before = row.grab().toImage()
+        fixed.setText("other")
+        app.processEvents()
+        row.repaint()
+        assert effect.get_counters()['renders'] == renders + 1
+        frozen_image = row.grab().toImage()
+        assert frozen_image != before
+        assert effect.get_counters()['renders'] == renders + 1
+        print("✓ 子组件 update() 后重新渲染")
+
+        # 悬停时直接绘制的内容与冻结的内容一致
+        QApplication.sendEvent(row, QEnterEvent(QPointF(1, 1), QPointF(1, 1), QPointF(1, 1)))
+        assert row.grab().toImage() == frozen_image
+        QApplication.sendEvent(row, QEvent(QEvent.Type.Leave))
+        print("✓ 冻结内容与直接绘制一致")
+        
+        # 鼠标悬停时直接绘制子组件
+        QApplication.sendEvent(row, QEnterEvent(QPointF(1, 1), QPointF(1, 1), QPointF(1, 1)))
+        assert not effect.isEnabled()
+        QApplication.sendEvent(row, QEvent(QEvent.Type.Leave))
+        assert effect.isEnabled()
+        print("✓ 交互时暂停冻结")
+        
+        row.unfreeze()
+        assert not row.is_frozen() and row.graphicsEffect() is None
+        col = Col(span=24, widget=QLabel("列"))
+        col.freeze()
+        col.freeze()
+        assert col.is_frozen()
+        col.unfreeze()
+        assert not col.is_frozen() and col.get_widget().graphicsEffect() is None
+        print("✓ 解除冻结测试通过")
+        
+        col.close()
+        row.close()
+        return True
+    except Exception as e:
+        print(f"✗ 冻结测试失败: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
 def main():
     """主测试函数"""
     print("开始测试 Grid 栅格组件...")
@@ -192,7 +400,10 @@ def main():
     tests = [
         ("基本功能", test_grid_basic),
         ("布局功能", test_grid_layout),
-        ("响应式功能", test_grid_responsive)
+        ("响应式功能", test_grid_responsive),
+        ("响应式表", test_grid_responsive_table),
+        ("延迟创建", test_grid_lazy_widget),
+        ("冻结", test_grid_freeze)
     ]
     
     passed = 0
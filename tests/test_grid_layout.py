@@ -0,0 +1,478 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+GridLayout 栅格布局引擎测试
+"""
+
+import sys
+import os
+
+# 添加项目根目录到 Python 路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+
+def test_solve_line():
+    """测试单行几何计算"""
+    try:
+        from adw.components.layout.grid_model import solve_line
+        print("✓ 成功导入 solve_line")
+
+        # 测试基础栅格与间隔
+        entries = [(12, 0, 0, 0, 0), (12, 0, 0, 0, 0)]
+        assert solve_line(entries, [0, 0], 960, 0) == [(0, 480), (480, 480)]
+        assert solve_line(entries, [0, 0], 944, 16) == [(0, 464), (480, 464)]
+        print("✓ 基础栅格测试通过")
+
+        # 测试偏移与 push/pull
+        entries = [(8, 0, 0, 0, 0), (8, 8, 0, 0, 0)]
+        assert solve_line(entries, [0, 0], 960, 0) == [(0, 320), (640, 320)]
+        entries = [(18, 0, 6, 0, 0), (6, 0, 0, 18, 0)]
+        assert solve_line(entries, [0, 0], 960, 0) == [(240, 720), (0, 240)]
+        print("✓ 偏移与排序测试通过")
+
+        # 测试水平排列方式
+        entries = [(4, 0, 0, 0, 0)] * 2
+        assert solve_line(entries, [0, 0], 960, 0, "end") == [(640, 160), (800, 160)]
+        assert solve_line(entries, [0, 0], 960, 0, "center") == [(320, 160), (480, 160)]
+        assert solve_line(entries, [0, 0], 960, 0, "space-between") == [(0, 160), (800, 160)]
+        assert solve_line(entries, [0, 0], 960, 0, "space-around") == [(160, 160), (640, 160)]
+        assert solve_line(entries, [0, 0], 960, 0, "space-evenly") == [(213, 160), (587, 160)]
+        print("✓ 水平排列测试通过")
+
+        # 测试未设置 span 的列按内容宽度排列
+        entries = [(None, 0, 0, 0, 0), (12, 0, 0, 0, 0)]
+        assert solve_line(entries, [100, 0], 960, 0) == [(0, 100), (100, 480)]
+        print("✓ 内容宽度测试通过")
+
+        return True
+    except Exception as e:
+        print(f"✗ 单行几何计算测试失败: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_grid_layout_geometry():
+    """测试 Row 使用 GridLayout 的实际几何位置"""
+    try:
+        # 创建 QApplication
+        try:
+            from PySide6.QtWidgets import QApplication, QLabel
+        except ImportError:
+            from PyQt6.QtWidgets import QApplication, QLabel
+
+        app = QApplication.instance() or QApplication(sys.argv)
+
+        from adw.components.layout.grid import Row, Col
+
+        # 测试 span 与 gutter
+        row = Row(gutter=16)
+        cols = [Col(span=6, widget=QLabel("col-6")) for _ in range(4)]
+        for col in cols:
+            row.add_col(col)
+        row.resize(1008, 40)
+        row._layout.setGeometry(row.rect())
+        assert [col.geometry().x() for col in cols] == [0, 256, 512, 768]
+        assert all(col.geometry().width() == 240 for col in cols)
+        print("✓ span 与 gutter 几何位置正确")
+
+        # 测试 order 与 offset
+        row = Row()
+        first = Col(span=8, order=2, widget=QLabel("first"))
+        second = Col(span=8, offset=4, order=1, widget=QLabel("second"))
+        row.add_col(first)
+        row.add_col(second)
+        row.resize(960, 40)
+        row._layout.setGeometry(row.rect())
+        assert second.geometry().x() == 160
+        assert first.geometry().x() == 480
+        print("✓ order 与 offset 几何位置正确")
+
+        # 测试垂直对齐
+        row = Row(align="bottom")
+        col = Col(span=12, widget=QLabel("bottom"))
+        row.add_col(col)
+        row.resize(960, 200)
+        row._layout.setGeometry(row.rect())
+        assert col.geometry().bottom() == 199
+        row.set_align("stretch")
+        row._layout.setGeometry(row.rect())
+        assert col.geometry().height() == 200
+        print("✓ 垂直对齐测试通过")
+
+        return True
+    except Exception as e:
+        print(f"✗ 栅格布局几何测试失败: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_grid_layout_wrap():
+    """测试换行与按宽度缓存"""
+    try:
+        # 创建 QApplication
+        try:
+            from PySide6.QtWidgets import QApplication, QLabel
+        except ImportError:
+            from PyQt6.QtWidgets import QApplication, QLabel
+
+        app = QApplication.instance() or QApplication(sys.argv)
+
+        from adw.components.layout.grid_model import break_lines
+        from adw.components.layout.grid import Row, Col
+
+        # 测试换行位置
+        entries = [(8, 0, 0, 0, 0)] * 3 + [(12, 0, 0, 0, 0), (6, 6, 0, 0, 0), (12, 0, 0, 0, 0)]
+        assert break_lines(entries, [0] * 6, 960, 16) == [[0, 1, 2], [3, 4], [5]]
+        print("✓ 换行位置计算正确")
+
+        # 测试换行后的几何位置与垂直间距
+        row = Row(gutter=[16, 24])
+        cols = [Col(span=12, widget=QLabel(f"col-{index}")) for index in range(3)]
+        for col in cols:
+            row.add_col(col)
+        line_height = cols[0].sizeHint().height()
+        assert row._layout.hasHeightForWidth()
+        assert row._layout.heightForWidth(944) == line_height * 2 + 24
+        row.resize(944, line_height * 2 + 24)
+        row._layout.setGeometry(row.rect())
+        assert cols[2].geometry().x() == 0
+        assert cols[2].geometry().y() == line_height + 24
+        print("✓ 换行几何位置正确")
+
+        # 测试按宽度缓存
+        solution = row._layout._solve(944)
+        assert row._layout._solve(944) is solution
+        row.set_gutter([16, 8])
+        assert row._layout._solve(944) is not solution
+        print("✓ 按宽度缓存测试通过")
+
+        # 测试不换行
+        row.set_wrap(False)
+        assert row._layout.heightForWidth(944) == line_height
+        print("✓ 不换行测试通过")
+
+        return True
+    except Exception as e:
+        print(f"✗ 换行测试失败: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_flex():
+    """测试 flex 解析与分配"""
+    try:
+        # 创建 QApplication
+        try:
+            from PySide6.QtWidgets import QApplication, QLabel
+        except ImportError:
+            from PyQt6.QtWidgets import QApplication, QLabel
+
+        app = QApplication.instance() or QApplication(sys.argv)
+
+        from adw.components.layout.grid_model import FlexSpec, parse_flex, resolve_flex, solve_line
+        from adw.components.layout.grid import Row, Col
+
+        # 测试解析
+        assert parse_flex(2) == FlexSpec(2.0, 2.0)
+        assert parse_flex("auto") == FlexSpec(1.0, 1.0)
+        assert parse_flex("none") == FlexSpec(0.0, 0.0)
+        assert parse_flex("200px") == FlexSpec(0.0, 0.0, 200.0, False)
+        assert parse_flex("50%") == FlexSpec(0.0, 0.0, 50.0, True)
+        assert parse_flex("1 1 200px") == FlexSpec(1.0, 1.0, 200.0, False)
+        assert parse_flex("2") == FlexSpec(2.0, 1.0, 0.0, True)
+        assert parse_flex("1 1 200px") is parse_flex("1 1 200px")
+        try:
+            parse_flex("1 1 1 1")
+            assert False, "非法 flex 应当抛出 ValueError"
+        except ValueError:
+            pass
+        print("✓ flex 解析测试通过")
+
+        # 测试剩余空间分配与最大宽度约束
+        flexes = [FlexSpec(1.0, 1.0, 0.0), FlexSpec(1.0, 1.0, 0.0), None]
+        assert resolve_flex([0, 0, 200], flexes, 400) == [200, 200, 200]
+        assert resolve_flex([0, 0, 200], flexes, 400, [(0, 100), (0, 1000), (0, 1000)]) == [100, 300, 200]
+        print("✓ flex 分配测试通过")
+
+        # 测试固定宽度与弹性列混排
+        entries = [(None, 0, 0, 0, 0), (None, 0, 0, 0, 0), (6, 0, 0, 0, 0)]
+        geometry = solve_line(entries, [0, 0, 0], 960, 0, flexes=[parse_flex("100px"), parse_flex("auto"), None])
+        assert geometry == [(0, 100), (100, 620), (720, 240)]
+        print("✓ flex 混排测试通过")
+
+        # 测试 Col(flex=...) 在 Row 中生效
+        row = Row()
+        fixed = Col(flex="100px", widget=QLabel("fixed"))
+        fill = Col(flex="auto", widget=QLabel("fill"))
+        row.add_col(fixed)
+        row.add_col(fill)
+        row.resize(600, 40)
+        row._layout.setGeometry(row.rect())
+        assert fixed.geometry().width() == 100
+        assert fill.geometry().x() == 100 and fill.geometry().width() == 500
+        fill.set_flex("none")
+        assert fill.get_flex_spec() == FlexSpec(0.0, 0.0)
+        print("✓ Col flex 布局测试通过")
+
+        return True
+    except Exception as e:
+        print(f"✗ flex 测试失败: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_grid_items():
+    """测试轻量列模式"""
+    try:
+        # 创建 QApplication
+        try:
+            from PySide6.QtWidgets import QApplication, QLabel
+        except ImportError:
+            from PyQt6.QtWidgets import QApplication, QLabel
+
+        app = QApplication.instance() or QApplication(sys.argv)
+
+        from adw.components.layout.grid_layout import GridItem
+        from adw.components.layout.grid import Row, Col
+
+        # 测试子组件直接放入 Row
+        row = Row(gutter=8)
+        labels = [QLabel(f"cell-{index}") for index in range(3)]
+        items = [row.add_col(label, span=8, xs=0, md=8) for label in labels]
+        assert all(isinstance(item, GridItem) for item in items)
+        assert all(label.parentWidget() is row for label in labels)
+        assert all(label.isHidden() for label in labels)
+        print("✓ 轻量列添加测试通过")
+
+        # 测试断点切换与几何位置
+        row._update_breakpoint(1000)
+        assert not any(label.isHidden() for label in labels)
+        row.resize(968, 40)
+        row._layout.setGeometry(row.rect())
+        assert [label.geometry().x() for label in labels] == [0, 325, 651]
+        print("✓ 轻量列几何位置正确")
+
+        # 测试更新属性
+        items[0].set_props(md=4)
+        row._layout.setGeometry(row.rect())
+        assert labels[0].geometry().width() == 155
+        assert labels[1].geometry().x() == 163
+        print("✓ 轻量列属性更新测试通过")
+
+        # 测试与 Col 混用
+        col = Col(span=8, widget=QLabel("col"))
+        assert row.add_col(col) is None
+        assert col.get_responsive_entry()[0] == 8
+        print("✓ 轻量列与 Col 混用测试通过")
+
+        # 测试批量添加
+        bulk = Row()
+        widgets = [QLabel("a"), QLabel("b")]
+        results = bulk.add_cols([(widgets[0], {'span': 6, 'xs': 0}), widgets[1], Col(span=4)])
+        assert isinstance(results[0], GridItem) and results[2] is None
+        assert bulk._layout.count() == 3
+        assert widgets[0].isHidden() and widgets[1].parentWidget() is bulk
+        print("✓ 批量添加测试通过")
+
+        # 测试窗口尺寸变化导致断点切换后轻量列重新布局
+        from adw.common.qt import QWidget
+        window = QWidget()
+        window.resize(700, 200)
+        responsive = Row(parent=window)
+        responsive.setFixedSize(300, 100)
+        cells = [QLabel(), QLabel()]
+        for cell in cells:
+            responsive.add_col(cell, xs=24, lg=12)
+        window.show()
+        app.processEvents()
+        assert [(cell.x(), cell.y(), cell.width()) for cell in cells] == [(0, 0, 300), (0, cells[0].height(), 300)]
+        window.resize(1000, 200)
+        app.processEvents()
+        assert responsive.get_breakpoint().value == "lg"
+        assert [(cell.x(), cell.y(), cell.width()) for cell in cells] == [(0, 0, 150), (150, 0, 150)]
+        window.close()
+        print("✓ 断点切换后轻量列重新布局")
+
+        return True
+    except Exception as e:
+        print(f"✗ 轻量列测试失败: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_dirty_tracking():
+    """测试嵌套 Row 的增量重新布局"""
+    try:
+        # 创建 QApplication
+        try:
+            from PySide6.QtWidgets import QApplication, QLabel, QWidget, QVBoxLayout
+        except ImportError:
+            from PyQt6.QtWidgets import QApplication, QLabel, QWidget, QVBoxLayout
+
+        app = QApplication.instance() or QApplication(sys.argv)
+
+        from adw.components.layout import grid_layout
+        from adw.components.layout.grid import Row, Col
+
+        window = QWidget()
+        outer = Row(gutter=16)
+        QVBoxLayout(window).addWidget(outer)
+        inner = Row()
+        first = Col(span=12, widget=QLabel("first"))
+        second = Col(span=12, widget=QLabel("second"))
+        inner.add_col(first)
+        inner.add_col(second)
+        outer.add_col(Col(span=12, widget=inner))
+        outer.add_col(Col(span=12, widget=QLabel("right")))
+        window.resize(800, 300)
+        window.show()
+        app.processEvents()
+        grid_layout.flush_layouts()
+
+        # 记录重新计算的布局
+        relayouts = []
+        original = grid_layout.GridLayout._relayout
+
+        def counting_relayout(layout):
+            relayouts.append(layout)
+            return original(layout)
+
+        grid_layout.GridLayout._relayout = counting_relayout
+        try:
+            # 尺寸贡献不变时只重新计算内层 Row
+            inner.set_justify("center")
+            inner.set_align("middle")
+            grid_layout.flush_layouts()
+            assert relayouts == [inner.layout()]
+            print("✓ 仅重新计算发生变化的 Row")
+
+            # 多次修改合并为一次计算，span 变化立即作用于几何位置
+            relayouts.clear()
+            first.set_span(6)
+            first.set_offset(2)
+            grid_layout.flush_layouts()
+            assert relayouts.count(inner.layout()) == 1
+            assert abs(first.geometry().width() - inner.width() / 4) <= 1
+            # justify="center": offset 2 + span 6 + span 12 剩余 4 格，两侧各 2 格
+            assert abs(first.geometry().x() - inner.width() / 6) <= 1
+            print("✓ 多次修改合并为一次计算")
+        finally:
+            grid_layout.GridLayout._relayout = original
+
+        window.close()
+        return True
+    except Exception as e:
+        print(f"✗ 增量重新布局测试失败: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_resize_policy():
+    """测试合并尺寸变化与等比缩放"""
+    try:
+        # 创建 QApplication
+        try:
+            from PySide6.QtWidgets import QApplication, QLabel
+            from PySide6.QtCore import QRect
+        except ImportError:
+            from PyQt6.QtWidgets import QApplication, QLabel
+            from PyQt6.QtCore import QRect
+
+        app = QApplication.instance() or QApplication(sys.argv)
+
+        from adw.components.layout.grid import Row
+        from adw.components.layout.grid_layout import ResizePolicy
+
+        policy = ResizePolicy(settle_ms=10000)
+        outer = Row()
+        outer.set_resize_policy(policy)
+        inner = Row()
+        labels = [QLabel(str(index)) for index in range(2)]
+        for label in labels:
+            inner.add_col(label, span=12)
+        outer.add_col(inner, span=12)
+        assert inner.get_resize_policy() is policy
+        print("✓ 嵌套 Row 继承尺寸变化策略")
+
+        # 第一次布局没有可缩放的结果，直接精确布局
+        outer.resize(960, 40)
+        outer.show()
+        app.processEvents()
+        assert inner.geometry().width() == 480
+        assert policy.get_counters()['exact_layouts'] >= 1
+
+        # 连续的尺寸变化被合并，下一帧按比例缩放
+        policy.reset_counters()
+        for width in (900, 800, 720):
+            outer._layout.setGeometry(QRect(0, 0, width, 40))
+        assert inner.geometry().width() == 480
+        counters = policy.get_counters()
+        assert counters['coalesced_events'] == 3 and counters['scaled_layouts'] == 0
+        policy._on_frame()
+        assert inner.geometry().width() == 360
+        assert labels[1].geometry().x() == 180
+        assert policy.get_counters()['scaled_layouts'] == 2
+        assert policy.is_pending()
+        print("✓ 合并与等比缩放测试通过")
+
+        # 停止调整后精确布局
+        outer.set_gutter(16)
+        policy.flush()
+        assert not policy.is_pending()
+        assert inner.geometry().width() == 352
+        assert labels[1].geometry().x() == 176
+        print("✓ 精确布局测试通过")
+
+        # 不合并时每次立即精确布局
+        policy.set_coalesce(False)
+        outer._layout.setGeometry(QRect(0, 0, 496, 40))
+        assert inner.geometry().width() == 240
+        print("✓ 关闭合并测试通过")
+
+        outer.close()
+        return True
+    except Exception as e:
+        print(f"✗ 尺寸变化策略测试失败: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def main():
+    """主测试函数"""
+    print("开始测试 GridLayout 栅格布局引擎...")
+
+    tests = [
+        ("单行几何计算", test_solve_line),
+        ("栅格布局几何", test_grid_layout_geometry),
+        ("换行布局", test_grid_layout_wrap),
+        ("flex 布局", test_flex),
+        ("轻量列", test_grid_items),
+        ("增量重新布局", test_dirty_tracking),
+        ("尺寸变化策略", test_resize_policy)
+    ]
+
+    passed = 0
+    total = len(tests)
+
+    for name, test_func in tests:
+        print(f"\n测试 {name}:")
+        if test_func():
+            passed += 1
+            print(f"✓ {name} 测试通过")
+        else:
+            print(f"✗ {name} 测试失败")
+
+    print(f"\nGridLayout 测试完成: {passed}/{total} 通过")
+    return passed == total
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,202 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+grid_model 栅格布局模型测试 (不需要 QApplication)
+"""
+
+import sys
+import os
+
+# 添加项目根目录到 Python 路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+
+def test_layout_row():
+    """测试不依赖 Qt 的行布局计算"""
+    try:
+        from adw.components.layout.grid_model import ColModel, RowModel, Rect, layout_row
+        print("✓ 成功导入 grid_model")
+
+        # 测试基础栅格与 gutter
+        row = RowModel(cols=[ColModel(span=12, height=20), ColModel(span=12, height=30)], gutter=16)
+        result = layout_row(row, 944)
+        assert result.rects == [Rect(0, 0, 464, 20), Rect(480, 0, 464, 30)]
+        assert result.height == 30
+        print("✓ 基础栅格测试通过")
+
+        # 测试排序、换行与垂直间距
+        row = RowModel(
+            cols=[ColModel(span=16, height=10), ColModel(span=16, order=-1, height=10)],
+            gutter=[0, 8]
+        )
+        result = layout_row(row, 960)
+        assert result.rects == [Rect(0, 18, 640, 10), Rect(0, 0, 640, 10)]
+        assert result.height == 28
+        print("✓ 排序与换行测试通过")
+
+        # 测试响应式隐藏与断点
+        row = RowModel(cols=[ColModel(span=8, xs=0, md=12), ColModel(span=8)])
+        assert layout_row(row, 400).rects[0] is None
+        assert layout_row(row, 960).rects[0].width == 480
+        assert layout_row(row, 960, breakpoint="xs").rects[0] is None
+        print("✓ 响应式测试通过")
+
+        # 测试 flex、对齐与按宽度计算高度
+        row = RowModel(
+            cols=[
+                ColModel(flex="100px", height=10),
+                ColModel(flex="auto", height=lambda width: width // 10),
+            ],
+            align="bottom"
+        )
+        result = layout_row(row, 600)
+        assert result.rects == [Rect(0, 40, 100, 10), Rect(100, 0, 500, 50)]
+        assert layout_row(row, 600, height=80).rects[0] == Rect(0, 70, 100, 10)
+        print("✓ flex 与对齐测试通过")
+
+        # 测试大量计算
+        row = RowModel(cols=[ColModel(span=6, height=20) for _ in range(24)], gutter=[16, 16])
+        for width in range(300, 1300):
+            assert layout_row(row, width).height == 6 * 20 + 5 * 16
+        print("✓ 批量计算测试通过")
+
+        return True
+    except Exception as e:
+        print(f"✗ 行布局计算测试失败: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_solve_span_rows():
+    """测试批量求解"""
+    try:
+        from adw.components.layout import grid_model
+        from adw.components.layout.grid_model import solve_span_rows, solve_columns
+
+        rows = [
+            [(6, 0, 0, 0, 0)] * 4,
+            [(8, 0, 0, 0, 0), (16, 0, 0, 0, 0), (12, 0, 0, 0, 0)],
+            [(12, 0, 0, 0, 1), (0, 0, 0, 0, 0), (6, 6, 0, 0, 0)],
+            [(10, 2, 4, 0, 0), (10, 0, 0, 4, 0)],
+        ] * 50
+        widths = [300 + index * 7 for index in range(len(rows))]
+
+        modes = [False] + ([True] if grid_model.numpy is not None else [])
+        for use_numpy in modes:
+            for justify in ("start", "center", "space-between"):
+                result = solve_span_rows(rows, widths, 16, justify, use_numpy=use_numpy)
+                for index, (entries, width) in enumerate(zip(rows, widths)):
+                    expected = {}
+                    for line_number, line in enumerate(
+                        solve_columns([entry for entry in entries if entry[0] != 0],
+                                      [0] * len(entries), width, 16, justify)
+                    ):
+                        for column, x, w in line:
+                            expected[column] = (x, w, line_number)
+                    visible = [column for column, entry in enumerate(entries) if entry[0] != 0]
+                    for position, column in enumerate(visible):
+                        actual = (
+                            int(result.x[index][column]),
+                            int(result.width[index][column]),
+                            int(result.line[index][column])
+                        )
+                        assert actual == expected[position], (entries, width, actual, expected[position])
+                    hidden = [column for column, entry in enumerate(entries) if entry[0] == 0]
+                    assert all(int(result.line[index][column]) == -1 for column in hidden)
+            print(f"✓ 批量求解与逐行求解一致 (NumPy: {use_numpy})")
+
+        try:
+            solve_span_rows([[(None, 0, 0, 0, 0)]], 960)
+            assert False, "按内容宽度的列应抛出异常"
+        except ValueError:
+            pass
+        print("✓ 非 span 列测试通过")
+
+        return True
+    except Exception as e:
+        print(f"✗ 批量求解测试失败: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_matches_grid_layout():
+    """测试与 GridLayout 的计算结果一致"""
+    try:
+        # 创建 QApplication
+        try:
+            from PySide6.QtWidgets import QApplication, QWidget
+            from PySide6.QtCore import QRect
+        except ImportError:
+            from PyQt6.QtWidgets import QApplication, QWidget
+            from PyQt6.QtCore import QRect
+
+        app = QApplication.instance() or QApplication(sys.argv)
+
+        from adw.components.layout.grid import Row
+        from adw.components.layout.grid_model import ColModel, RowModel, layout_row
+
+        props = [
+            {'span': 6, 'offset': 2},
+            {'span': 10, 'push': 4},
+            {'span': 8, 'order': -1},
+            {'span': 4, 'pull': 2},
+            {'flex': 'auto'},
+        ]
+        row = Row(gutter=[8, 4], justify="space-between")
+        widgets = []
+        for prop in props:
+            widget = QWidget()
+            widget.setFixedHeight(24)
+            row.add_col(widget, **prop)
+            widgets.append(widget)
+        row._layout.setGeometry(QRect(0, 0, 968, 24))
+
+        model = RowModel(
+            cols=[ColModel(height=24, **prop) for prop in props],
+            gutter=[8, 4],
+            justify="space-between"
+        )
+        rects = layout_row(model, 968, breakpoint="xs").rects
+        for widget, rect in zip(widgets, rects):
+            geometry = widget.geometry()
+            assert (geometry.x(), geometry.y(), geometry.width()) == (rect.x, rect.y, rect.width), (geometry, rect)
+        print("✓ 与 GridLayout 结果一致")
+
+        return True
+    except Exception as e:
+        print(f"✗ 一致性测试失败: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def main():
+    """主测试函数"""
+    print("开始测试 grid_model 栅格布局模型...")
+
+    tests = [
+        ("行布局计算", test_layout_row),
+        ("批量求解", test_solve_span_rows),
+        ("与 GridLayout 一致", test_matches_grid_layout)
+    ]
+
+    passed = 0
+    total = len(tests)
+
+    for name, test_func in tests:
+        print(f"\n测试 {name}:")
+        if test_func():
+            passed += 1
+            print(f"✓ {name} 测试通过")
+        else:
+            print(f"✗ {name} 测试失败")
+
+    print(f"\ngrid_model 测试完成: {passed}/{total} 通过")
+    return passed == total
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,187 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+I18nManager 国际化测试
+"""
+
+import sys
+import os
+
+# 添加项目根目录到 Python 路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+
+def test_catalog():
+    """测试翻译目录的编译与查询 (不需要 QApplication)"""
+    try:
+        import tempfile
+        from adw.i18n.catalog import Catalog, compile_catalog
+        print("✓ 成功导入 Catalog")
+
+        translations = {
+            "common": {"ok": "确定", "key%d" % 0: "值 0"},
+            "big": {"key%d" % index: "值 %d" % index for index in range(1000)},
+            "nested": {"a": {"b": {"c": "嵌套"}}},
+        }
+        data = compile_catalog(translations)
+        catalog = Catalog(data)
+        assert catalog.get_namespaces() == ["common", "big", "nested"]
+        assert catalog.get_loaded_namespaces() == []
+        assert catalog.lookup("common", "ok") == "确定"
+        assert catalog.get_loaded_namespaces() == ["common"]
+        assert all(catalog.lookup("big", "key%d" % index) == "值 %d" % index for index in range(1000))
+        assert catalog.lookup("nested", "a.b.c") == "嵌套"
+        assert catalog.lookup("big", "missing") is None
+        assert catalog.lookup("missing", "ok") is None
+        print("✓ 哈希表查询测试通过")
+
+        path = os.path.join(tempfile.mkdtemp(), "test.cat")
+        with open(path, "wb") as file:
+            file.write(data)
+        mapped = Catalog.open(path)
+        assert mapped.lookup("big", "key999") == "值 999"
+        print("✓ 内存映射测试通过")
+
+        try:
+            Catalog(b"not a catalog at all")
+            assert False, "无效数据应抛出异常"
+        except ValueError:
+            pass
+
+        return True
+    except Exception as e:
+        print(f"✗ 翻译目录测试失败: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_translate():
+    """测试翻译查询"""
+    try:
+        import tempfile
+        from adw.i18n import I18nManager, tr, set_locale, build_catalogs, compile_catalog
+
+        set_locale("zh_CN")
+        assert {"zh_CN", "en_US"} <= set(I18nManager.get_locales())
+        assert tr("common.ok") == "确定"
+        assert tr("validation.required", field="名称") == "请输入名称"
+        assert tr("components.button.loading") == "加载中"
+        assert tr("unknown.key") == "unknown.key"
+        print("✓ 中文翻译测试通过")
+
+        set_locale("en_US")
+        assert tr("common.ok") == "OK"
+        assert tr("validation.min_length", field="Name", min=3) == "Name must be at least 3 characters"
+        print("✓ 切换语言测试通过")
+
+        # 当前语言缺少的键使用后备语言
+        I18nManager.add_translations("zh_CN", {"app": {"title": "应用"}})
+        assert tr("app.title") == "应用"
+        I18nManager.add_translations("en_US", {"app": {"title": "App"}})
+        assert tr("app.title") == "App" and tr("common.cancel") == "Cancel"
+        print("✓ 后备语言与添加翻译测试通过")
+
+        # 编译后的文件通过内存映射打开
+        directory = tempfile.mkdtemp()
+        paths = build_catalogs(directory, ["en_US"])
+        assert paths == [os.path.join(directory, "en_US.cat")]
+        with open(os.path.join(directory, "fr_FR.cat"), "wb") as file:
+            file.write(compile_catalog({"common": {"ok": "D'accord"}}))
+        I18nManager.add_catalog_path(directory)
+        assert "fr_FR" in I18nManager.get_locales()
+        set_locale("fr_FR")
+        assert tr("common.ok") == "D'accord" and tr("common.cancel") == "取消"
+        assert I18nManager.get_catalog("fr_FR").lookup("common", "ok") == "D'accord"
+        set_locale("zh_CN")
+        assert tr("common.ok") == "确定"
+        print("✓ 编译翻译文件测试通过")
+
+        return True
+    except Exception as e:
+        print(f"✗ 翻译查询测试失败: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_retranslate():
+    """测试组件批量重新翻译"""
+    try:
+        # 创建 QApplication
+        try:
+            from PySide6.QtWidgets import QApplication, QWidget, QVBoxLayout
+        except ImportError:
+            from PyQt6.QtWidgets import QApplication, QWidget, QVBoxLayout
+
+        app = QApplication.instance() or QApplication(sys.argv)
+
+        from adw.i18n import I18nManager, set_locale
+        from adw.components.widgets.button import Button
+        from adw.components.widgets.divider import Divider
+
+        set_locale("zh_CN")
+        window = QWidget()
+        layout = QVBoxLayout(window)
+        buttons = [Button(text_key="common.submit") for _ in range(200)]
+        for button in buttons:
+            layout.addWidget(button)
+        divider = Divider(text="旧文本", text_key="components.divider.text")
+        layout.addWidget(divider)
+        window.show()
+        assert buttons[0].text() == "提 交"
+        assert divider.get_text() == "分割线"
+        print("✓ 按翻译键设置文本")
+
+        updates = []
+        original = window.setUpdatesEnabled
+        window.setUpdatesEnabled = lambda enabled: (updates.append(enabled), original(enabled))
+
+        set_locale("en_US")
+        assert all(button.text() == "Submit" for button in buttons)
+        assert divider.get_text() == "Divider"
+        assert updates == [False, True] and window.updatesEnabled()
+        print("✓ 切换语言后重新翻译")
+
+        buttons[0].set_text_key(None)
+        set_locale("zh_CN")
+        assert buttons[0].text() == "Submit" and buttons[1].text() == "提 交"
+        print("✓ 取消翻译键测试通过")
+
+        window.close()
+        return True
+    except Exception as e:
+        print(f"✗ 重新翻译测试失败: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def main():
+    """主测试函数"""
+    print("开始测试 I18nManager 国际化...")
+
+    tests = [
+        ("翻译目录", test_catalog),
+        ("翻译查询", test_translate),
+        ("重新翻译", test_retranslate)
+    ]
+
+    passed = 0
+    total = len(tests)
+
+    for name, test_func in tests:
+        print(f"\n测试 {name}:")
+        if test_func():
+            passed += 1
+            print(f"✓ {name} 测试通过")
+        else:
+            print(f"✗ {name} 测试失败")
+
+    print(f"\nI18nManager 测试完成: {passed}/{total} 通过")
+    return passed == total
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,205 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+IconManager 图标系统测试
+"""
+
+import sys
+import os
+
+# 添加项目根目录到 Python 路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+
+def test_icon_cache():
+    """测试图标光栅化与缓存"""
+    try:
+        # 创建 QApplication
+        try:
+            from PySide6.QtWidgets import QApplication
+        except ImportError:
+            from PyQt6.QtWidgets import QApplication
+
+        app = QApplication.instance() or QApplication(sys.argv)
+
+        from adw.styles.icons import IconManager, parse_color
+        print("✓ 成功导入 IconManager")
+
+        assert {"search", "plus", "close", "loading"} <= set(IconManager.get_names())
+        assert parse_color("rgba(0, 0, 0, 0.25)").alpha() == 64
+        assert parse_color("#1890ff").blue() == 255
+
+        # 不使用图集，确保蒙版来自光栅化
+        IconManager.set_atlas(None)
+        IconManager.reset_counters()
+        pixmap = IconManager.get_pixmap("search", 16, "#1890ff", 2.0)
+        assert pixmap.width() == 32 and pixmap.devicePixelRatio() == 2.0
+        image = pixmap.toImage()
+        colors = {image.pixelColor(x, y).name() for x in range(32) for y in range(32)
+                  if image.pixelColor(x, y).alpha() == 255}
+        assert colors == {"#1890ff"}
+        print("✓ 按 devicePixelRatio 光栅化并着色")
+
+        # 同一蒙版的其它颜色只需要着色，相同组合直接命中缓存
+        assert IconManager.get_pixmap("search", 16, "#1890ff", 2.0) is pixmap
+        IconManager.get_pixmap("search", 16, "#ff4d4f", 2.0)
+        counters = IconManager.get_counters()
+        assert counters['rasterizations'] == 1 and counters['tints'] == 2 and counters['hits'] == 1
+        print("✓ 缓存测试通过")
+
+        IconManager.register("dot", '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 8 8"><circle cx="4" cy="4" r="4"/></svg>')
+        assert IconManager.has_icon("dot") and not IconManager.has_icon("missing")
+        try:
+            IconManager.get_pixmap("missing", 16, "#000000")
+            assert False, "未知图标应抛出异常"
+        except ValueError:
+            pass
+        print("✓ 注册图标测试通过")
+
+        limit = IconManager.get_cache_limit()
+        IconManager.set_cache_limit(2)
+        for color in ("#000000", "#111111", "#222222"):
+            IconManager.get_pixmap("dot", 8, color)
+        assert IconManager.get_cache_size() == 2
+        IconManager.set_cache_limit(limit)
+        print("✓ 缓存上限测试通过")
+
+        return True
+    except Exception as e:
+        print(f"✗ 图标缓存测试失败: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_icon_atlas():
+    """测试内存映射图集"""
+    try:
+        # 创建 QApplication
+        try:
+            from PySide6.QtWidgets import QApplication
+        except ImportError:
+            from PyQt6.QtWidgets import QApplication
+
+        app = QApplication.instance() or QApplication(sys.argv)
+
+        import tempfile
+        from adw.styles.icons import IconManager, IconAtlas, BUILTIN_ICON_DIR, build_atlas
+
+        directory = tempfile.mkdtemp()
+        path = os.path.join(directory, "icons.atlas")
+        count = build_atlas(path, sizes=[14, 16], ratios=[1.0, 2.0])
+        assert count == len(os.listdir(BUILTIN_ICON_DIR)) * 4
+        atlas = IconAtlas(path)
+        assert len(atlas) == count and "search" in atlas.get_names()
+        assert atlas.has_tile("search", 16, 2.0) and not atlas.has_tile("search", 20)
+        mask = atlas.get_mask("search", 16, 2.0)
+        assert mask.width() == 32 and mask.hasAlphaChannel()
+        print("✓ 生成并读取图集")
+
+        # 从图集读取的蒙版与直接光栅化的结果一致
+        IconManager.set_atlas(None)
+        expected = IconManager.get_pixmap("search", 16, "#1890ff", 2.0).toImage()
+        IconManager.set_atlas(path)
+        IconManager.reset_counters()
+        actual = IconManager.get_pixmap("search", 16, "#1890ff", 2.0).toImage()
+        assert all(actual.pixel(x, y) == expected.pixel(x, y) for x in range(32) for y in range(32))
+        counters = IconManager.get_counters()
+        assert counters['atlas_tiles'] == 1 and counters['rasterizations'] == 0
+        print("✓ 图集蒙版与光栅化结果一致")
+
+        # 图集中没有的尺寸和注册的图标仍然光栅化
+        IconManager.register("atlas-dot", '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 8 8"><circle cx="4" cy="4" r="4"/></svg>')
+        IconManager.get_pixmap("search", 20, "#1890ff")
+        IconManager.get_pixmap("atlas-dot", 14, "#1890ff")
+        assert IconManager.get_counters()['rasterizations'] == 2
+        print("✓ 图集缺失时回退到光栅化")
+
+        IconManager.set_atlas(None)
+        return True
+    except Exception as e:
+        print(f"✗ 图集测试失败: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_button_icon():
+    """测试按钮图标的异步光栅化与状态颜色"""
+    try:
+        # 创建 QApplication
+        try:
+            from PySide6.QtWidgets import QApplication
+        except ImportError:
+            from PyQt6.QtWidgets import QApplication
+
+        app = QApplication.instance() or QApplication(sys.argv)
+
+        from adw.styles.colors import ColorPalette
+        from adw.styles.icons import IconManager
+        from adw.components.widgets.button import Button
+
+        IconManager.set_atlas(None)
+        IconManager.reset_counters()
+        names = ["search", "plus", "edit", "delete"]
+        buttons = [Button(icon=names[index % 4]) for index in range(200)]
+        assert IconManager.is_pending()
+        assert buttons[0].iconSize().width() == 14
+        print("✓ 光栅化完成前显示占位图")
+
+        IconManager.flush()
+        assert not IconManager.is_pending()
+        assert IconManager.get_counters()['rasterizations'] == 4
+        image = buttons[0].icon().pixmap(14, 14).toImage()
+        assert any(image.pixelColor(x, y).alpha() > 0 for x in range(image.width()) for y in range(image.height()))
+        print("✓ 200 个按钮只光栅化 4 个图标")
+
+        button = buttons[0]
+        assert button._get_icon_color() == ColorPalette.get_text_color()
+        button.set_danger(True)
+        assert button._get_icon_color() == ColorPalette.get_error_color()
+        button.setEnabled(False)
+        assert button._get_icon_color() == ColorPalette.get_disabled_text_color()
+        assert Button(icon="plus", type="primary")._get_icon_color() == "#ffffff"
+        print("✓ 状态颜色测试通过")
+
+        button.set_icon(None)
+        assert button.icon().isNull() and button.get_icon() is None
+        print("✓ 移除图标测试通过")
+
+        return True
+    except Exception as e:
+        print(f"✗ 按钮图标测试失败: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def main():
+    """主测试函数"""
+    print("开始测试 IconManager 图标系统...")
+
+    tests = [
+        ("图标缓存", test_icon_cache),
+        ("图标图集", test_icon_atlas),
+        ("按钮图标", test_button_icon)
+    ]
+
+    passed = 0
+    total = len(tests)
+
+    for name, test_func in tests:
+        print(f"\n测试 {name}:")
+        if test_func():
+            passed += 1
+            print(f"✓ {name} 测试通过")
+        else:
+            print(f"✗ {name} 测试失败")
+
+    print(f"\nIconManager 测试完成: {passed}/{total} 通过")
+    return passed == total
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,136 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+adw 包延迟导出测试
+"""
+
+import sys
+import os
+import subprocess
+
+# 添加项目根目录到 Python 路径
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+
+# 子进程在导入后输出加载的 Qt 模块和 adw 模块
+CHILD = """
+import sys
+{statement}
+print(sorted(name for name in sys.modules if name.split('.')[0] in ('PySide6', 'PyQt6')))
+print(sorted(name for name in sys.modules if name.startswith('adw.')))
+"""
+
+
+def run_child(statement: str):
+    """在新进程中执行导入语句，返回 (Qt 模块, adw 模块)"""
+    environ = dict(os.environ, PYTHONPATH=ROOT)
+    result = subprocess.run(
+        [sys.executable, "-c", CHILD.format(statement=statement)],
+        capture_output=True, text=True, env=environ
+    )
+    assert result.returncode == 0, result.stderr
+    qt_modules, adw_modules = result.stdout.splitlines()
+    return eval(qt_modules), eval(adw_modules)
+
+
+def test_import_without_qt():
+    """测试导入包本身不加载 Qt"""
+    try:
+        qt_modules, adw_modules = run_child("import adw, adw.styles, adw.components")
+        assert qt_modules == [], qt_modules
+        assert 'adw.styles.colors' not in adw_modules
+        print("✓ import adw / adw.styles / adw.components 不加载 Qt")
+
+        qt_modules, adw_modules = run_child("from adw.styles import ColorPalette")
+        assert qt_modules == []
+        assert 'adw.styles.colors' in adw_modules and 'adw.styles.breakpoints' not in adw_modules
+        print("✓ 只导入用到的样式模块")
+
+        qt_modules, adw_modules = run_child("from adw.components import Row")
+        assert qt_modules and 'adw.components.widgets.button' not in adw_modules
+        print("✓ 只导入用到的组件模块")
+        return True
+
+    except Exception as e:
+        print(f"✗ 导入测试失败: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_lazy_exports():
+    """测试延迟导出的名称"""
+    try:
+        try:
+            from PySide6.QtWidgets import QApplication
+        except ImportError:
+            from PyQt6.QtWidgets import QApplication
+
+        app = QApplication.instance() or QApplication(sys.argv)
+
+        import adw
+        import adw.styles
+        import adw.components
+        from adw.components.widgets.button import Button
+        from adw.components.layout.grid import Row
+        from adw.styles.theme import set_theme
+
+        assert adw.__version__
+        assert adw.Button is Button and adw.components.Row is Row
+        assert adw.styles.set_global_theme is set_theme
+        assert 'Button' in dir(adw) and 'ColorPalette' in dir(adw.styles)
+        # 解析后缓存为包属性
+        assert vars(adw.components)['Row'] is Row
+        print("✓ 延迟导出的名称解析正常")
+
+        namespace = {}
+        exec("from adw.components import *", namespace)
+        assert set(adw.components.__all__) <= set(namespace)
+        print("✓ from adw.components import * 正常")
+
+        try:
+            adw.NoSuchComponent
+        except AttributeError:
+            pass
+        else:
+            raise AssertionError("未知名称应抛出 AttributeError")
+
+        button = adw.Button(text="OK")
+        assert button.text() == "OK"
+        print("✓ 组件创建正常")
+        return True
+
+    except Exception as e:
+        print(f"✗ 延迟导出测试失败: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def main():
+    """主测试函数"""
+    print("开始测试 adw 包延迟导出...")
+
+    tests = [
+        ("导入开销", test_import_without_qt),
+        ("延迟导出", test_lazy_exports)
+    ]
+
+    passed = 0
+    total = len(tests)
+
+    for name, test_func in tests:
+        print(f"\n测试 {name}:")
+        if test_func():
+            passed += 1
+            print(f"✓ {name} 测试通过")
+        else:
+            print(f"✗ {name} 测试失败")
+
+    print(f"\nadw 包测试完成: {passed}/{total} 通过")
+    return passed == total
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,294 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+性能统计测试
+"""
+
+import sys
+import os
+import gc
+import json
+import tempfile
+
+# 添加项目根目录到 Python 路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+
+def test_enable_disable():
+    """测试开启和关闭统计"""
+    try:
+        from adw.common.qt import QApplication
+        app = QApplication.instance() or QApplication(sys.argv)
+
+        import adw
+        from adw.components.widgets.button import Button
+        from adw.components.layout.grid_layout import GridLayout
+        from adw.styles.theme import ThemeManager
+
+        update_style = Button.__dict__['_update_style']
+        build_style_sheet = Button.__dict__['build_style_sheet']
+        assert 'setStyleSheet' not in Button.__dict__
+        assert not adw.perf.is_enabled()
+
+        adw.perf.enable()
+        try:
+            assert adw.perf.is_enabled()
+            assert Button.__dict__['_update_style'] is not update_style
+            assert isinstance(Button.__dict__['build_style_sheet'], classmethod)
+            assert 'setStyleSheet' in Button.__dict__
+        finally:
+            adw.perf.disable()
+
+        # 关闭后恢复原方法，调用路径与开启前相同
+        assert Button.__dict__['_update_style'] is update_style
+        assert Button.__dict__['build_style_sheet'] is build_style_sheet
+        assert 'setStyleSheet' not in Button.__dict__
+        assert '_apply_geometry' in GridLayout.__dict__
+        assert not hasattr(GridLayout._apply_geometry, '__wrapped__')
+        assert not hasattr(ThemeManager.set_theme, '__wrapped__')
+        print("✓ 关闭后恢复原方法")
+        return True
+
+    except Exception as e:
+        print(f"✗ 开关测试失败: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_records():
+    """测试按类统计和直方图"""
+    try:
+        from adw.common.qt import QApplication, QWidget
+        app = QApplication.instance() or QApplication(sys.argv)
+
+        import adw
+        from adw import perf
+        from adw.components.widgets.button import Button
+        from adw.components.layout.grid import Row, Col
+        from adw.components.layout.grid_layout import ResizePolicy
+        from adw.styles.theme import ThemeManager, ThemeType
+
+        class MyButton(Button):
+            pass
+
+        perf.reset()
+        with perf.profiling():
+            button = Button(text="OK", type="primary")
+            button.set_type("dashed")
+            MyButton(text="Custom")
+            ThemeManager.set_theme(ThemeType.DARK)
+            ThemeManager.set_theme(ThemeType.LIGHT)
+            window = QWidget()
+            row = Row(gutter=8, parent=window)
+            row.add_col(Col(span=12, widget=Button(text="A")))
+            policy = ResizePolicy(coalesce=False)
+            row.set_resize_policy(policy)
+            window.resize(800, 200)
+            window.show()
+            app.processEvents()
+            row.resize(600, 200)
+            window.hide()
+
+        assert not perf.is_enabled()
+        snapshot = perf.snapshot()
+        records = snapshot['records']
+        assert records['Button._setup_ui']['count'] == 2
+        assert records['Button._update_style']['count'] > records['Button._setup_ui']['count']
+        assert records['MyButton._setup_ui']['count'] == 1
+        assert records['Button.setStyleSheet']['category'] == "style_apply"
+        assert records['ThemeManager.set_theme']['count'] == 2
+        assert records['Row._update_gutter']['count'] >= 1
+        assert records['GridLayout._apply_geometry']['count'] >= 1
+        print("✓ 按调用对象的类统计")
+
+        record = records['Button._update_style']
+        assert len(record['histogram']) == len(snapshot['histogram_bounds_ms']) + 1
+        assert sum(record['histogram']) == record['count']
+        assert 0 < record['min_ms'] <= record['mean_ms'] <= record['max_ms']
+        assert snapshot['categories']['style_update']['count'] >= 3
+        assert 'style_cache' in snapshot['counters']
+        resize_counters = snapshot['counters']['resize_policy']
+        assert resize_counters['exact_layouts'] >= policy.get_counters()['exact_layouts'] > 0
+
+        # 策略被回收后累计计数不减少
+        row.set_resize_policy(None)
+        del policy
+        gc.collect()
+        assert perf.snapshot()['counters']['resize_policy'] == resize_counters
+        print("✓ 耗时直方图与分类汇总")
+
+        # 导出 JSON
+        path = os.path.join(tempfile.mkdtemp(), "perf.json")
+        perf.save(path)
+        with open(path, encoding="utf-8") as file:
+            assert json.load(file)['records'] == json.loads(perf.to_json())['records']
+        os.remove(path)
+
+        # 关闭时不再统计
+        Button(text="B")
+        assert perf.snapshot()['records']['Button._setup_ui']['count'] == 2
+        perf.reset()
+        assert perf.snapshot()['records'] == {}
+        assert not any(perf.snapshot()['counters']['resize_policy'].values())
+        print("✓ 导出 JSON，关闭后不再统计")
+        return True
+
+    except Exception as e:
+        print(f"✗ 统计测试失败: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_register_hook():
+    """测试登记自定义方法"""
+    try:
+        from adw import perf
+        from adw.styles.colors import ColorPalette
+
+        before = ColorPalette.__dict__['get_primary_color']
+        perf.register_hook("adw.styles.colors", "ColorPalette", "get_primary_color", "colors")
+        try:
+            with perf.profiling():
+                ColorPalette.get_primary_color()
+                ColorPalette.get_primary_color(5)
+            record = perf.snapshot()['records']['ColorPalette.get_primary_color']
+            assert record['count'] == 2 and record['category'] == "colors"
+            assert ColorPalette.__dict__['get_primary_color'] is before
+
+            # 开启时取消登记立即恢复原方法
+            perf.enable()
+            perf.unregister_hook("adw.styles.colors", "ColorPalette", "get_primary_color", "colors")
+            assert ColorPalette.__dict__['get_primary_color'] is before
+            perf.disable()
+        finally:
+            perf.unregister_hook("adw.styles.colors", "ColorPalette", "get_primary_color", "colors")
+            perf.reset()
+        print("✓ 自定义方法与分类")
+        return True
+
+    except Exception as e:
+        print(f"✗ 自定义方法测试失败: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_trace():
+    """测试 trace event 导出"""
+    try:
+        from adw.common.qt import QApplication, QWidget, QVBoxLayout
+        app = QApplication.instance() or QApplication(sys.argv)
+
+        from adw import perf
+        from adw.components.widgets.button import Button
+        from adw.components.widgets.divider import Divider
+        from adw.components.layout.grid import Row, Col
+        from adw.styles.theme import ThemeManager, ThemeType
+
+        path = os.path.join(tempfile.mkdtemp(), "trace.json")
+        with perf.tracing(path):
+            assert perf.is_tracing() and perf.is_enabled()
+            window = QWidget()
+            layout = QVBoxLayout(window)
+            button = Button(text="OK", type="primary")
+            button.set_type("default")
+            layout.addWidget(button)
+            layout.addWidget(Divider(text="标题"))
+            row = Row(gutter=8)
+            row.add_col(Col(span=12, widget=Button(text="A")))
+            layout.addWidget(row)
+            ThemeManager.set_theme(ThemeType.DARK)
+            ThemeManager.set_theme(ThemeType.LIGHT)
+            window.resize(640, 240)
+            window.grab()
+        assert not perf.is_tracing() and not perf.is_enabled()
+        assert not hasattr(Button.__dict__['paintEvent'], '__wrapped__')
+        print("✓ 跟踪结束后恢复原方法")
+
+        with open(path, encoding="utf-8") as file:
+            trace = json.load(file)
+        os.remove(path)
+        events = trace['traceEvents']
+        spans = [event for event in events if event['ph'] == "X"]
+        categories = {event['cat'] for event in spans}
+        for category in ("construct", "style_build", "style_apply", "layout_request", "relayout", "paint", "theme"):
+            assert category in categories, category
+        assert any(event['name'] == "thread_name" for event in events if event['ph'] == "M")
+        assert all(span['dur'] >= 0 and span['ts'] >= 0 for span in spans)
+        assert [span['ts'] for span in spans] == sorted(span['ts'] for span in spans)
+        assert any(span['args'].get('object_name') == "adw-button-default" and span['name'] == "Button._update_style"
+                   for span in spans)
+        assert any(span['name'] == "Button.paintEvent" and span['args']['class'] == "Button" for span in spans)
+        assert trace['otherData']['dropped'] == 0 and trace['otherData']['events'] == len(spans)
+        print(f"✓ 导出 {len(spans)} 个时间段")
+
+        # 开启跟踪前已创建 (并绘制过) 的组件同样统计绘制
+        existing = QWidget()
+        existing_layout = QVBoxLayout(existing)
+        existing_layout.addWidget(Button(text="Existing"))
+        existing_layout.addWidget(Divider())
+        existing_row = Row()
+        existing_row.add_col(Col(span=24, widget=Button(text="C")))
+        existing_layout.addWidget(existing_row)
+        existing.resize(320, 160)
+        existing.grab()
+        with perf.tracing():
+            existing.grab()
+        names = {event['name'] for event in perf.get_trace_events() if event['ph'] == "X"}
+        for name in ("Button.paintEvent", "Divider.paintEvent", "Row.paintEvent", "Col.paintEvent"):
+            assert name in names, name
+        perf.reset()
+        print("✓ 开启跟踪前创建的组件也统计绘制")
+
+        # 环形缓冲区只保留最近的时间段
+        perf.start_trace(capacity=5)
+        try:
+            for _ in range(3):
+                Button(text="B")
+        finally:
+            perf.stop_trace()
+        info = perf.PerfMonitor.get_trace_info()
+        assert info['events'] == 5 and info['dropped'] > 0
+        assert len([event for event in perf.get_trace_events() if event['ph'] == "X"]) == 5
+        perf.reset()
+        print("✓ 环形缓冲区丢弃最早的时间段")
+        return True
+
+    except Exception as e:
+        print(f"✗ 跟踪测试失败: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def main():
+    """主测试函数"""
+    print("开始测试性能统计...")
+
+    tests = [
+        ("开关", test_enable_disable),
+        ("统计", test_records),
+        ("自定义方法", test_register_hook),
+        ("跟踪", test_trace)
+    ]
+
+    passed = 0
+    total = len(tests)
+
+    for name, test_func in tests:
+        print(f"\n测试 {name}:")
+        if test_func():
+            passed += 1
+            print(f"✓ {name} 测试通过")
+        else:
+            print(f"✗ {name} 测试失败")
+
+    print(f"\n性能统计测试完成: {passed}/{total} 通过")
+    return passed == total
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,141 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Qt 绑定 (adw.common.qt) 测试
+"""
+
+import sys
+import os
+import subprocess
+
+# 添加项目根目录到 Python 路径
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+
+
+def run_child(code: str, **env) -> subprocess.CompletedProcess:
+    """在新进程中执行代码"""
+    environ = dict(os.environ, PYTHONPATH=ROOT, **env)
+    return subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=environ)
+
+
+def test_binding_names():
+    """测试名称解析与缓存"""
+    try:
+        from adw.common import qt
+        print(f"✓ 使用绑定 {qt.API}")
+
+        assert qt.API in qt.BINDINGS
+        widgets = qt.get_submodule("QtWidgets")
+        assert qt.QWidget is widgets.QWidget
+        # 解析后缓存为模块属性
+        assert vars(qt)["QWidget"] is widgets.QWidget
+        assert qt.QtCore.__name__ == f"{qt.API}.QtCore"
+
+        # Signal 在两个绑定中统一为同一名称
+        class Emitter(qt.QObject):
+            changed = qt.Signal(int)
+
+        values = []
+        emitter = Emitter()
+        emitter.changed.connect(values.append)
+        emitter.changed.emit(3)
+        assert values == [3]
+        print("✓ Signal 别名正常")
+
+        try:
+            qt.NoSuchQtName
+        except AttributeError:
+            pass
+        else:
+            raise AssertionError("未知名称应抛出 AttributeError")
+        print("✓ 名称解析与缓存正常")
+        return True
+
+    except Exception as e:
+        print(f"✗ 名称解析测试失败: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_lazy_submodules():
+    """测试只加载用到的子模块"""
+    try:
+        result = run_child(
+            "import sys\n"
+            "from adw.common.qt import QTimer, API\n"
+            "print(API + '.QtWidgets' in sys.modules, API + '.QtGui' in sys.modules)\n"
+        )
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.split() == ["False", "False"], result.stdout
+        print("✓ 只用到 QtCore 时不加载 QtGui 和 QtWidgets")
+
+        result = run_child("import adw.common.qt", ADW_QT_API="NoSuchBinding")
+        assert result.returncode != 0 and "ImportError" in result.stderr
+        print("✓ ADW_QT_API 指定不可用的绑定时抛出 ImportError")
+        return True
+
+    except Exception as e:
+        print(f"✗ 延迟加载测试失败: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_theme_palette():
+    """测试主题通过共享绑定设置调色板"""
+    try:
+        from adw.common.qt import QApplication, QWidget
+        app = QApplication.instance() or QApplication(sys.argv)
+
+        from adw.styles.theme import ThemeManager, ThemeType
+        widget = QWidget()
+        ThemeManager.set_theme(ThemeType.DARK)
+        try:
+            ThemeManager.apply_theme_to_widget(widget)
+            dark = widget.palette().window().color().name()
+            ThemeManager.set_theme(ThemeType.LIGHT)
+            ThemeManager.apply_theme_to_widget(widget)
+            light = widget.palette().window().color().name()
+        finally:
+            ThemeManager.set_theme(ThemeType.LIGHT)
+        assert dark != light
+        print("✓ 主题调色板应用正常")
+        return True
+
+    except Exception as e:
+        print(f"✗ 主题调色板测试失败: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def main():
+    """主测试函数"""
+    print("开始测试 Qt 绑定...")
+
+    tests = [
+        ("名称解析", test_binding_names),
+        ("延迟加载", test_lazy_submodules),
+        ("主题调色板", test_theme_palette)
+    ]
+
+    passed = 0
+    total = len(tests)
+
+    for name, test_func in tests:
+        print(f"\n测试 {name}:")
+        if test_func():
+            passed += 1
+            print(f"✓ {name} 测试通过")
+        else:
+            print(f"✗ {name} 测试失败")
+
+    print(f"\nQt 绑定测试完成: {passed}/{total} 通过")
+    return passed == total
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
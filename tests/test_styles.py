@@ -135,6 +135,94 @@ def test_theme():
         return False
 
 
+def test_style_cache():
+    """测试样式表缓存与样式包"""
+    try:
+        import tempfile
+        from adw.styles.cache import StyleCache
+        from adw.styles.theme import ThemeManager, ThemeType
+        print("✓ 成功导入样式表缓存")
+
+        custom_settings = dict(ThemeManager._custom_settings)
+        StyleCache.set_cache_dir(tempfile.mkdtemp())
+        StyleCache.clear()
+        StyleCache.reset_counters()
+        try:
+            ThemeManager.set_theme(ThemeType.LIGHT)
+            assert StyleCache.get_style_sheet("demo", ("primary", True)) is None
+            StyleCache.put_style_sheet("demo", ("primary", True), "QWidget { color: red; }")
+            assert StyleCache.get_style_sheet("demo", ("primary", True)) == "QWidget { color: red; }"
+            assert StyleCache.get_tokens()["palette.text"] == "rgba(0, 0, 0, 0.65)"
+
+            path = StyleCache.save()
+            assert path == StyleCache.get_bundle_path() and os.path.isfile(path)
+            # 没有新内容时不重复保存
+            assert StyleCache.save() is None
+            print(f"✓ 保存样式包: {os.path.basename(path)}")
+
+            # 模拟下次启动: 内存缓存为空时一次读取样式包
+            StyleCache.clear()
+            assert StyleCache.get_style_sheet("demo", ("primary", True)) == "QWidget { color: red; }"
+            counters = StyleCache.get_counters()
+            assert counters['bundle_loads'] == 1 and counters['bundle_saves'] == 1
+            print("✓ 读取样式包")
+
+            # 主题或自定义设置变化时使用另一个样式包
+            key = StyleCache.get_key()
+            ThemeManager.set_theme(ThemeType.DARK)
+            assert StyleCache.get_key() != key
+            assert StyleCache.get_style_sheet("demo", ("primary", True)) is None
+            ThemeManager.set_theme(ThemeType.LIGHT)
+            ThemeManager.set_custom_setting('border_radius', 4)
+            assert StyleCache.get_key() != key
+            print("✓ 样式包按版本、主题和自定义设置区分")
+
+            # 损坏的样式包被忽略
+            with open(StyleCache.get_bundle_path(), "w") as file:
+                file.write("{broken")
+            StyleCache.clear()
+            assert StyleCache.get_style_sheet("demo", ("primary", True)) is None
+            print("✓ 忽略损坏的样式包")
+
+            # 工作线程保存时主线程继续添加样式表
+            import threading
+            errors = []
+            stop = threading.Event()
+
+            def save_loop():
+                try:
+                    while not stop.is_set():
+                        StyleCache.save()
+                except Exception as error:
+                    errors.append(error)
+
+            worker = threading.Thread(target=save_loop)
+            worker.start()
+            try:
+                for index in range(20000):
+                    StyleCache.put_style_sheet("demo", (index,), "QWidget { color: red; }")
+            finally:
+                stop.set()
+                worker.join()
+            assert not errors, errors
+            StyleCache.save()
+            StyleCache.clear()
+            assert StyleCache.get_style_sheet("demo", (19999,)) == "QWidget { color: red; }"
+            print("✓ 并发保存样式包")
+        finally:
+            ThemeManager._custom_settings.clear()
+            ThemeManager._custom_settings.update(custom_settings)
+            ThemeManager._settings_version += 1
+            StyleCache.clear(remove_files=True)
+            StyleCache.set_cache_dir(None)
+        return True
+    except Exception as e:
+        print(f"✗ 样式表缓存测试失败: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
 def main():
     """主测试函数"""
     print("开始测试样式系统...")
@@ -143,7 +231,8 @@ def main():
         ("色彩系统", test_colors),
         ("排版系统", test_typography),
         ("间距系统", test_spacing),
-        ("主题管理器", test_theme)
+        ("主题管理器", test_theme),
+        ("样式表缓存", test_style_cache)
     ]
     
     passed = 0
@@ -0,0 +1,154 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+VirtualGrid 虚拟栅格容器测试
+"""
+
+import sys
+import os
+
+# 添加项目根目录到 Python 路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+
+def test_height_index():
+    """测试行高索引"""
+    try:
+        from adw.components.layout.virtual_grid import _HeightIndex
+        print("✓ 成功导入 _HeightIndex")
+
+        heights = _HeightIndex([10, 20, 30, 40])
+        assert heights.total() == 100
+        assert heights.offset(2) == 30
+        assert heights.index_at(0) == 0
+        assert heights.index_at(9) == 0
+        assert heights.index_at(10) == 1
+        assert heights.index_at(60) == 3
+        assert heights.index_at(1000) == 3
+        print("✓ 前缀和查询测试通过")
+
+        heights.set_height(1, 5)
+        assert heights.total() == 85
+        assert heights.height(1) == 5
+        assert heights.index_at(15) == 2
+        print("✓ 行高更新测试通过")
+
+        return True
+    except Exception as e:
+        print(f"✗ 行高索引测试失败: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_virtual_grid():
+    """测试按需创建与回收行"""
+    try:
+        # 创建 QApplication
+        try:
+            from PySide6.QtWidgets import QApplication, QLabel
+        except ImportError:
+            from PyQt6.QtWidgets import QApplication, QLabel
+
+        app = QApplication.instance() or QApplication(sys.argv)
+
+        from adw.components.layout.grid import Row
+        from adw.components.layout.virtual_grid import VirtualGrid
+        print("✓ 成功导入 VirtualGrid")
+
+        created = []
+
+        def factory(index, row):
+            if row is None:
+                row = Row(gutter=8)
+                row.labels = [QLabel() for _ in range(4)]
+                for label in row.labels:
+                    row.add_col(label, span=6)
+                created.append(row)
+            for column, label in enumerate(row.labels):
+                label.setText(f"{index}-{column}")
+            return row
+
+        grid = VirtualGrid(100000, 30, factory, overscan=60)
+        grid.resize(400, 300)
+        grid.show()
+        app.processEvents()
+
+        rows = grid.visible_rows()
+        assert 0 in rows
+        assert len(rows) < 30
+        assert grid.verticalScrollBar().maximum() > 100000 * 20
+        print("✓ 只创建视口内的行")
+
+        # 滚动到末尾，Row 被复用而不是重新创建
+        for value in range(0, grid.verticalScrollBar().maximum(), 250000):
+            grid.verticalScrollBar().setValue(value)
+            app.processEvents()
+        grid.scroll_to_row(99999)
+        app.processEvents()
+        rows = grid.visible_rows()
+        assert 99999 in rows
+        assert rows[99999].labels[0].text() == "99999-0"
+        assert len(created) <= len(rows) + len(grid._pool)
+        assert len(created) < 50
+        print("✓ 滚动时复用行测试通过")
+
+        # 可见行按顺序紧密排列
+        indexes = sorted(rows)
+        for previous, current in zip(indexes, indexes[1:]):
+            assert rows[previous].geometry().bottom() + 1 == rows[current].geometry().top()
+        print("✓ 行位置测试通过")
+
+        grid.set_row_count(10)
+        app.processEvents()
+        assert max(grid.visible_rows()) == 9
+        print("✓ 修改行数测试通过")
+
+        grid.close()
+
+        # 估算行高远大于实际行高时，测量后继续创建行直到填满视口
+        tall = VirtualGrid(1000, 100, factory, overscan=20)
+        tall.resize(400, 400)
+        tall.show()
+        app.processEvents()
+        rows = tall.visible_rows()
+        bottom = max(row.geometry().bottom() for row in rows.values())
+        assert rows[min(rows)].geometry().height() < 100
+        assert bottom + 1 >= tall.viewport().height() + 20
+        print("✓ 测量后填满视口")
+        tall.close()
+        return True
+    except Exception as e:
+        print(f"✗ 虚拟栅格测试失败: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def main():
+    """主测试函数"""
+    print("开始测试 VirtualGrid 虚拟栅格容器...")
+
+    tests = [
+        ("行高索引", test_height_index),
+        ("虚拟栅格", test_virtual_grid)
+    ]
+
+    passed = 0
+    total = len(tests)
+
+    for name, test_func in tests:
+        print(f"\n测试 {name}:")
+        if test_func():
+            passed += 1
+            print(f"✓ {name} 测试通过")
+        else:
+            print(f"✗ {name} 测试失败")
+
+    print(f"\nVirtualGrid 测试完成: {passed}/{total} 通过")
+    return passed == total
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,144 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+启动预热测试
+"""
+
+import sys
+import os
+import tempfile
+
+# 添加项目根目录到 Python 路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+
+def test_style_sheet_cache():
+    """测试组件样式表缓存"""
+    try:
+        from adw.common.qt import QApplication
+        app = QApplication.instance() or QApplication(sys.argv)
+
+        from adw.components.widgets.button import Button
+        from adw.components.widgets.divider import Divider
+        from adw.styles.theme import ThemeManager, ThemeType
+        print("✓ 成功导入组件")
+
+        ThemeManager.set_theme(ThemeType.LIGHT)
+        light = Button.build_style_sheet("primary", danger=True)
+        assert light is Button.build_style_sheet("primary", danger=True)
+        assert Button(text="OK", type="primary", danger=True).styleSheet() == light
+
+        ThemeManager.set_theme(ThemeType.DARK)
+        try:
+            dark = Button.build_style_sheet("primary", danger=True)
+            assert dark != light
+            assert Divider(dashed=True).styleSheet() == Divider.build_style_sheet("horizontal", True)
+        finally:
+            ThemeManager.set_theme(ThemeType.LIGHT)
+        assert len(list(Button.get_style_variants())) == len(Button.TYPES) * 8
+        print("✓ 样式表按主题和变体缓存")
+        return True
+
+    except Exception as e:
+        print(f"✗ 样式表缓存测试失败: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_warmup():
+    """测试预热任务"""
+    try:
+        from adw.common.qt import QApplication
+        app = QApplication.instance() or QApplication(sys.argv)
+
+        import adw
+        from adw.common.warmup import get_component_names
+        from adw.components.widgets.button import Button
+        from adw.components.widgets.divider import Divider
+        from adw.styles.theme import ThemeManager, ThemeType
+        from adw.styles.icons import IconManager
+        from adw.styles.cache import StyleCache
+
+        cache_dir = tempfile.mkdtemp()
+        StyleCache.set_cache_dir(cache_dir)
+        StyleCache.clear()
+        IconManager.set_atlas(None)
+        try:
+            task = adw.warmup(theme=ThemeType.DARK, icons=["search"])
+            assert task.is_running() and not task.is_finished()
+            finished = []
+            task.finished.connect(lambda: finished.append(True))
+            task.wait()
+            assert task.is_finished() and finished == [True]
+
+            stats = task.get_stats()
+            variants = len(list(Button.get_style_variants())) + len(list(Divider.get_style_variants()))
+            assert stats['style_sheets'] == variants and stats['generated'] == variants + 1
+            assert stats['bundle'] == StyleCache.get_bundle_path()
+            assert stats['widgets'] == len(get_component_names()) and stats['icons'] == 1
+            assert stats['fonts'] > 0 and stats['colors'] > 0
+            print(f"✓ 预热完成: {stats}")
+
+            # 第一次创建按钮命中缓存
+            hits = StyleCache.get_counters()['hits']
+            Button.build_style_sheet("dashed", ghost=True)
+            assert StyleCache.get_counters()['hits'] == hits + 1
+            IconManager.flush()
+            assert not IconManager.is_pending()
+            print("✓ 样式表与图标缓存已预热")
+
+            # 不等待时在事件循环中完成
+            ThemeManager.set_theme(ThemeType.LIGHT)
+            task = adw.warmup(components=(name for name in ["divider"]), budget_ms=0.1)
+            while task.is_running():
+                app.processEvents()
+            assert task.get_stats()['widgets'] == 1
+            print("✓ 空闲时分批完成 (组件名称可以是生成器)")
+        finally:
+            ThemeManager.set_theme(ThemeType.LIGHT)
+            StyleCache.clear(remove_files=True)
+            StyleCache.set_cache_dir(None)
+
+        try:
+            adw.warmup(components=["unknown"])
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("未知组件应抛出 ValueError")
+        return True
+
+    except Exception as e:
+        print(f"✗ 预热测试失败: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def main():
+    """主测试函数"""
+    print("开始测试启动预热...")
+
+    tests = [
+        ("样式表缓存", test_style_sheet_cache),
+        ("预热任务", test_warmup)
+    ]
+
+    passed = 0
+    total = len(tests)
+
+    for name, test_func in tests:
+        print(f"\n测试 {name}:")
+        if test_func():
+            passed += 1
+            print(f"✓ {name} 测试通过")
+        else:
+            print(f"✗ {name} 测试失败")
+
+    print(f"\n启动预热测试完成: {passed}/{total} 通过")
+    return passed == total
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)